@@ -6,6 +6,7 @@ import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
 
 import src.servers.pumpfun.tools
+import src.servers.solana.chains
 from src.common.logger import setup_file_logging
 from src.servers.pumpfun.server import mcp
 
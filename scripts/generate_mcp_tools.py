@@ -105,22 +105,35 @@ def generate_adapter_method(method_info):
         return f'    async def {method_to_func_name(method_name)}(self) -> str:\n        return await self.rpc_client.post("{method_name}", [], self.rpc_url)\n\n'
 
 
+# Chain name -> (server package under src/servers, hand-written base adapter class)
+SERVERS = {
+    "ethereum": ("evm", "EvmBaseAdapter"),
+    "solana": ("solana", "SolanaBaseAdapter"),
+}
+
+
+def server_for(blockchain: str) -> tuple[str, str]:
+    try:
+        return SERVERS[blockchain]
+    except KeyError:
+        raise ValueError(
+            f"Unknown blockchain: {blockchain}. Add it to SERVERS (one of {', '.join(SERVERS)})"
+        ) from None
+
+
 def generate_adapter_file(methods_info, blockchain: str) -> str:
+    # Constructor, caching, head tracking and streaming come from the hand-written
+    # servers/<package>/common/base_adapter.py (see common/adapter.py)
+    package, base = server_for(blockchain)
     header = f'''
 """
 Auto-generated adapter class for {blockchain}-compatible blockchain.
 """
 
-from common.interfaces import RpcClient
-from common.rpc import HttpxRpcClient
-from servers.{blockchain}.common.interfaces import BlockchainAdapter
+from servers.{package}.common.base_adapter import {base}
 
 
-class {blockchain.capitalize()}Adapter(BlockchainAdapter):
-    def __init__(self, rpc_url: str, rpc_client: RpcClient = None):
-        self.rpc_url = rpc_url
-        self.rpc_client = rpc_client or HttpxRpcClient()
-
+class {blockchain.capitalize()}Adapter({base}):
 '''
     body = ""
     for method in methods_info:
@@ -213,6 +226,17 @@ def extract_methods_from_json_files(file_paths):
     return methods_info
 
 
+def is_account_options(items) -> bool:
+    """Whether anyOf items are Solana's untitled (pubkey, options object) pair."""
+    return (
+        len(items) == 2
+        and items[0].get("type") == "string"
+        and "title" not in items[0]
+        and items[1].get("type") == "object"
+        and "properties" in items[1]
+    )
+
+
 def extract_methods_from_json(data):
     """Extract method information from a parsed JSON object."""
     methods_info = []
@@ -242,8 +266,10 @@ def extract_methods_from_json(data):
                                     if "items" in params_prop:
                                         param_items = params_prop["items"]
 
-                                        # Handle anyOf case
-                                        if "anyOf" in param_items:
+                                        # Handle anyOf case: Solana's (pubkey, options) pair
+                                        if "anyOf" in param_items and is_account_options(
+                                            param_items["anyOf"]
+                                        ):
                                             default_vals = (
                                                 param_default
                                                 if isinstance(param_default, list)
@@ -288,9 +314,11 @@ def extract_methods_from_json(data):
                                                         }
                                                     )
 
-                                        # Handle oneOf case
-                                        elif "oneOf" in param_items:
-                                            one_of = param_items["oneOf"]
+                                        # Handle oneOf case, and positional anyOf lists (EVM)
+                                        elif "oneOf" in param_items or "anyOf" in param_items:
+                                            one_of = (
+                                                param_items.get("oneOf") or param_items["anyOf"]
+                                            )
                                             for idx, item in enumerate(one_of):
                                                 param_name = f"param{idx + 1}"
                                                 # If it's a primitive type with description, use param1
@@ -467,6 +495,7 @@ def extract_methods_from_json(data):
 
 
 def generate_all(openapi_file: str, out_dir: str, blockchain: str):
+    package, _ = server_for(blockchain)
     openapi_path = Path(openapi_file)
 
     if openapi_path.is_dir():
@@ -501,7 +530,7 @@ class BlockchainAdapter(ABC):
 Auto-generated client router methods for MCP.
 """
 
-from servers.{blockchain}.common.adapter_registry import registry
+from servers.{package}.common.adapter_registry import registry
 
 
 def _adapter(chain: str):
@@ -517,8 +546,8 @@ Auto-generated MCP tools for JSON-RPC methods.
 
 from mcp.types import CallToolResult
 from common.utils import _err, _ok
-import servers.{blockchain}.common.client as client
-from servers.{blockchain}.server import mcp
+import servers.{package}.common.client as client
+from servers.{package}.server import mcp
 
 ''')
 
@@ -2,7 +2,7 @@
 Auto-generated client router methods for MCP.
 """
 
-from servers.ethereum.common.adapter_registry import registry
+from servers.evm.common.adapter_registry import registry
 
 
 def _adapter(chain: str):
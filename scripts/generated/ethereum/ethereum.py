@@ -3,16 +3,10 @@
 Auto-generated adapter class for ethereum-compatible blockchain.
 """
 
-from common.interfaces import RpcClient
-from common.rpc import HttpxRpcClient
-from servers.ethereum.common.interfaces import BlockchainAdapter
+from servers.evm.common.base_adapter import EvmBaseAdapter
 
 
-class EthereumAdapter(BlockchainAdapter):
-    def __init__(self, rpc_url: str, rpc_client: RpcClient = None):
-        self.rpc_url = rpc_url
-        self.rpc_client = rpc_client or HttpxRpcClient()
-
+class EthereumAdapter(EvmBaseAdapter):
     async def eth_getbalance(self, param1, param2) -> str:
         return await self.rpc_client.post("eth_getBalance", [param1, param2], self.rpc_url)
 
@@ -4,8 +4,8 @@ Auto-generated MCP tools for JSON-RPC methods.
 
 from mcp.types import CallToolResult
 from common.utils import _err, _ok
-import servers.ethereum.common.client as client
-from servers.ethereum.server import mcp
+import servers.evm.common.client as client
+from servers.evm.server import mcp
 
 @mcp.tool(
     name="eth_getbalance",
@@ -3,9 +3,8 @@ Auto-generated MCP tools for JSON-RPC methods.
 """
 
 from mcp.types import CallToolResult
-
-import servers.solana.common.client as client
 from common.utils import _err, _ok
+import servers.solana.common.client as client
 from servers.solana.server import mcp
 
 
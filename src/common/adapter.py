@@ -0,0 +1,48 @@
+"""
+Hand-written plumbing shared by the generated chain adapters.
+
+The per-method adapter classes are produced by scripts/generate_mcp_tools.py
+and only forward calls to ``self.rpc_client``. Endpoint selection, response
+caching, head tracking and streaming live here so regenerating an adapter
+never drops them.
+"""
+
+from common.disk_cache import get_disk_cache
+from common.head import HeadTracker, register_tracker
+from common.interfaces import RpcClient
+from common.rpc import endpoint_for, get_shared_rpc_client
+
+
+class RpcAdapter:
+    """Base of the generated adapters; subclasses pick the tracker and cache classes."""
+
+    head_tracker_class: type[HeadTracker] = None
+    caching_client_class: type = None
+
+    def __init__(
+        self,
+        rpc_url: str | list[str],
+        rpc_client: RpcClient = None,
+        chain: str = None,
+        ws_url: str = None,
+    ):
+        self.chain = chain or type(self).__name__
+        self.rpc_url = endpoint_for(rpc_url)
+        self.rpc_client = rpc_client or get_shared_rpc_client()
+        self.uncached_client = self.rpc_client
+        self.head = register_tracker(self.head_tracker_class(self, self.chain, ws_url))
+        if self.cache_enabled():
+            self.rpc_client = self.caching_client_class(
+                self.rpc_client, head=self.head, disk=get_disk_cache(), namespace=self.chain
+            )
+
+    def cache_enabled(self) -> bool:
+        return False
+
+    async def post_uncached(self, method: str, params: list):
+        """Call the node directly, bypassing the response cache (used by head trackers)."""
+        return await self.uncached_client.post(method, params, self.rpc_url)
+
+    def stream(self, method: str, params: list):
+        """Iterate over the elements of an array result without buffering the response."""
+        return self.rpc_client.stream(method, params, self.rpc_url)
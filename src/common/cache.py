@@ -0,0 +1,171 @@
+"""
+Response caching for JSON-RPC clients.
+"""
+
+import json
+import time
+from collections import OrderedDict
+
+from common.disk_cache import DiskCache
+from common.interfaces import RpcClient
+from common.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Cache classes a (method, params) combination can fall into
+IMMUTABLE = "immutable"  # never changes once settled; kept until evicted by the LRU
+HEAD = "head"  # relative to the chain head; kept for a short TTL
+VOLATILE = "volatile"  # never cached
+
+
+def request_key(method: str, params: list) -> str:
+    """Canonical cache key for a JSON-RPC call, independent of dict key order."""
+    return method + ":" + json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class LruCache:
+    """Size-bounded LRU mapping with optional per-entry TTL."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> tuple[bool, object]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def set(self, key: str, value, ttl: float = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class CachingRpcClient(RpcClient):
+    """RpcClient wrapper that serves repeated calls from an in-memory cache.
+
+    Subclasses decide which calls are cacheable by overriding ``classify`` and
+    ``is_settled``. Cached results are shared between callers and must be treated
+    as read-only. With a ``disk`` cache, settled results are also persisted and
+    looked up there on a memory miss, under ``namespace`` plus the chain
+    identity the endpoint reports for ``identity_method``. The identity is
+    fetched once per endpoint, so repointing a chain's URL at another network
+    never serves the old network's entries.
+    """
+
+    # Parameterless call whose result identifies the chain an endpoint serves
+    identity_method: str = None
+
+    def __init__(
+        self,
+        inner: RpcClient,
+        max_entries: int,
+        head_ttl: float,
+        disk: DiskCache = None,
+        namespace: str = "",
+    ):
+        self.inner = inner
+        self.head_ttl = head_ttl
+        self.cache = LruCache(max_entries)
+        self.disk = disk
+        self.namespace = namespace
+        self._disk_namespaces: dict = {}
+        self._stats: dict[str, dict[str, int]] = {}
+
+    def classify(self, method: str, params: list) -> str:
+        """Return IMMUTABLE, HEAD or VOLATILE for a call."""
+        return VOLATILE
+
+    async def is_settled(self, method: str, params: list, result, endpoint: str) -> bool:
+        """Whether an IMMUTABLE-class result is final and safe to keep indefinitely."""
+        return result is not None
+
+    def persistable(self, key: str) -> bool:
+        """Whether a settled entry may be written to the disk cache."""
+        return True
+
+    async def disk_namespace(self, endpoint: str) -> str:
+        """Disk key prefix for an endpoint, or None while its chain identity is unknown."""
+        namespace = self._disk_namespaces.get(endpoint)
+        if namespace is None:
+            if self.identity_method is None:
+                namespace = self.namespace
+            else:
+                try:
+                    identity = await self.inner.post(self.identity_method, [], endpoint)
+                except Exception as e:
+                    logger.warning(f"Skipping disk cache, chain identity unavailable: {e}")
+                    return None
+                namespace = f"{self.namespace}@{identity}"
+            self._disk_namespaces[endpoint] = namespace
+        return namespace
+
+    async def post(self, method: str, params: list, endpoint: str) -> dict:
+        kind = self.classify(method, params)
+        if kind == VOLATILE:
+            return await self.inner.post(method, params, endpoint)
+
+        key = request_key(method, params)
+        stats = self._stats.setdefault(method, {"hits": 0, "misses": 0})
+        found, value = self.cache.get(key)
+        if found:
+            stats["hits"] += 1
+            logger.debug(f"Cache hit: method={method}")
+            return value
+        namespace = None
+        if kind == IMMUTABLE and self.disk is not None:
+            namespace = await self.disk_namespace(endpoint)
+        if namespace is not None:
+            found, value = await self.disk.get(f"{namespace}:{key}")
+            if found:
+                stats["hits"] += 1
+                self.cache.set(key, value)
+                return value
+
+        stats["misses"] += 1
+        result = await self.inner.post(method, params, endpoint)
+        if kind == HEAD:
+            self.cache.set(key, result, ttl=self.head_ttl)
+        elif await self.is_settled(method, params, result, endpoint):
+            self.cache.set(key, result)
+            if namespace is not None and self.persistable(key):
+                self.disk.set(f"{namespace}:{key}", result)
+        return result
+
+    def stream(self, method: str, params: list, endpoint: str):
+        # Streamed results are too large to cache; go straight to the wrapped client
+        return self.inner.stream(method, params, endpoint)
+
+    def stats(self) -> dict:
+        methods = {}
+        for method, counters in sorted(self._stats.items()):
+            total = counters["hits"] + counters["misses"]
+            methods[method] = {
+                **counters,
+                "hit_rate": round(counters["hits"] / total, 4) if total else 0.0,
+            }
+        stats = {
+            "entries": len(self.cache),
+            "max_entries": self.cache.max_entries,
+            "methods": methods,
+        }
+        if self.disk is not None:
+            stats["disk"] = self.disk.stats()
+        return stats
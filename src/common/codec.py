@@ -0,0 +1,38 @@
+"""
+JSON encoding and decoding used on the RPC hot path.
+
+orjson is used when it is installed; otherwise the stdlib json module is used.
+Both paths produce compact JSON and raise json.JSONDecodeError on bad input.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson else 0
+
+
+def dumps(obj) -> bytes:
+    """Serialize ``obj`` to compact JSON bytes."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # orjson rejects integers wider than 64 bits, e.g. decoded uint256 values
+            pass
+    return json.dumps(obj, separators=(",", ":"), default=str).encode()
+
+
+def dumps_str(obj) -> str:
+    """Serialize ``obj`` to a compact JSON string."""
+    return dumps(obj).decode()
+
+
+def loads(data: bytes | str):
+    """Parse JSON bytes or text."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
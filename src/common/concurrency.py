@@ -0,0 +1,31 @@
+"""
+Helpers for fanning out many RPC calls with bounded concurrency.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Iterable
+
+
+def chunked(items: list, size: int) -> list[list]:
+    """Split a list into consecutive chunks of at most ``size`` items."""
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+async def gather_limited(aws: Iterable[Awaitable], limit: int) -> list:
+    """Like asyncio.gather, but runs at most ``limit`` awaitables at a time.
+
+    Results keep the order of ``aws``. If one awaitable fails the others are
+    cancelled and the error is raised.
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(aw):
+        async with semaphore:
+            return await aw
+
+    tasks = [asyncio.ensure_future(run(aw)) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
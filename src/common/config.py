@@ -5,6 +5,14 @@ from dotenv import load_dotenv
 load_dotenv(override=True)
 
 
+def _flag(value: str) -> bool:
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _csv(value: str) -> list[str]:
+    return [url.strip() for url in value.split(",") if url.strip()]
+
+
 class Settings:
     def __init__(self):
         # Set default RPC URLs
@@ -33,6 +41,114 @@ class Settings:
             "https://solana-mainnet.core.chainstack.com/c1f70bbc35644bd95ae98c944984230a",
         )
 
+        # Each *_RPC_URL may list several comma-separated endpoints for failover
+        self.ARBITRUM_RPC_URLS = _csv(self.ARBITRUM_RPC_URL)
+        self.BASE_RPC_URLS = _csv(self.BASE_RPC_URL)
+        self.BINANCE_SMART_CHAIN_RPC_URLS = _csv(self.BINANCE_SMART_CHAIN_RPC_URL)
+        self.ETHEREUM_RPC_URLS = _csv(self.ETHEREUM_RPC_URL)
+        self.SONIC_RPC_URLS = _csv(self.SONIC_RPC_URL)
+        self.SOLANA_RPC_URLS = _csv(self.SOLANA_RPC_URL)
+        self.RPC_ENDPOINT_COOLDOWN = float(os.getenv("RPC_ENDPOINT_COOLDOWN") or "30")
+        self.RPC_ENDPOINT_EWMA_ALPHA = float(os.getenv("RPC_ENDPOINT_EWMA_ALPHA") or "0.3")
+
+        # Hedging of slow read-only calls when several endpoints are configured
+        self.RPC_HEDGING = _flag(os.getenv("RPC_HEDGING", ""))
+        self.RPC_HEDGE_METHODS = set(
+            _csv(
+                os.getenv("RPC_HEDGE_METHODS")
+                or "eth_call,eth_getBalance,eth_getCode,eth_getStorageAt,eth_getTransactionCount,"
+                "eth_getTransactionByHash,eth_getTransactionReceipt,eth_getBlockByNumber,"
+                "getAccountInfo,getMultipleAccounts,getBalance,getTokenAccountBalance,"
+                "getTransaction,getSignatureStatuses"
+            )
+        )
+        self.RPC_HEDGE_PERCENTILE = float(os.getenv("RPC_HEDGE_PERCENTILE") or "95")
+        self.RPC_HEDGE_MIN_DELAY = float(os.getenv("RPC_HEDGE_MIN_DELAY") or "0.05")
+        self.RPC_HEDGE_DEFAULT_DELAY = float(os.getenv("RPC_HEDGE_DEFAULT_DELAY") or "0.5")
+        self.RPC_HEDGE_BUDGET = float(os.getenv("RPC_HEDGE_BUDGET") or "0.1")
+
+        # Connection pooling for JSON-RPC endpoints
+        self.RPC_TIMEOUT = float(os.getenv("RPC_TIMEOUT") or "120")
+        self.RPC_MAX_CONNECTIONS = int(os.getenv("RPC_MAX_CONNECTIONS") or "100")
+        self.RPC_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("RPC_MAX_KEEPALIVE_CONNECTIONS") or "20")
+        self.RPC_KEEPALIVE_EXPIRY = float(os.getenv("RPC_KEEPALIVE_EXPIRY") or "30")
+
+        # Per-chain JSON-RPC batching (calls within the window share one HTTP request)
+        self.ARBITRUM_RPC_BATCHING = _flag(os.getenv("ARBITRUM_RPC_BATCHING", ""))
+        self.BASE_RPC_BATCHING = _flag(os.getenv("BASE_RPC_BATCHING", ""))
+        self.BINANCE_SMART_CHAIN_RPC_BATCHING = _flag(
+            os.getenv("BINANCE_SMART_CHAIN_RPC_BATCHING", "")
+        )
+        self.ETHEREUM_RPC_BATCHING = _flag(os.getenv("ETHEREUM_RPC_BATCHING", ""))
+        self.SONIC_RPC_BATCHING = _flag(os.getenv("SONIC_RPC_BATCHING", ""))
+        self.SOLANA_RPC_BATCHING = _flag(os.getenv("SOLANA_RPC_BATCHING", ""))
+        self.RPC_BATCH_WINDOW_MS = float(os.getenv("RPC_BATCH_WINDOW_MS") or "2")
+        self.RPC_MAX_BATCH_SIZE = int(os.getenv("RPC_MAX_BATCH_SIZE") or "50")
+
+        # Finality-aware response cache in front of EVM adapters
+        self.EVM_CACHE_ENABLED = _flag(os.getenv("EVM_CACHE_ENABLED", "true"))
+        self.EVM_CACHE_MAX_ENTRIES = int(os.getenv("EVM_CACHE_MAX_ENTRIES") or "2048")
+        self.EVM_CACHE_HEAD_TTL = float(os.getenv("EVM_CACHE_HEAD_TTL") or "1")
+        self.EVM_CACHE_CONFIRMATIONS = int(os.getenv("EVM_CACHE_CONFIRMATIONS") or "64")
+        self.EVM_CACHE_NEAR_HEAD = _flag(os.getenv("EVM_CACHE_NEAR_HEAD", "true"))
+        self.EVM_REORG_WINDOW = int(os.getenv("EVM_REORG_WINDOW") or "256")
+
+        # Persistent SQLite cache for immutable results, shared by all chains; off when unset
+        self.DISK_CACHE_PATH = os.getenv("DISK_CACHE_PATH", "")
+        self.DISK_CACHE_MAX_MB = float(os.getenv("DISK_CACHE_MAX_MB") or "512")
+
+        # web3_sha3 is hashed locally unless the node should compute it
+        self.WEB3_SHA3_REMOTE = _flag(os.getenv("WEB3_SHA3_REMOTE", ""))
+
+        # Directory of ABI JSON files used by decode=true on EVM log and call tools
+        self.EVM_ABI_DIR = os.getenv("EVM_ABI_DIR", "")
+
+        # Block-range splitting for eth_getLogs
+        self.EVM_LOGS_WINDOW = int(os.getenv("EVM_LOGS_WINDOW") or "2000")
+        self.EVM_LOGS_MAX_WINDOW = int(os.getenv("EVM_LOGS_MAX_WINDOW") or "50000")
+        self.EVM_LOGS_CONCURRENCY = int(os.getenv("EVM_LOGS_CONCURRENCY") or "4")
+        self.EVM_LOGS_MAX_SPAN = int(os.getenv("EVM_LOGS_MAX_SPAN") or "1000000")
+        self.EVM_LOGS_MAX_RESULTS = int(os.getenv("EVM_LOGS_MAX_RESULTS") or "10000")
+
+        # Multicall3 aggregation of eth_call requests
+        self.MULTICALL3_ADDRESS = (
+            os.getenv("MULTICALL3_ADDRESS") or "0xcA11bde05977b3631167028862bE2a173976CA11"
+        )
+        # Empty uses the built-in aggregate3 runtime; "0x" disables the state override
+        self.MULTICALL3_BYTECODE = os.getenv("MULTICALL3_BYTECODE", "")
+        self.MULTICALL_MAX_CALLS = int(os.getenv("MULTICALL_MAX_CALLS") or "100")
+        self.MULTICALL_MAX_CALLDATA = int(os.getenv("MULTICALL_MAX_CALLDATA") or "65536")
+        self.MULTICALL_MAX_GAS = int(os.getenv("MULTICALL_MAX_GAS") or "20000000")
+        self.MULTICALL_CALL_GAS = int(os.getenv("MULTICALL_CALL_GAS") or "100000")
+        self.MULTICALL_CONCURRENCY = int(os.getenv("MULTICALL_CONCURRENCY") or "4")
+
+        # Parallel requests used when a Solana call is split into several
+        self.SOLANA_RPC_CONCURRENCY = int(os.getenv("SOLANA_RPC_CONCURRENCY") or "8")
+        self.SOLANA_SIGNATURES_PREFETCH = int(os.getenv("SOLANA_SIGNATURES_PREFETCH") or "2")
+
+        # Finality-aware response cache in front of the Solana adapter
+        self.SOLANA_CACHE_ENABLED = _flag(os.getenv("SOLANA_CACHE_ENABLED", "true"))
+        self.SOLANA_CACHE_MAX_ENTRIES = int(os.getenv("SOLANA_CACHE_MAX_ENTRIES") or "2048")
+        self.SOLANA_CACHE_HEAD_TTL = float(os.getenv("SOLANA_CACHE_HEAD_TTL") or "1")
+
+        # Memoized Pump.fun bonding curve address derivations
+        self.PUMPFUN_PDA_CACHE_SIZE = int(os.getenv("PUMPFUN_PDA_CACHE_SIZE") or "65536")
+
+        # Background chain-head trackers; *_WS_URL enables push updates via websockets
+        self.HEAD_TRACKING = _flag(os.getenv("HEAD_TRACKING", "true"))
+        self.HEAD_POLL_INTERVAL = float(os.getenv("HEAD_POLL_INTERVAL") or "2")
+        self.HEAD_MAX_STALENESS = float(os.getenv("HEAD_MAX_STALENESS") or "10")
+        self.HEAD_IDLE_TIMEOUT = float(os.getenv("HEAD_IDLE_TIMEOUT") or "300")
+        self.ARBITRUM_WS_URL = os.getenv("ARBITRUM_WS_URL", "")
+        self.BASE_WS_URL = os.getenv("BASE_WS_URL", "")
+        self.BINANCE_SMART_CHAIN_WS_URL = os.getenv("BINANCE_SMART_CHAIN_WS_URL", "")
+        self.ETHEREUM_WS_URL = os.getenv("ETHEREUM_WS_URL", "")
+        self.SONIC_WS_URL = os.getenv("SONIC_WS_URL", "")
+        self.SOLANA_WS_URL = os.getenv("SOLANA_WS_URL", "")
+
+        # Attach MCP structured content to tool results (needs an SDK that supports it)
+        self.MCP_STRUCTURED_OUTPUT = _flag(os.getenv("MCP_STRUCTURED_OUTPUT", ""))
+
         for key, value in os.environ.items():
             if not hasattr(self, key):
                 setattr(self, key, value)
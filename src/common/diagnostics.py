@@ -0,0 +1,24 @@
+"""
+Runtime statistics of a chain adapter, shared by the per-server diagnostics tools.
+"""
+
+from common.cache import CachingRpcClient
+from common.rpc import EndpointSelector
+
+
+def cache_stats(adapter) -> dict:
+    if not isinstance(adapter.rpc_client, CachingRpcClient):
+        raise ValueError(f"Response cache is disabled for {adapter.chain}")
+    return adapter.rpc_client.stats()
+
+
+def endpoint_stats(adapter) -> dict:
+    if not isinstance(adapter.rpc_url, EndpointSelector):
+        raise ValueError(f"Only one RPC endpoint is configured for {adapter.chain}")
+    return adapter.rpc_url.stats()
+
+
+def chain_head(adapter) -> dict:
+    """Tracked head state; reading it starts the tracker if it is not running."""
+    adapter.head.touch()
+    return adapter.head.snapshot()
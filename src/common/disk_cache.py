@@ -0,0 +1,209 @@
+"""
+Persistent second-level cache for immutable JSON-RPC results.
+
+Entries live in a single SQLite database in WAL mode with one transaction per
+write, so a crash never leaves a half-written entry behind and several server
+processes can share one file. Keys are the in-memory cache keys prefixed with
+the chain identity. When the stored payload grows past the size cap, the least
+recently used entries are deleted until it is back under the low-water mark.
+Hits on entries written by an earlier process are counted separately as
+warm-start hits.
+
+All database work runs on one worker thread so a slow disk never blocks the
+event loop: reads are awaited, writes are queued without waiting, and access
+times of hits are batched into the next write. Any SQLite error is logged and
+treated as a miss, so the caller falls through to the network.
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from common.config import settings
+from common.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Compaction trims the database down to this fraction of the size cap
+LOW_WATER = 0.9
+
+# Access times of hits are written once this many are pending
+TOUCH_BATCH = 256
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+"""
+
+_disk_cache: "DiskCache" = None
+
+
+class DiskCache:
+    """Size-capped LRU store of JSON values in SQLite."""
+
+    def __init__(self, path: str, max_bytes: int):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="disk-cache")
+        # Only the worker thread touches the connection after this point
+        self._db = sqlite3.connect(path, timeout=5, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+        self._size, self._entries = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0), COUNT(*) FROM entries"
+        ).fetchone()
+        self._touched: dict[str, float] = {}
+        self._started_at = time.time()
+        self._stats = {
+            "hits": 0,
+            "warm_hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "evictions": 0,
+            "errors": 0,
+        }
+
+    async def get(self, key: str) -> tuple[bool, object]:
+        try:
+            future = self._executor.submit(self._read, key)
+            return await asyncio.wrap_future(future)
+        except Exception as e:
+            self._failed("read", e)
+            return False, None
+
+    def set(self, key: str, value) -> None:
+        """Queue a write; it happens on the worker thread without being awaited."""
+        self._executor.submit(self._guarded, "write", self._write, key, value)
+
+    def checkpoint(self) -> None:
+        """Flush pending access times and fold the write-ahead log into the database file."""
+        self._executor.submit(self._guarded, "checkpoint", self._checkpoint).result()
+
+    def _failed(self, action: str, error: Exception) -> None:
+        self._stats["errors"] += 1
+        logger.warning(f"Disk cache {action} failed: {error}")
+
+    def _guarded(self, action: str, fn, *args) -> None:
+        try:
+            fn(*args)
+        except Exception as e:
+            self._failed(action, e)
+
+    def _read(self, key: str) -> tuple[bool, object]:
+        row = self._db.execute(
+            "SELECT value, created FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self._stats["misses"] += 1
+            return False, None
+        value, created = row
+        self._stats["hits"] += 1
+        if created < self._started_at:
+            self._stats["warm_hits"] += 1
+        self._touched[key] = time.time()
+        if len(self._touched) >= TOUCH_BATCH:
+            self._flush_touched()
+        return True, json.loads(value)
+
+    def _flush_touched(self) -> None:
+        touched, self._touched = self._touched, {}
+        self._db.execute("BEGIN")
+        try:
+            self._db.executemany(
+                "UPDATE entries SET accessed = ? WHERE key = ?",
+                [(accessed, key) for key, accessed in touched.items()],
+            )
+            self._db.execute("COMMIT")
+        except Exception:
+            self._db.execute("ROLLBACK")
+            raise
+
+    def _write(self, key: str, value) -> None:
+        payload = json.dumps(value, separators=(",", ":"))
+        size = len(payload)
+        if size > self.max_bytes * (1 - LOW_WATER):
+            return  # a single entry this large would evict most of the cache
+        if self._touched:
+            self._flush_touched()
+        now = time.time()
+        old = self._db.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+        self._db.execute(
+            "INSERT OR REPLACE INTO entries (key, value, size, created, accessed) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (key, payload, size, now, now),
+        )
+        self._size += size - (old[0] if old else 0)
+        self._entries += 0 if old else 1
+        self._stats["writes"] += 1
+        if self._size > self.max_bytes:
+            self.compact()
+
+    def compact(self) -> None:
+        """Delete least recently used entries until under the low-water mark."""
+        # Other processes may write to the same file; start from the real size
+        self._size = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        target = self.max_bytes * LOW_WATER
+        rows = self._db.execute("SELECT key, size FROM entries ORDER BY accessed")
+        doomed = []
+        for key, size in rows:
+            if self._size <= target:
+                break
+            doomed.append((key,))
+            self._size -= size
+        rows.close()
+        self._db.execute("BEGIN")
+        try:
+            self._db.executemany("DELETE FROM entries WHERE key = ?", doomed)
+            self._db.execute("COMMIT")
+        except Exception:
+            self._db.execute("ROLLBACK")
+            raise
+        self._entries = self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        self._stats["evictions"] += len(doomed)
+        logger.debug(f"Disk cache compacted: {len(doomed)} entries evicted")
+
+    def _checkpoint(self) -> None:
+        if self._touched:
+            self._flush_touched()
+        self._db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def stats(self) -> dict:
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+            "entries": self._entries,
+            "bytes": self._size,
+            "max_bytes": self.max_bytes,
+            "path": self.path,
+        }
+
+
+def get_disk_cache() -> DiskCache:
+    """Return the process-wide disk cache, or None when DISK_CACHE_PATH is unset or unusable."""
+    global _disk_cache
+    if _disk_cache is None and settings.DISK_CACHE_PATH:
+        try:
+            _disk_cache = DiskCache(
+                settings.DISK_CACHE_PATH, int(settings.DISK_CACHE_MAX_MB * 1024 * 1024)
+            )
+        except Exception as e:
+            logger.warning(f"Disk cache disabled, cannot open {settings.DISK_CACHE_PATH}: {e}")
+    return _disk_cache
+
+
+def checkpoint_disk_cache() -> None:
+    if _disk_cache is not None:
+        _disk_cache.checkpoint()
@@ -0,0 +1,173 @@
+"""
+Background chain-head tracking.
+
+A HeadTracker keeps the latest head state of one chain in memory so that tools
+and caches can read it without a network round trip. It polls over HTTP on a
+fixed interval and, when a WebSocket URL is configured and the optional
+``websockets`` package is installed, also applies pushed head notifications
+between polls. Trackers register themselves here. A tracker starts on the first
+read of its head state and stops again once nothing has read it for
+``HEAD_IDLE_TIMEOUT`` seconds, so idle chains cost nothing; the server lifespan
+stops any that are still running. Trackers poll the node directly rather than
+through the response cache.
+"""
+
+import asyncio
+import json
+import time
+from abc import ABC, abstractmethod
+
+from common.config import settings
+from common.logger import get_logger
+
+try:
+    import websockets
+except ImportError:  # pragma: no cover - optional dependency
+    websockets = None
+
+logger = get_logger(__name__)
+
+_trackers: list["HeadTracker"] = []
+
+
+class HeadTracker(ABC):
+    """Polls and caches the head of one chain. Subclasses implement ``poll``."""
+
+    # JSON-RPC subscription used when a WebSocket URL is configured
+    subscribe_method: str = None
+    subscribe_params: list = []
+
+    def __init__(self, name: str, ws_url: str = None, interval: float = None):
+        self.name = name
+        self.ws_url = ws_url or None
+        self.interval = interval or settings.HEAD_POLL_INTERVAL
+        self.state: dict = {}
+        self.updated_at: float = None
+        self.errors = 0
+        self.last_used: float = None
+        self._tasks: list[asyncio.Task] = []
+
+    @abstractmethod
+    async def poll(self) -> dict:
+        """Fetch the current head over HTTP and return the new state fields."""
+
+    def on_notification(self, result) -> dict:
+        """Turn a subscription notification into state fields (may be a coroutine)."""
+        return {}
+
+    def on_stop(self) -> None:
+        """Called when the tracker stops; heads seen before are no longer being watched."""
+        return None
+
+    def update(self, fields: dict) -> None:
+        self.state.update(fields)
+        self.updated_at = time.monotonic()
+
+    def staleness(self) -> float:
+        """Seconds since the last update, or None if no head has been seen."""
+        return time.monotonic() - self.updated_at if self.updated_at is not None else None
+
+    def touch(self) -> None:
+        """Mark the head state as in use, starting the tracker if it is not running."""
+        self.last_used = time.monotonic()
+        if settings.HEAD_TRACKING and not self.running():
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return
+            self.start()
+
+    def idle(self) -> bool:
+        return (
+            self.last_used is None or time.monotonic() - self.last_used > settings.HEAD_IDLE_TIMEOUT
+        )
+
+    def running(self) -> bool:
+        return any(not task.done() for task in self._tasks)
+
+    def fresh(self) -> dict:
+        """The head state if it is recent enough to rely on, otherwise None."""
+        self.touch()
+        staleness = self.staleness()
+        if staleness is None or staleness > settings.HEAD_MAX_STALENESS:
+            return None
+        return self.state
+
+    def snapshot(self) -> dict:
+        staleness = self.staleness()
+        return {
+            **self.state,
+            "staleness_s": round(staleness, 3) if staleness is not None else None,
+            "running": self.running(),
+            "websocket": bool(self.ws_url and websockets),
+            "errors": self.errors,
+        }
+
+    def start(self) -> None:
+        if self.running():
+            return
+        logger.debug(f"Starting head tracker for {self.name}")
+        self._tasks = [asyncio.ensure_future(self._poll_loop())]
+        if self.ws_url and self.subscribe_method:
+            if websockets is None:
+                logger.warning(f"websockets is not installed; polling {self.name} head only")
+            else:
+                self._tasks.append(asyncio.ensure_future(self._subscribe_loop()))
+
+    async def stop(self) -> None:
+        running = self.running()
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if running:
+            self.on_stop()
+
+    async def _poll_loop(self) -> None:
+        while not self.idle():
+            try:
+                self.update(await self.poll())
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"Head poll failed for {self.name}: {e}")
+            await asyncio.sleep(self.interval)
+        logger.debug(f"Stopping idle head tracker for {self.name}")
+        for task in self._tasks:
+            if task is not asyncio.current_task():
+                task.cancel()
+        self.on_stop()
+
+    async def _subscribe_loop(self) -> None:
+        request = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": self.subscribe_method,
+            "params": self.subscribe_params,
+        }
+        while True:
+            try:
+                async with websockets.connect(self.ws_url) as ws:
+                    await ws.send(json.dumps(request))
+                    async for message in ws:
+                        params = json.loads(message).get("params")
+                        if isinstance(params, dict) and "result" in params:
+                            fields = self.on_notification(params["result"])
+                            if asyncio.iscoroutine(fields):
+                                fields = await fields
+                            self.update(fields)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"Head subscription failed for {self.name}: {e}")
+            await asyncio.sleep(self.interval)
+
+
+def register_tracker(tracker: HeadTracker) -> HeadTracker:
+    _trackers.append(tracker)
+    return tracker
+
+
+async def stop_trackers() -> None:
+    for tracker in _trackers:
+        await tracker.stop()
@@ -1,7 +1,18 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
 
 class RpcClient(ABC):
     @abstractmethod
     async def post(self, method: str, params: list, endpoint: str) -> dict:
         pass
+
+    async def stream(self, method: str, params: list, endpoint: str) -> AsyncIterator:
+        """Yield the elements of an array result one by one.
+
+        The default implementation buffers the whole response; clients that can
+        parse the body incrementally override it.
+        """
+        result = await self.post(method, params, endpoint)
+        for item in result if isinstance(result, list) else [result]:
+            yield item
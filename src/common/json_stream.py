@@ -0,0 +1,148 @@
+"""
+Incremental parser for large JSON-RPC responses.
+
+``JsonResultStream`` is fed the response body chunk by chunk and hands back the
+elements of the top-level ``result`` array as soon as each one is complete, so
+memory stays proportional to one element rather than to the whole body.
+"""
+
+import codecs
+import json
+import re
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+_NUMBER_END = frozenset(",]} \t\n\r")
+
+# Drop consumed text from the buffer once it grows past this many characters
+_COMPACT_THRESHOLD = 1 << 16
+
+
+class JsonResultStream:
+    """Yields elements of ``result`` from a streamed JSON-RPC response object.
+
+    If ``result`` is not an array it is produced as a single element. A JSON-RPC
+    ``error`` member raises ValueError as soon as it has been read.
+    """
+
+    def __init__(self):
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._state = "start"
+        self._key = None
+        self._retry_len = 0
+        self._eof = False
+
+    def feed(self, chunk: bytes) -> list:
+        """Add a chunk of the body and return the elements completed by it."""
+        self._buf += self._text.decode(chunk)
+        if len(self._buf) < self._retry_len:
+            return []
+        return self._parse()
+
+    def close(self) -> list:
+        """Signal the end of the body and return any remaining elements."""
+        self._buf += self._text.decode(b"", final=True)
+        self._eof = True
+        items = self._parse()
+        if self._state != "done":
+            raise ValueError("Truncated JSON-RPC response")
+        return items
+
+    def _parse(self) -> list:
+        items = []
+        while self._state != "done":
+            self._skip_whitespace()
+            if self._pos >= len(self._buf):
+                break
+            char = self._buf[self._pos]
+
+            if self._state == "start":
+                if char != "{":
+                    raise ValueError("JSON-RPC response is not an object")
+                self._pos += 1
+                self._state = "key"
+            elif self._state == "key":
+                if char == "}":
+                    self._pos += 1
+                    self._state = "done"
+                elif char == ",":
+                    self._pos += 1
+                else:
+                    start = self._pos
+                    found, key = self._decode()
+                    if not found:
+                        break
+                    self._skip_whitespace()
+                    if self._pos >= len(self._buf):
+                        # Re-read the key once the ':' separator has arrived
+                        self._pos = start
+                        break
+                    if self._buf[self._pos] != ":":
+                        raise ValueError("Malformed JSON-RPC response")
+                    self._pos += 1
+                    self._key = key
+                    self._state = "result" if key == "result" else "member"
+            elif self._state == "result" and char == "[":
+                self._pos += 1
+                self._state = "array"
+            elif self._state in ("result", "member"):
+                found, value = self._decode()
+                if not found:
+                    break
+                if self._state == "result":
+                    items.append(value)
+                elif self._key == "error":
+                    self._raise_rpc_error(value)
+                self._state = "key"
+            elif self._state == "array":
+                if char == "]":
+                    self._pos += 1
+                    self._state = "key"
+                elif char == ",":
+                    self._pos += 1
+                else:
+                    found, value = self._decode()
+                    if not found:
+                        break
+                    items.append(value)
+
+        if self._pos > _COMPACT_THRESHOLD:
+            self._buf = self._buf[self._pos :]
+            self._pos = 0
+        return items
+
+    def _skip_whitespace(self) -> None:
+        self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+
+    def _decode(self) -> tuple[bool, object]:
+        """Decode the value at the cursor, or report that more data is needed."""
+        try:
+            value, end = _DECODER.raw_decode(self._buf, self._pos)
+        except json.JSONDecodeError:
+            if self._eof:
+                raise
+            # Wait until the pending text has doubled before retrying, which keeps
+            # re-parsing of a large value linear in its size
+            self._retry_len = len(self._buf) + max(len(self._buf) - self._pos, 1)
+            return False, None
+        if (
+            not self._eof
+            and isinstance(value, (int, float))
+            and not isinstance(value, bool)
+            and (end == len(self._buf) or self._buf[end] not in _NUMBER_END)
+        ):
+            # A number is only complete once a delimiter follows it: "1." or "1.5e"
+            # at the end of a chunk decode as a shorter number
+            self._retry_len = len(self._buf) + 1
+            return False, None
+        self._pos = end
+        self._retry_len = 0
+        return True, value
+
+    @staticmethod
+    def _raise_rpc_error(error: dict) -> None:
+        message = error.get("message", "Unknown RPC error")
+        code = error.get("code", -1)
+        raise ValueError(f"RPC Error ({code}): {message}")
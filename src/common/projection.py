@@ -0,0 +1,41 @@
+"""
+Field selection for large JSON-RPC results.
+
+A projection is a comma separated list of dotted paths such as
+``"hash,timestamp,transactions.hash,transactions.from"``. Paths descend into
+objects by key and apply to every element of an array, so the example keeps
+two fields of each transaction. Results are copied rather than modified since
+they may be shared with the response cache.
+"""
+
+
+def parse_fields(fields: str) -> dict:
+    """Turn a projection into a tree of selected keys; an empty subtree selects everything."""
+    tree: dict = {}
+    for path in (fields or "").split(","):
+        path = path.strip()
+        if not path:
+            continue
+        node = tree
+        parts = path.split(".")
+        if not all(parts):
+            raise ValueError(f"Invalid field path: {path}")
+        for i, part in enumerate(parts):
+            if part in node and not node[part]:
+                break  # an ancestor is already selected whole
+            if i == len(parts) - 1:
+                node[part] = {}
+            else:
+                node = node.setdefault(part, {})
+    return tree
+
+
+def project(value, tree: dict):
+    """Keep only the selected paths of ``value``."""
+    if not tree:
+        return value
+    if isinstance(value, list):
+        return [project(item, tree) for item in value]
+    if isinstance(value, dict):
+        return {key: project(value[key], sub) for key, sub in tree.items() if key in value}
+    return value  # scalars have no fields to select from
@@ -2,20 +2,267 @@
 Shared JSON-RPC helper to reduce duplication across blockchain adapters.
 """
 
+import asyncio
+import itertools
 import json
 import logging
 import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 import httpx
 
+from common import codec
+from common.cache import request_key
+from common.config import settings
+from common.disk_cache import checkpoint_disk_cache
+from common.head import stop_trackers
 from common.interfaces import RpcClient
+from common.json_stream import JsonResultStream
 from common.logger import get_logger
 
 logger = get_logger(__name__)
 
+# HTTP statuses that mean "try another endpoint" rather than "the call failed"
+FAILOVER_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class EndpointSelector:
+    """Latency-aware choice between several endpoints serving the same chain.
+
+    Tracks an EWMA of latency and error rate per endpoint and routes each request
+    to the fastest healthy one. Endpoints that fail with a connection error or an
+    HTTP 429/5xx are ejected for a cool-down period. A selector can be passed to
+    HttpxRpcClient anywhere an endpoint URL is expected.
+    """
+
+    def __init__(
+        self,
+        urls: list[str],
+        alpha: float = None,
+        cooldown: float = None,
+    ):
+        if not urls:
+            raise ValueError("EndpointSelector requires at least one URL")
+        self.urls = list(urls)
+        self.alpha = alpha or settings.RPC_ENDPOINT_EWMA_ALPHA
+        self.cooldown = cooldown if cooldown is not None else settings.RPC_ENDPOINT_COOLDOWN
+        self._stats = {
+            url: {
+                "latency": None,
+                "error_rate": 0.0,
+                "requests": 0,
+                "failures": 0,
+                "selected": 0,
+                "ejected_until": 0.0,
+            }
+            for url in self.urls
+        }
+
+    def __len__(self) -> int:
+        return len(self.urls)
+
+    def __str__(self) -> str:
+        return f"[{', '.join(self.label(url) for url in self.urls)}]"
+
+    def label(self, url: str) -> str:
+        """Short name for an endpoint that does not leak its access token."""
+        return f"#{self.urls.index(url)} {httpx.URL(url).host}"
+
+    def _score(self, url: str) -> float:
+        stats = self._stats[url]
+        if stats["latency"] is None:
+            return 0.0  # try unmeasured endpoints first
+        return stats["latency"] * (1 + 10 * stats["error_rate"])
+
+    def select(self, exclude: set = frozenset()) -> str:
+        now = time.monotonic()
+        candidates = [url for url in self.urls if url not in exclude]
+        healthy = [url for url in candidates if self._stats[url]["ejected_until"] <= now]
+        if healthy:
+            url = min(healthy, key=self._score)
+        else:
+            # Everything is cooling down: use the endpoint that comes back first
+            url = min(candidates, key=lambda u: self._stats[u]["ejected_until"])
+        self._stats[url]["selected"] += 1
+        logger.debug(f"Selected endpoint {self.label(url)} (score={self._score(url):.3f})")
+        return url
+
+    def record_success(self, url: str, latency: float) -> None:
+        stats = self._stats[url]
+        stats["requests"] += 1
+        stats["error_rate"] *= 1 - self.alpha
+        if stats["latency"] is None:
+            stats["latency"] = latency
+        else:
+            stats["latency"] += self.alpha * (latency - stats["latency"])
+
+    def record_failure(self, url: str) -> None:
+        stats = self._stats[url]
+        stats["requests"] += 1
+        stats["failures"] += 1
+        stats["error_rate"] += self.alpha * (1 - stats["error_rate"])
+        stats["ejected_until"] = time.monotonic() + self.cooldown
+        logger.warning(f"Ejected endpoint {self.label(url)} for {self.cooldown:.0f}s")
+
+    def stats(self) -> list[dict]:
+        now = time.monotonic()
+        return [
+            {
+                "endpoint": self.label(url),
+                "ewma_latency_ms": (
+                    round(stats["latency"] * 1000, 1) if stats["latency"] is not None else None
+                ),
+                "ewma_error_rate": round(stats["error_rate"], 4),
+                "requests": stats["requests"],
+                "failures": stats["failures"],
+                "selected": stats["selected"],
+                "healthy": stats["ejected_until"] <= now,
+            }
+            for url, stats in self._stats.items()
+        ]
+
+
+class HedgePolicy:
+    """Decides when a slow read-only request is duplicated to a second endpoint.
+
+    The hedge delay is a percentile of recently observed latencies for the method,
+    and a per-method token bucket caps hedges to ``budget`` (a fraction) of the
+    requests so that hedging cannot multiply upstream load.
+    """
+
+    def __init__(
+        self,
+        methods: set[str] = None,
+        percentile: float = None,
+        min_delay: float = None,
+        default_delay: float = None,
+        budget: float = None,
+        window: int = 200,
+    ):
+        self.methods = methods if methods is not None else settings.RPC_HEDGE_METHODS
+        self.percentile = percentile or settings.RPC_HEDGE_PERCENTILE
+        self.min_delay = min_delay if min_delay is not None else settings.RPC_HEDGE_MIN_DELAY
+        self.default_delay = default_delay or settings.RPC_HEDGE_DEFAULT_DELAY
+        self.budget = budget if budget is not None else settings.RPC_HEDGE_BUDGET
+        self.window = window
+        self._latencies: dict[str, deque] = {}
+        self._tokens: dict[str, float] = {}
+
+    def applies(self, method: str) -> bool:
+        return method in self.methods
+
+    def record_latency(self, method: str, latency: float) -> None:
+        samples = self._latencies.setdefault(method, deque(maxlen=self.window))
+        samples.append(latency)
+        # Every request earns a fraction of a hedge, capped to avoid bursts
+        self._tokens[method] = min(self._tokens.get(method, 0.0) + self.budget, 10.0)
+
+    def delay(self, method: str) -> float:
+        samples = self._latencies.get(method)
+        if not samples or len(samples) < 20:
+            return self.default_delay
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+        return max(self.min_delay, ordered[index])
+
+    def try_acquire(self, method: str) -> bool:
+        tokens = self._tokens.get(method, 0.0)
+        if tokens < 1:
+            logger.debug(f"Hedge budget exhausted for {method}")
+            return False
+        self._tokens[method] = tokens - 1
+        return True
+
+
+def endpoint_for(urls):
+    """Return a plain URL for a single endpoint or an EndpointSelector for several."""
+    if isinstance(urls, (str, EndpointSelector)):
+        return urls
+    if not urls:
+        raise ValueError("No RPC endpoint configured")
+    if len(urls) == 1:
+        return urls[0]
+    return EndpointSelector(urls)
+
 
 class HttpxRpcClient(RpcClient):
+    """JSON-RPC client that keeps a long-lived httpx connection pool per endpoint.
+
+    Pools are created lazily on first use and reused by every call to the same
+    endpoint, so DNS, TCP and TLS setup is paid once rather than per request.
+    Concurrent identical calls (same endpoint, method and params) are coalesced
+    into a single upstream request whose result or error is shared by all callers.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = None,
+        max_keepalive_connections: int = None,
+        keepalive_expiry: float = None,
+        timeout: float = None,
+        hedge_policy: HedgePolicy = None,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections or settings.RPC_MAX_CONNECTIONS,
+            max_keepalive_connections=(
+                max_keepalive_connections or settings.RPC_MAX_KEEPALIVE_CONNECTIONS
+            ),
+            keepalive_expiry=keepalive_expiry or settings.RPC_KEEPALIVE_EXPIRY,
+        )
+        self.timeout = timeout or settings.RPC_TIMEOUT
+        if hedge_policy is None and settings.RPC_HEDGING:
+            hedge_policy = HedgePolicy()
+        self.hedge_policy = hedge_policy
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._inflight: dict[tuple[str, str], asyncio.Future] = {}
+        self._loop = None
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Pools and in-flight futures are bound to the event loop that created them
+            self._clients = {}
+            self._inflight = {}
+            self._loop = loop
+
+    def _client_for(self, endpoint: str) -> httpx.AsyncClient:
+        self._bind_loop()
+        client = self._clients.get(endpoint)
+        if client is None or client.is_closed:
+            logger.debug(f"Opening connection pool for {endpoint}")
+            client = httpx.AsyncClient(timeout=self.timeout, limits=self.limits)
+            self._clients[endpoint] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close every pooled connection held by this client."""
+        clients, self._clients = self._clients, {}
+        for endpoint, client in clients.items():
+            logger.debug(f"Closing connection pool for {endpoint}")
+            await client.aclose()
+
     async def post(self, method: str, params: list, endpoint: str) -> dict:
+        self._bind_loop()
+        key = (endpoint, request_key(method, params))
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._post(method, params, endpoint))
+            self._inflight[key] = future
+            future.add_done_callback(lambda f: self._call_done(key, f))
+        else:
+            logger.debug(f"Joining in-flight RPC call: method={method}, endpoint={endpoint}")
+        # Shield so that one cancelled caller does not cancel the call for the others
+        return await asyncio.shield(future)
+
+    def _call_done(self, key: tuple[str, str], future: asyncio.Future) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            future.exception()  # mark as retrieved even if every caller went away
+
+    async def _post(self, method: str, params: list, endpoint: str) -> dict:
         logger.info(f"Making RPC call: method={method}, endpoint={endpoint}")
 
         if logger.isEnabledFor(logging.DEBUG):
@@ -23,42 +270,176 @@ class HttpxRpcClient(RpcClient):
             logger.debug(f"Request params: {safe_params}")
 
         try:
-            async with httpx.AsyncClient(timeout=120) as client:
-                logger.debug(f"Sending HTTP request to {endpoint}")
-                start_time = time.time()
-                resp = await client.post(
-                    endpoint, json={"jsonrpc": "2.0", "method": method, "params": params, "id": 1}
-                )
-                elapsed_time = time.time() - start_time
-                logger.debug(
-                    f"RPC response received in {elapsed_time:.2f}s with status {resp.status_code}"
-                )
-
-                response_data = resp.json()
-                if "error" in response_data:
-                    error_data = response_data["error"]
-                    error_message = error_data.get("message", "Unknown RPC error")
-                    error_code = error_data.get("code", -1)
-                    logger.error(f"RPC Error ({error_code}): {error_message} for method={method}")
-                    raise ValueError(f"RPC Error ({error_code}): {error_message}")
-
-                logger.info(f"RPC call successful: method={method}, time={elapsed_time:.2f}s")
-                # Log result size but not content for privacy and brevity
-                result = response_data.get("result")
-                if isinstance(result, (list, dict)):
-                    logger.debug(f"Result size: {len(result)} items")
-                return result
+            response_data, elapsed_time = await self._send(
+                endpoint, {"jsonrpc": "2.0", "method": method, "params": params, "id": 1}
+            )
+            result = self._rpc_result(method, response_data)
+            logger.info(f"RPC call successful: method={method}, time={elapsed_time:.2f}s")
+            return result
 
         except httpx.RequestError as e:
             logger.error(f"HTTP request failed for {method}: {str(e)}")
             raise
-        except json.JSONDecodeError:
+        except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON response for method={method}")
-            raise ValueError(f"Invalid JSON response from RPC endpoint: {endpoint}")
+            raise ValueError(f"Invalid JSON response from RPC endpoint: {endpoint}") from e
         except Exception:
             logger.exception(f"Unexpected error in RPC call {method}")
             raise
 
+    async def _send(self, endpoint, payload) -> tuple:
+        """POST a JSON-RPC payload (single request or batch) and decode the response.
+
+        ``endpoint`` is a URL or an EndpointSelector; with a selector the request
+        fails over to the next best endpoint on connection errors and HTTP 429/5xx,
+        and read-only calls may be hedged to a second endpoint.
+        """
+        if not isinstance(endpoint, EndpointSelector):
+            return await self._send_to(endpoint, payload)
+
+        method = payload.get("method") if isinstance(payload, dict) else None
+        if self.hedge_policy and len(endpoint) > 1 and self.hedge_policy.applies(method):
+            response_data, elapsed_time = await self._send_hedged(endpoint, payload, method)
+            self.hedge_policy.record_latency(method, elapsed_time)
+            return response_data, elapsed_time
+        return await self._failover(endpoint, payload, tried=set())
+
+    async def _failover(self, endpoint: EndpointSelector, payload, tried: set, error=None):
+        while len(tried) < len(endpoint):
+            url = endpoint.select(exclude=tried)
+            tried.add(url)
+            try:
+                return await self._attempt(endpoint, url, payload)
+            except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                error = e
+        if error is None:
+            raise ValueError(f"No RPC endpoint left to try among {endpoint}")
+        raise error
+
+    async def _send_hedged(self, endpoint: EndpointSelector, payload, method: str) -> tuple:
+        """Race a duplicate request on a second endpoint if the first one is slow."""
+        primary = endpoint.select()
+        tried = {primary}
+        attempts = {asyncio.ensure_future(self._attempt(endpoint, primary, payload))}
+        done, _ = await asyncio.wait(attempts, timeout=self.hedge_policy.delay(method))
+        if not done and self.hedge_policy.try_acquire(method):
+            backup = endpoint.select(exclude=tried)
+            tried.add(backup)
+            logger.info(f"Hedging {method} to endpoint {endpoint.label(backup)}")
+            attempts.add(asyncio.ensure_future(self._attempt(endpoint, backup, payload)))
+
+        error = None
+        try:
+            while attempts:
+                done, attempts = await asyncio.wait(attempts, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        return task.result()
+                    if not isinstance(error, (httpx.TransportError, httpx.HTTPStatusError)):
+                        raise error
+        finally:
+            # Cancel the loser (or both, if the caller went away)
+            for task in attempts:
+                task.cancel()
+        return await self._failover(endpoint, payload, tried, error)
+
+    async def _attempt(self, endpoint: EndpointSelector, url: str, payload) -> tuple:
+        try:
+            response_data, elapsed_time = await self._send_to(url, payload, failover=True)
+        except (httpx.TransportError, httpx.HTTPStatusError) as e:
+            endpoint.record_failure(url)
+            logger.warning(f"Endpoint {endpoint.label(url)} failed: {e}")
+            raise
+        endpoint.record_success(url, elapsed_time)
+        return response_data, elapsed_time
+
+    async def _send_to(self, url: str, payload, failover: bool = False) -> tuple:
+        client = self._client_for(url)
+        logger.debug(f"Sending HTTP request to {url}")
+        start_time = time.time()
+        resp = await client.post(
+            url, content=codec.dumps(payload), headers={"Content-Type": "application/json"}
+        )
+        elapsed_time = time.time() - start_time
+        logger.debug(f"RPC response received in {elapsed_time:.2f}s with status {resp.status_code}")
+        if failover and resp.status_code in FAILOVER_STATUS_CODES:
+            raise httpx.HTTPStatusError(
+                f"HTTP {resp.status_code}", request=resp.request, response=resp
+            )
+        return codec.loads(resp.content), elapsed_time
+
+    async def stream(self, method: str, params: list, endpoint) -> AsyncIterator:
+        """Yield the elements of an array result while the response is still arriving.
+
+        The body is parsed incrementally, so memory use is bounded by the largest
+        single element rather than the whole response. Streamed calls bypass
+        coalescing and hedging; with an EndpointSelector they fail over to another
+        endpoint only until the first element has been produced. Close the
+        generator (for example with ``contextlib.aclosing``) when stopping early
+        so that the connection is released.
+        """
+        logger.info(f"Making streaming RPC call: method={method}, endpoint={endpoint}")
+        content = codec.dumps({"jsonrpc": "2.0", "method": method, "params": params, "id": 1})
+        selector = endpoint if isinstance(endpoint, EndpointSelector) else None
+        tried = set()
+        while True:
+            url = selector.select(exclude=tried) if selector else endpoint
+            tried.add(url)
+            count = 0
+            start_time = time.time()
+            try:
+                async with self._client_for(url).stream(
+                    "POST", url, content=content, headers={"Content-Type": "application/json"}
+                ) as resp:
+                    if selector and resp.status_code in FAILOVER_STATUS_CODES:
+                        raise httpx.HTTPStatusError(
+                            f"HTTP {resp.status_code}", request=resp.request, response=resp
+                        )
+                    parser = JsonResultStream()
+                    async for chunk in resp.aiter_bytes():
+                        for item in parser.feed(chunk):
+                            count += 1
+                            yield item
+                    for item in parser.close():
+                        count += 1
+                        yield item
+            except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                if selector:
+                    selector.record_failure(url)
+                if not selector or count or len(tried) >= len(selector):
+                    logger.error(f"Streaming HTTP request failed for {method}: {str(e)}")
+                    raise
+                logger.warning(f"Endpoint {selector.label(url)} failed: {e}")
+                continue
+            except json.JSONDecodeError as e:
+                logger.error(f"Invalid JSON response for method={method}")
+                raise ValueError(f"Invalid JSON response from RPC endpoint: {endpoint}") from e
+
+            elapsed_time = time.time() - start_time
+            if selector:
+                selector.record_success(url, elapsed_time)
+            logger.info(
+                f"Streaming RPC call successful: method={method}, items={count}, "
+                f"time={elapsed_time:.2f}s"
+            )
+            return
+
+    def _rpc_result(self, method: str, response_data: dict):
+        """Return the result of a JSON-RPC response object or raise its error."""
+        if "error" in response_data:
+            error_data = response_data["error"]
+            error_message = error_data.get("message", "Unknown RPC error")
+            error_code = error_data.get("code", -1)
+            logger.error(f"RPC Error ({error_code}): {error_message} for method={method}")
+            raise ValueError(f"RPC Error ({error_code}): {error_message}")
+
+        # Log result size but not content for privacy and brevity
+        result = response_data.get("result")
+        if isinstance(result, (list, dict)):
+            logger.debug(f"Result size: {len(result)} items")
+        return result
+
     def _prepare_params_for_logging(self, params):
         """Prepare parameters for safe logging by truncating large values."""
         if not params:
@@ -81,3 +462,178 @@ class HttpxRpcClient(RpcClient):
                 safe_params.append(param)
 
         return safe_params
+
+
+class BatchingRpcClient(HttpxRpcClient):
+    """Pooled client that coalesces concurrent calls into JSON-RPC batch requests.
+
+    Calls to the same endpoint issued within ``batch_window`` seconds (or until
+    ``max_batch_size`` calls are queued) are sent as one array payload with unique
+    ids; results and per-item errors are routed back to the awaiting callers.
+    """
+
+    def __init__(self, batch_window: float = None, max_batch_size: int = None, **kwargs):
+        super().__init__(**kwargs)
+        self.batch_window = (
+            batch_window if batch_window is not None else settings.RPC_BATCH_WINDOW_MS / 1000
+        )
+        self.max_batch_size = max_batch_size or settings.RPC_MAX_BATCH_SIZE
+        self._ids = itertools.count(1)
+        self._pending: dict[str, list[tuple[str, list, asyncio.Future]]] = {}
+        self._flush_handles: dict[str, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    def _bind_loop(self) -> None:
+        if asyncio.get_running_loop() is not self._loop:
+            # Queued futures and flush timers belong to the previous loop too
+            for handle in self._flush_handles.values():
+                handle.cancel()
+            self._pending = {}
+            self._flush_handles = {}
+            self._tasks = set()
+        super()._bind_loop()
+
+    async def _post(self, method: str, params: list, endpoint: str) -> dict:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        queue = self._pending.setdefault(endpoint, [])
+        queue.append((method, params, future))
+
+        if len(queue) >= self.max_batch_size:
+            self._flush(endpoint)
+        elif len(queue) == 1:
+            self._flush_handles[endpoint] = loop.call_later(
+                self.batch_window, self._flush, endpoint
+            )
+        return await future
+
+    def _flush(self, endpoint: str) -> None:
+        handle = self._flush_handles.pop(endpoint, None)
+        if handle:
+            handle.cancel()
+        queue = self._pending.pop(endpoint, None)
+        if not queue:
+            return
+        task = asyncio.ensure_future(self._send_batch(endpoint, queue))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def aclose(self) -> None:
+        for endpoint in list(self._pending):
+            self._flush(endpoint)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        await super().aclose()
+
+    async def _send_batch(self, endpoint: str, queue: list) -> None:
+        post_single = super()._post
+        if len(queue) == 1:
+            method, params, future = queue[0]
+            await self._resolve(future, post_single(method, params, endpoint))
+            return
+
+        ids = [next(self._ids) for _ in queue]
+        payload = [
+            {"jsonrpc": "2.0", "method": method, "params": params, "id": request_id}
+            for request_id, (method, params, _) in zip(ids, queue)
+        ]
+        logger.info(f"Making batched RPC call: size={len(queue)}, endpoint={endpoint}")
+        try:
+            response_data, elapsed_time = await self._send(endpoint, payload)
+        except json.JSONDecodeError:
+            error = ValueError(f"Invalid JSON response from RPC endpoint: {endpoint}")
+            self._fail_all(queue, error)
+            return
+        except Exception as e:
+            logger.error(f"Batched HTTP request failed: {str(e)}")
+            self._fail_all(queue, e)
+            return
+
+        if not isinstance(response_data, list):
+            # Some providers reject batches outright; retry the calls one by one
+            logger.warning(f"Endpoint {endpoint} rejected batch request, sending calls singly")
+            await asyncio.gather(
+                *(self._resolve(future, post_single(m, p, endpoint)) for m, p, future in queue)
+            )
+            return
+
+        logger.info(f"Batched RPC call successful: size={len(queue)}, time={elapsed_time:.2f}s")
+        responses = {item.get("id"): item for item in response_data if isinstance(item, dict)}
+        for request_id, (method, _, future) in zip(ids, queue):
+            if future.done():
+                continue
+            item = responses.get(request_id)
+            if item is None:
+                future.set_exception(ValueError(f"Missing response for {method} in RPC batch"))
+                continue
+            try:
+                future.set_result(self._rpc_result(method, item))
+            except Exception as e:
+                future.set_exception(e)
+
+    @staticmethod
+    async def _resolve(future: asyncio.Future, call) -> None:
+        try:
+            result = await call
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result)
+
+    @staticmethod
+    def _fail_all(queue: list, error: Exception) -> None:
+        for _, _, future in queue:
+            if not future.done():
+                future.set_exception(error)
+
+
+_shared_clients: dict[bool, HttpxRpcClient] = {}
+_active_lifespans = 0
+_shutdown_hooks: list = []
+
+
+def get_shared_rpc_client(batching: bool = False) -> HttpxRpcClient:
+    """Return the process-wide pooled client shared by all adapters.
+
+    With ``batching`` the shared BatchingRpcClient is returned instead.
+    """
+    client = _shared_clients.get(batching)
+    if client is None:
+        client = BatchingRpcClient() if batching else HttpxRpcClient()
+        _shared_clients[batching] = client
+    return client
+
+
+async def close_shared_rpc_client() -> None:
+    for client in _shared_clients.values():
+        await client.aclose()
+
+
+def on_shutdown(hook) -> None:
+    """Run an async ``hook()`` when the last server lifespan exits, before pools close."""
+    if hook not in _shutdown_hooks:
+        _shutdown_hooks.append(hook)
+
+
+@asynccontextmanager
+async def rpc_lifespan(server):
+    """FastMCP lifespan that runs the shutdown hooks, stops the chain-head trackers
+    and releases pooled RPC connections on shutdown."""
+    global _active_lifespans
+    _active_lifespans += 1
+    try:
+        yield
+    finally:
+        _active_lifespans -= 1
+        # Sessions may run their own lifespan; only the last one out closes the pools
+        if _active_lifespans == 0:
+            for hook in _shutdown_hooks:
+                try:
+                    await hook()
+                except Exception as e:
+                    logger.warning(f"Shutdown hook {hook.__name__} failed: {e}")
+            await stop_trackers()
+            await close_shared_rpc_client()
+            checkpoint_disk_cache()
@@ -1,9 +1,22 @@
 from mcp.types import CallToolResult, TextContent
 
+from common import codec
+from common.config import settings
+
+# Older MCP SDKs do not know about structured tool output
+_SUPPORTS_STRUCTURED_CONTENT = "structuredContent" in CallToolResult.model_fields
+
 
 def _err(msg: str) -> CallToolResult:
     return CallToolResult(isError=True, content=[TextContent(type="text", text=msg)])
 
 
 def _ok(data) -> CallToolResult:
-    return CallToolResult(content=[TextContent(type="text", text=str(data))])
+    # Strings (hex quantities, hashes, addresses) are returned verbatim, everything else as JSON
+    text = data if isinstance(data, str) else codec.dumps_str(data)
+    if settings.MCP_STRUCTURED_OUTPUT and _SUPPORTS_STRUCTURED_CONTENT:
+        structured = data if isinstance(data, dict) else {"result": data}
+        return CallToolResult(
+            content=[TextContent(type="text", text=text)], structuredContent=structured
+        )
+    return CallToolResult(content=[TextContent(type="text", text=text)])
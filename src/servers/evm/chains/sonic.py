@@ -4,6 +4,7 @@ Sonic-specific implementation of the BlockchainAdapter using EVM base logic.
 
 from common.config import settings
 from common.interfaces import RpcClient
+from common.rpc import get_shared_rpc_client
 from servers.evm.common.adapter_registry import register_adapter
 from servers.evm.evm import EvmAdapter
 
@@ -11,4 +12,9 @@ from servers.evm.evm import EvmAdapter
 @register_adapter("sonic")
 class SonicAdapter(EvmAdapter):
     def __init__(self, rpc_client: RpcClient = None):
-        super().__init__(rpc_url=settings.SONIC_RPC_URL, rpc_client=rpc_client)
+        super().__init__(
+            rpc_url=settings.SONIC_RPC_URLS,
+            rpc_client=rpc_client or get_shared_rpc_client(settings.SONIC_RPC_BATCHING),
+            chain="sonic",
+            ws_url=settings.SONIC_WS_URL,
+        )
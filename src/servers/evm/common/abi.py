@@ -0,0 +1,145 @@
+"""
+Solidity ABI helpers: encoding of simple eth_call data and decoding of any
+canonical ABI type (integers, addresses, bytes, strings, arrays and tuples).
+"""
+
+from servers.evm.common.keccak import split_params
+
+WORD = 32
+
+
+def _strip_hex(value: str) -> str:
+    return value[2:] if value.startswith(("0x", "0X")) else value
+
+
+def encode_uint(value: int) -> bytes:
+    return value.to_bytes(WORD, "big")
+
+
+def encode_bool(value: bool) -> bytes:
+    return encode_uint(1 if value else 0)
+
+
+def encode_address(address: str) -> bytes:
+    raw = bytes.fromhex(_strip_hex(address))
+    if len(raw) != 20:
+        raise ValueError(f"Invalid address: {address}")
+    return raw.rjust(WORD, b"\x00")
+
+
+def encode_bytes(data: bytes) -> bytes:
+    """Tail encoding of a dynamic ``bytes`` value: length word plus padded data."""
+    padding = -len(data) % WORD
+    return encode_uint(len(data)) + data + b"\x00" * padding
+
+
+def to_bytes(value: str) -> bytes:
+    return bytes.fromhex(_strip_hex(value or ""))
+
+
+def to_hex(data: bytes) -> str:
+    return "0x" + data.hex()
+
+
+def function_call(selector: str, *args: bytes) -> str:
+    """Calldata for a function whose arguments are all static words."""
+    return "0x" + _strip_hex(selector) + b"".join(args).hex()
+
+
+def read_uint(data: bytes, offset: int) -> int:
+    if offset + WORD > len(data):
+        raise ValueError("ABI data is too short")
+    return int.from_bytes(data[offset : offset + WORD], "big")
+
+
+def read_bytes(data: bytes, offset: int) -> bytes:
+    """Read a dynamic ``bytes`` value whose length word starts at ``offset``."""
+    length = read_uint(data, offset)
+    start = offset + WORD
+    if start + length > len(data):
+        raise ValueError("ABI data is too short")
+    return data[start : start + length]
+
+
+def decode_uint(value: str) -> int:
+    """Decode a single uint256 return value, e.g. from balanceOf."""
+    return read_uint(to_bytes(value), 0)
+
+
+def _array_parts(abi_type: str) -> tuple[str, int]:
+    """Split ``T[k]`` / ``T[]`` into the element type and length (None if dynamic)."""
+    open_at = abi_type.rindex("[")
+    size = abi_type[open_at + 1 : -1]
+    return abi_type[:open_at], int(size) if size else None
+
+
+def _tuple_types(abi_type: str) -> list[str]:
+    return split_params(abi_type[1:-1])
+
+
+def is_dynamic(abi_type: str) -> bool:
+    if abi_type in ("bytes", "string"):
+        return True
+    if abi_type.endswith("]"):
+        element, size = _array_parts(abi_type)
+        return size is None or is_dynamic(element)
+    if abi_type.startswith("("):
+        return any(is_dynamic(t) for t in _tuple_types(abi_type))
+    return False
+
+
+def head_size(abi_type: str) -> int:
+    """Bytes a value of this type takes in the head of its enclosing tuple."""
+    if is_dynamic(abi_type):
+        return WORD
+    if abi_type.endswith("]"):
+        element, size = _array_parts(abi_type)
+        return size * head_size(element)
+    if abi_type.startswith("("):
+        return sum(head_size(t) for t in _tuple_types(abi_type))
+    return WORD
+
+
+def decode_params(types: list[str], data: bytes, base: int = 0) -> list:
+    """Decode a tuple of values laid out head/tail starting at ``base``."""
+    values = []
+    position = base
+    for abi_type in types:
+        if is_dynamic(abi_type):
+            values.append(decode_value(abi_type, data, base + read_uint(data, position)))
+        else:
+            values.append(decode_value(abi_type, data, position))
+        position += head_size(abi_type)
+    return values
+
+
+def decode_value(abi_type: str, data: bytes, offset: int):
+    """Decode one value of ``abi_type`` whose encoding starts at ``offset``.
+
+    Integers stay Python ints, addresses and fixed bytes become 0x-hex strings,
+    arrays become lists and tuples lists in component order.
+    """
+    if abi_type.endswith("]"):
+        element, size = _array_parts(abi_type)
+        if size is None:
+            size = read_uint(data, offset)
+            offset += WORD
+        return decode_params([element] * size, data, offset)
+    if abi_type.startswith("("):
+        return decode_params(_tuple_types(abi_type), data, offset)
+    if abi_type == "bytes":
+        return to_hex(read_bytes(data, offset))
+    if abi_type == "string":
+        return read_bytes(data, offset).decode("utf-8", errors="replace")
+    word = read_uint(data, offset)
+    if abi_type.startswith("uint"):
+        return word
+    if abi_type.startswith("int"):
+        return word - (1 << 256) if word >> 255 else word
+    if abi_type == "address":
+        return "0x" + data[offset + 12 : offset + WORD].hex()
+    if abi_type == "bool":
+        return bool(word)
+    if abi_type.startswith("bytes"):
+        return to_hex(data[offset : offset + int(abi_type[5:])])
+    raise ValueError(f"Unsupported ABI type: {abi_type}")
@@ -0,0 +1,245 @@
+"""
+Registry of known events and functions for decoding logs, calldata and return data.
+
+ABIs come from a built-in set of common token and DEX interfaces plus every
+``*.json`` file in ``EVM_ABI_DIR``. A file may hold a Solidity ABI array, a
+build artifact with an ``abi`` key, or human-readable signatures such as
+``"event Transfer(address indexed from, address indexed to, uint256 value)"``.
+Events are indexed by topic0 and functions by selector, so each lookup is a
+single dict access.
+"""
+
+import json
+import os
+
+from common.config import settings
+from common.logger import get_logger
+from servers.evm.common.abi import decode_params, decode_value, to_bytes
+from servers.evm.common.keccak import (
+    canonical_signature,
+    closing_paren,
+    event_topic,
+    split_params,
+)
+
+logger = get_logger(__name__)
+
+BUILTIN_ABI = [
+    "event Transfer(address indexed from, address indexed to, uint256 value)",
+    "event Transfer(address indexed from, address indexed to, uint256 indexed tokenId)",
+    "event Approval(address indexed owner, address indexed spender, uint256 value)",
+    "event ApprovalForAll(address indexed owner, address indexed operator, bool approved)",
+    "event Deposit(address indexed dst, uint256 wad)",
+    "event Withdrawal(address indexed src, uint256 wad)",
+    "event Sync(uint112 reserve0, uint112 reserve1)",
+    "event Swap(address indexed sender, uint256 amount0In, uint256 amount1In, "
+    "uint256 amount0Out, uint256 amount1Out, address indexed to)",
+    "event Swap(address indexed sender, address indexed recipient, int256 amount0, "
+    "int256 amount1, uint160 sqrtPriceX96, uint128 liquidity, int24 tick)",
+    "function name() returns (string)",
+    "function symbol() returns (string)",
+    "function decimals() returns (uint8)",
+    "function totalSupply() returns (uint256)",
+    "function balanceOf(address owner) returns (uint256)",
+    "function allowance(address owner, address spender) returns (uint256)",
+    "function ownerOf(uint256 tokenId) returns (address)",
+    "function transfer(address to, uint256 value) returns (bool)",
+    "function approve(address spender, uint256 value) returns (bool)",
+    "function transferFrom(address from, address to, uint256 value) returns (bool)",
+]
+
+_abi_registry: "AbiRegistry" = None
+
+
+def _param_from_text(text: str) -> dict:
+    """``"address indexed from"`` -> ``{"type": "address", "name": "from", "indexed": True}``."""
+    words = text.split()
+    return {
+        "type": words[0],
+        "name": words[-1] if len(words) > 1 and words[-1] != "indexed" else "",
+        "indexed": "indexed" in words[1:],
+    }
+
+
+def parse_human_readable(signature: str) -> dict:
+    """Turn a human-readable event or function signature into an ABI JSON entry."""
+    kind, _, rest = signature.strip().partition(" ")
+    if kind not in ("event", "function") or "(" not in rest:
+        raise ValueError(f"Expected 'event ...' or 'function ...': {signature}")
+    open_at = rest.index("(")
+    close_at = closing_paren(rest, open_at)
+    inputs = [_param_from_text(p) for p in split_params(rest[open_at + 1 : close_at])]
+    entry = {"type": kind, "name": rest[:open_at].strip(), "inputs": inputs}
+    tail = rest[close_at + 1 :]
+    if kind == "function" and "returns" in tail:
+        returns = tail[tail.index("(", tail.index("returns")) + 1 : tail.rindex(")")]
+        entry["outputs"] = [_param_from_text(p) for p in split_params(returns)]
+    return entry
+
+
+def abi_type(param: dict) -> str:
+    """Canonical type string of an ABI JSON parameter, expanding tuples."""
+    kind = param["type"]
+    if kind.startswith("tuple"):
+        components = ",".join(abi_type(c) for c in param.get("components", []))
+        return f"({components}){kind[5:]}"
+    return canonical_signature(f"f({kind})")[2:-1]
+
+
+def _named(param: dict, value):
+    """Attach component names to decoded tuple values."""
+    kind = param["type"]
+    if not kind.startswith("tuple"):
+        return value
+    if kind.endswith("]"):
+        element = {**param, "type": kind[: kind.rindex("[")]}
+        return [_named(element, v) for v in value]
+    components = param.get("components", [])
+    return {
+        c.get("name") or str(i): _named(c, v) for i, (c, v) in enumerate(zip(components, value))
+    }
+
+
+def _decode_named(params: list[dict], types: list[str], data: bytes) -> dict:
+    values = decode_params(types, data)
+    return {p.get("name") or str(i): _named(p, v) for i, (p, v) in enumerate(zip(params, values))}
+
+
+class AbiEntry:
+    """An event or function with its parameter types resolved once up front."""
+
+    def __init__(self, item: dict):
+        self.name = item["name"]
+        self.inputs = item.get("inputs", [])
+        self.outputs = item.get("outputs", [])
+        self.input_types = [abi_type(p) for p in self.inputs]
+        self.output_types = [abi_type(p) for p in self.outputs]
+        self.signature = f"{self.name}({','.join(self.input_types)})"
+        self.hash = event_topic(self.signature)
+        self.indexed = [p for p in self.inputs if p.get("indexed")]
+        self.data_params = [p for p in self.inputs if not p.get("indexed")]
+        self.data_types = [abi_type(p) for p in self.data_params]
+
+    def decode_log(self, log: dict) -> dict:
+        args = {}
+        for param, topic in zip(self.indexed, log["topics"][1:]):
+            kind = abi_type(param)
+            if kind in ("bytes", "string") or kind.endswith("]") or kind.startswith("("):
+                value = topic  # dynamic indexed values are stored as their hash
+            else:
+                value = decode_value(kind, to_bytes(topic), 0)
+            args[param.get("name") or str(len(args))] = value
+        args.update(_decode_named(self.data_params, self.data_types, to_bytes(log["data"])))
+        return args
+
+
+class AbiRegistry:
+    def __init__(self):
+        self.events: dict[str, list[AbiEntry]] = {}
+        self.functions: dict[str, AbiEntry] = {}
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self.events.values()) + len(self.functions)
+
+    def add_abi(self, abi: list) -> None:
+        for item in abi:
+            if isinstance(item, str):
+                item = parse_human_readable(item)
+            if item.get("type") not in ("event", "function") or "name" not in item:
+                continue
+            entry = AbiEntry(item)
+            if item["type"] == "function":
+                self.functions[entry.hash[:10]] = entry
+                continue
+            # ERC-20 and ERC-721 Transfer share topic0 and differ in indexed inputs
+            candidates = self.events.setdefault(entry.hash, [])
+            if all(len(c.indexed) != len(entry.indexed) for c in candidates):
+                candidates.append(entry)
+
+    def load_dir(self, path: str) -> None:
+        for filename in sorted(os.listdir(path)):
+            if not filename.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(path, filename)) as f:
+                    abi = json.load(f)
+                self.add_abi(abi["abi"] if isinstance(abi, dict) else abi)
+            except Exception as e:
+                logger.warning(f"Skipping ABI file {filename}: {e}")
+
+    def event_for(self, topics: list[str]) -> AbiEntry:
+        for entry in self.events.get(topics[0].lower(), []) if topics else []:
+            if len(entry.indexed) == len(topics) - 1:
+                return entry
+        return None
+
+    def function_for(self, data: str) -> AbiEntry:
+        return self.functions.get((data or "")[:10].lower())
+
+    def decode_logs(self, logs: list[dict]) -> list[dict]:
+        """Decode every log with a known event; unknown logs are returned unchanged.
+
+        The event is resolved once per (topic0, topic count) so large log arrays
+        of a few event kinds only hit the index a handful of times.
+        """
+        resolved: dict[tuple, AbiEntry] = {}
+        rows = []
+        for log in logs:
+            topics = log.get("topics") or []
+            key = (topics[0] if topics else None, len(topics))
+            if key not in resolved:
+                resolved[key] = self.event_for(topics)
+            entry = resolved[key]
+            if entry is None:
+                rows.append(log)
+                continue
+            try:
+                args = entry.decode_log(log)
+            except ValueError:
+                rows.append(log)  # same topic0 but a different layout
+                continue
+            rows.append(
+                {
+                    "address": log.get("address"),
+                    "blockNumber": log.get("blockNumber"),
+                    "transactionHash": log.get("transactionHash"),
+                    "logIndex": log.get("logIndex"),
+                    "event": entry.signature,
+                    "args": args,
+                }
+            )
+        return rows
+
+    def decode_input(self, data: str) -> dict:
+        """Decode transaction input or eth_call calldata, or None if unknown."""
+        entry = self.function_for(data)
+        if entry is None:
+            return None
+        try:
+            args = _decode_named(entry.inputs, entry.input_types, to_bytes(data)[4:])
+        except ValueError:
+            return None  # selector collision or malformed calldata
+        return {"function": entry.signature, "args": args}
+
+    def decode_output(self, data: str, result: str) -> dict:
+        """Decode eth_call return data using the function called by ``data``."""
+        entry = self.function_for(data)
+        if entry is None or not entry.outputs:
+            return None
+        try:
+            outputs = _decode_named(entry.outputs, entry.output_types, to_bytes(result))
+        except ValueError:
+            return None
+        return {"function": entry.signature, "outputs": outputs}
+
+
+def get_abi_registry() -> AbiRegistry:
+    """Return the process-wide registry, loading built-in ABIs and EVM_ABI_DIR once."""
+    global _abi_registry
+    if _abi_registry is None:
+        _abi_registry = AbiRegistry()
+        _abi_registry.add_abi(BUILTIN_ABI)
+        if settings.EVM_ABI_DIR:
+            _abi_registry.load_dir(settings.EVM_ABI_DIR)
+            logger.info(f"Loaded {len(_abi_registry)} ABI entries")
+    return _abi_registry
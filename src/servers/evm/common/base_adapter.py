@@ -0,0 +1,18 @@
+"""
+Hand-written base of the generated EvmAdapter: head tracking and the Evm
+response cache.
+"""
+
+from common.adapter import RpcAdapter
+from common.config import settings
+from servers.evm.common.cache import EvmCachingRpcClient
+from servers.evm.common.head import EvmHeadTracker
+from servers.evm.common.interfaces import BlockchainAdapter
+
+
+class EvmBaseAdapter(RpcAdapter, BlockchainAdapter):
+    head_tracker_class = EvmHeadTracker
+    caching_client_class = EvmCachingRpcClient
+
+    def cache_enabled(self) -> bool:
+        return settings.EVM_CACHE_ENABLED
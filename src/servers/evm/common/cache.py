@@ -0,0 +1,240 @@
+"""
+Finality-aware response cache for EVM JSON-RPC calls.
+
+Every call is classified as immutable (transactions, blocks and state at a block
+that is already deep enough), head-relative (``latest``, ``pending``, ``safe``,
+``finalized``) or volatile. Immutable results are kept in a bounded LRU; head
+relative ones expire after a short TTL.
+
+Blocks, receipts and logs for numbered blocks that are not final yet are cached
+too, tagged with the block hashes they were served from. They are evicted as
+soon as the head tracker sees a different canonical hash for one of those
+blocks or detects a reorg at or below them, and all of them are dropped when
+the tracker stops, since cache hits alone do not keep it running.
+"""
+
+from common.cache import HEAD, IMMUTABLE, VOLATILE, CachingRpcClient, request_key
+from common.config import settings
+from common.disk_cache import DiskCache
+from common.head import HeadTracker
+from common.interfaces import RpcClient
+
+BLOCK_TAGS = {"latest", "pending", "safe", "finalized"}
+
+# Methods whose result is fully determined by a block parameter at the given index
+BLOCK_PARAM_METHODS = {
+    "eth_getBalance": 1,
+    "eth_getStorageAt": 2,
+    "eth_getTransactionCount": 1,
+    "eth_getCode": 1,
+    "eth_call": 1,
+    "eth_getProof": 2,
+    "eth_feeHistory": 1,
+    "eth_getBlockByNumber": 0,
+    "eth_getBlockTransactionCountByNumber": 0,
+    "eth_getBlockReceipts": 0,
+    "debug_traceBlockByNumber": 0,
+    "trace_block": 0,
+    "trace_replayBlockTransactions": 0,
+}
+
+# Methods keyed by a transaction hash; final once the including block is deep
+TX_HASH_METHODS = {
+    "eth_getTransactionByHash",
+    "eth_getTransactionReceipt",
+    "debug_traceTransaction",
+    "trace_replayTransaction",
+}
+
+# Methods keyed by a block hash, whose content can never change
+BLOCK_HASH_METHODS = {
+    "eth_getBlockByHash",
+    "eth_getBlockTransactionCountByHash",
+    "debug_traceBlockByHash",
+}
+
+STATIC_METHODS = {"eth_chainId", "net_version", "web3_sha3"}
+
+HEAD_METHODS = {"eth_blockNumber", "eth_gasPrice", "eth_maxPriorityFeePerGas"}
+
+# Methods whose near-head results carry enough block information to detect reorgs
+NEAR_HEAD_METHODS = {"eth_getBlockByNumber", "eth_getBlockReceipts", "eth_getLogs"}
+
+
+def block_ref(block) -> tuple[str, object]:
+    """Split a block parameter into ("number", int), ("hash", str) or ("tag", str)."""
+    if isinstance(block, dict):
+        if "blockHash" in block:
+            return "hash", block["blockHash"]
+        block = block.get("blockNumber", "latest")
+    if isinstance(block, int):
+        return "number", block
+    if isinstance(block, str):
+        value = block.lower()
+        if value.startswith("0x") and len(value) == 66:
+            return "hash", value
+        if value.startswith("0x"):
+            return "number", int(value, 16)
+        if value.isdigit():
+            return "number", int(value)
+        return "tag", value
+    return "tag", "latest"
+
+
+class EvmCachingRpcClient(CachingRpcClient):
+    """CachingRpcClient with EVM finality rules."""
+
+    identity_method = "eth_chainId"
+
+    def __init__(
+        self,
+        inner: RpcClient,
+        max_entries: int = None,
+        head_ttl: float = None,
+        confirmations: int = None,
+        head: HeadTracker = None,
+        disk: DiskCache = None,
+        namespace: str = "",
+    ):
+        super().__init__(
+            inner,
+            max_entries=max_entries or settings.EVM_CACHE_MAX_ENTRIES,
+            head_ttl=head_ttl if head_ttl is not None else settings.EVM_CACHE_HEAD_TTL,
+            disk=disk,
+            namespace=namespace,
+        )
+        self.confirmations = (
+            confirmations if confirmations is not None else settings.EVM_CACHE_CONFIRMATIONS
+        )
+        self.head = head
+        # Cache key -> (first block, last block, {block number: hash}) of near-head entries
+        self._near_head: dict[str, tuple[int, int, dict[int, str]]] = {}
+        self.reorg_evictions = 0
+        if head is not None and settings.EVM_CACHE_NEAR_HEAD:
+            head.listeners.append(self.on_head)
+            head.stop_listeners.append(self.forget_near_head)
+
+    def classify(self, method: str, params: list) -> str:
+        if method in STATIC_METHODS or method in TX_HASH_METHODS or method in BLOCK_HASH_METHODS:
+            return IMMUTABLE
+        if method in HEAD_METHODS:
+            return HEAD
+        if method in BLOCK_PARAM_METHODS:
+            index = BLOCK_PARAM_METHODS[method]
+            block = params[index] if len(params) > index else "latest"
+            kind, value = block_ref(block)
+            return HEAD if kind == "tag" and value in BLOCK_TAGS else IMMUTABLE
+        if method == "eth_getLogs" and params and isinstance(params[0], dict):
+            return self._classify_logs(params[0])
+        return VOLATILE
+
+    async def is_settled(self, method: str, params: list, result, endpoint: str) -> bool:
+        if result is None:
+            return False
+        if method in STATIC_METHODS or method in BLOCK_HASH_METHODS:
+            return True
+        if method in BLOCK_PARAM_METHODS:
+            kind, value = block_ref(params[BLOCK_PARAM_METHODS[method]])
+            if kind != "number" or await self._is_deep(value, endpoint):
+                return True
+            return self._track_near_head(method, params, result)
+        if method == "eth_getLogs":
+            log_filter = params[0]
+            if "blockHash" in log_filter:
+                return True
+            kind, to_block = block_ref(log_filter.get("toBlock", "latest"))
+            if kind != "number" or await self._is_deep(to_block, endpoint):
+                return True
+            return self._track_near_head(method, params, result)
+        if method in TX_HASH_METHODS:
+            tx = result
+            if method not in ("eth_getTransactionByHash", "eth_getTransactionReceipt"):
+                tx = await self.post("eth_getTransactionByHash", [params[0]], endpoint)
+            if not isinstance(tx, dict) or tx.get("blockNumber") is None:
+                return False
+            return await self._is_deep(int(tx["blockNumber"], 16), endpoint)
+        return False
+
+    def _classify_logs(self, log_filter: dict) -> str:
+        if "blockHash" in log_filter:
+            return IMMUTABLE
+        for key in ("fromBlock", "toBlock"):
+            kind, value = block_ref(log_filter.get(key, "latest"))
+            if kind == "tag" and value in BLOCK_TAGS:
+                return HEAD
+        return IMMUTABLE
+
+    async def _is_deep(self, block_number: int, endpoint: str) -> bool:
+        state = self.head.fresh() if self.head else None
+        if state and state.get("finalized") is not None and block_number <= state["finalized"]:
+            return True
+        if state and "number" in state:
+            head = state["number"]
+        else:
+            head = int(await self.post("eth_blockNumber", [], endpoint), 16)
+        return head - block_number >= self.confirmations
+
+    def persistable(self, key: str) -> bool:
+        # Near-head entries may still be reorged out and only live in memory
+        return key not in self._near_head
+
+    def _track_near_head(self, method: str, params: list, result) -> bool:
+        """Accept a result that is not final yet if a reorg can later evict it."""
+        if method not in NEAR_HEAD_METHODS or not settings.EVM_CACHE_NEAR_HEAD:
+            return False
+        if self.head is None or self.head.fresh() is None:
+            return False
+        blocks = _result_blocks(method, params, result)
+        if blocks is None or blocks[0] < min(self.head.canonical, default=blocks[0]):
+            return False  # older than the hashes the tracker has seen, so unverifiable
+        self._near_head[request_key(method, params)] = blocks
+        return True
+
+    def on_head(self, number: int, block_hash: str, reorg_from: int) -> None:
+        """Evict near-head entries that are no longer on the canonical chain.
+
+        A block at or below the head without a recorded hash cannot be verified
+        and counts as orphaned; blocks above the head wait for a later header.
+        """
+        canonical = self.head.canonical
+        for key, (_first, last, hashes) in list(self._near_head.items()):
+            orphaned = reorg_from is not None and last >= reorg_from
+            orphaned = orphaned or any(
+                height <= number and canonical.get(height) != value
+                for height, value in hashes.items()
+            )
+            if orphaned:
+                self.cache.delete(key)
+                del self._near_head[key]
+                self.reorg_evictions += 1
+            elif number - last >= self.confirmations:
+                del self._near_head[key]  # final now, nothing left to watch
+
+    def forget_near_head(self) -> None:
+        """Drop every near-head entry; without a running tracker reorgs go unnoticed."""
+        for key in self._near_head:
+            self.cache.delete(key)
+        self._near_head.clear()
+
+    def stats(self) -> dict:
+        return {
+            **super().stats(),
+            "near_head_entries": len(self._near_head),
+            "reorg_evictions": self.reorg_evictions,
+        }
+
+
+def _result_blocks(method: str, params: list, result) -> tuple[int, int, dict[int, str]]:
+    """Block range and observed block hashes of a near-head result."""
+    if method == "eth_getBlockByNumber":
+        number = int(result["number"], 16)
+        return number, number, {number: result["hash"]}
+    if method == "eth_getBlockReceipts":
+        _, number = block_ref(params[0])
+        hashes = {number: result[0]["blockHash"]} if result else {}
+        return number, number, hashes
+    kind, first = block_ref(params[0].get("fromBlock", "latest"))
+    _, last = block_ref(params[0].get("toBlock", "latest"))
+    if kind != "number":
+        return None
+    return first, last, {int(log["blockNumber"], 16): log["blockHash"] for log in result}
@@ -3,22 +3,45 @@ Client dispatcher that routes blockchain transaction requests
 through registered BlockchainAdapter instances.
 """
 
-from servers.evm.common.adapter_registry import registry
+from contextlib import aclosing
+
+from common.config import settings
+from common.projection import parse_fields, project
+from servers.evm.common import logs, multicall
+from servers.evm.common.abi import to_bytes, to_hex
+from servers.evm.common.adapter_registry import registry, unavailable
+from servers.evm.common.keccak import keccak256
 
 
 def _adapter(chain: str):
     ad = registry.get(chain)
     if not ad:
+        if chain in unavailable:
+            raise ValueError(f"Blockchain {chain} is not configured: {unavailable[chain]}")
         raise ValueError(f"Unsupported blockchain: {chain}")
     return ad
 
 
+async def collect(chain, method, params, max_results=None):
+    """Read an array result as a stream, stopping after ``max_results`` elements."""
+    items = []
+    async with aclosing(_adapter(chain).stream(method, params)) as stream:
+        async for item in stream:
+            items.append(item)
+            if max_results is not None and len(items) >= max_results:
+                break
+    return items
+
+
 async def web3_clientVersion(chain):
     return await _adapter(chain).web3_clientVersion()
 
 
 async def web3_sha3(chain, data):
-    return await _adapter(chain).web3_sha3(data)
+    adapter = _adapter(chain)
+    if settings.WEB3_SHA3_REMOTE:
+        return await adapter.web3_sha3(data)
+    return to_hex(keccak256(to_bytes(data)))
 
 
 async def net_version(chain):
@@ -89,6 +112,25 @@ async def eth_getBlockByNumber(chain, block_number, full_tx):
     return await _adapter(chain).eth_getBlockByNumber(block_number, full_tx)
 
 
+async def get_block(chain, block, full_tx, fields=None):
+    """Fetch a block by number, tag or hash and keep only the projected ``fields``.
+
+    Full transaction objects are only requested when the projection needs more
+    than their hashes.
+    """
+    adapter = _adapter(chain)
+    fetch = adapter.eth_getBlockByHash if len(block) == 66 else adapter.eth_getBlockByNumber
+    tree = parse_fields(fields)
+    tx_fields = tree.get("transactions")
+    needs_full_tx = tx_fields is not None and set(tx_fields) != {"hash"}
+    if not tree or not full_tx or needs_full_tx:
+        return project(await fetch(block, full_tx), tree)
+    result = await fetch(block, False)
+    if result and tx_fields:  # only transactions.hash is selected
+        result = {**result, "transactions": [{"hash": h} for h in result["transactions"]]}
+    return project(result, tree)
+
+
 async def eth_getBlockTransactionCountByHash(chain, block_hash):
     return await _adapter(chain).eth_getBlockTransactionCountByHash(block_hash)
 
@@ -109,6 +151,14 @@ async def eth_getLogs(chain, filter_params):
     return await _adapter(chain).eth_getLogs(filter_params)
 
 
+async def get_logs(chain, filter_params):
+    return await logs.get_logs(_adapter(chain), filter_params)
+
+
+async def aggregate_calls(chain, calls, block, allow_failure=True):
+    return await multicall.multicall(_adapter(chain), calls, block, allow_failure)
+
+
 async def debug_traceTransaction(chain, tx_hash, options):
     return await _adapter(chain).debug_traceTransaction(tx_hash, options)
 
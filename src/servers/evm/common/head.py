@@ -0,0 +1,152 @@
+"""
+Head tracker for EVM chains.
+"""
+
+import asyncio
+from collections.abc import Callable
+
+from common.config import settings
+from common.head import HeadTracker
+from common.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Refresh the safe and finalized blocks on every n-th poll; they move slowly
+FINALITY_POLL_EVERY = 5
+
+
+def _int(value) -> int:
+    return int(value, 16) if isinstance(value, str) else value
+
+
+def header_fields(block: dict) -> dict:
+    return {
+        "number": _int(block["number"]),
+        "hash": block["hash"],
+        "parentHash": block.get("parentHash"),
+        "timestamp": _int(block.get("timestamp")),
+        "baseFeePerGas": _int(block.get("baseFeePerGas")),
+    }
+
+
+class EvmHeadTracker(HeadTracker):
+    """Tracks latest block number, hash and base fee plus the safe and finalized heights.
+
+    Every header seen is linked into ``canonical``, a rolling window of recent
+    canonical block hashes: when its parent is not the recorded hash one height
+    below, parents are fetched by hash until the new branch meets a recorded
+    block, which fills heights skipped between polls and finds the fork point
+    of deeper reorgs. Listeners are called with ``(number, hash, reorg_from)``
+    for each header, where ``reorg_from`` is the lowest height whose hash
+    changed, or None. Stop listeners are called when the tracker stops, since
+    reorgs are no longer detected from then on.
+    """
+
+    subscribe_method = "eth_subscribe"
+    subscribe_params = ["newHeads"]
+
+    def __init__(self, adapter, name: str, ws_url: str = None, interval: float = None):
+        super().__init__(name, ws_url, interval)
+        self.adapter = adapter
+        self.canonical: dict[int, str] = {}
+        self.listeners: list[Callable[[int, str, int], None]] = []
+        self.stop_listeners: list[Callable[[], None]] = []
+        self.reorgs = 0
+        self._polls = 0
+
+    async def poll(self) -> dict:
+        tags = ["latest"]
+        if self._polls % FINALITY_POLL_EVERY == 0:
+            tags += ["safe", "finalized"]
+        self._polls += 1
+        blocks = await asyncio.gather(
+            *(self.adapter.post_uncached("eth_getBlockByNumber", [tag, False]) for tag in tags),
+            return_exceptions=True,
+        )
+        latest = blocks[0]
+        if isinstance(latest, Exception):
+            raise latest
+
+        fields = {}
+        if latest:
+            await self.observe(latest)
+            if _int(latest["number"]) >= self.state.get("number", -1):
+                fields.update(header_fields(latest))
+        for tag, block in zip(tags[1:], blocks[1:]):
+            if isinstance(block, Exception) or not block:
+                # Not every chain supports every tag
+                logger.debug(f"No {tag} block for {self.name}: {block}")
+                continue
+            fields[tag] = _int(block["number"])
+        return fields
+
+    async def on_notification(self, result) -> dict:
+        await self.observe(result)
+        if _int(result["number"]) < self.state.get("number", -1):
+            return {}
+        return header_fields(result)
+
+    async def _branch(self, number: int, parent_hash: str) -> tuple[dict[int, str], int]:
+        """Hashes of the new branch below ``number`` down to where it meets ``canonical``.
+
+        Returns the branch and the lowest height whose recorded hash it replaces.
+        Stops at the bottom of the window or when a parent cannot be fetched.
+        """
+        branch, reorg_from = {}, None
+        lowest = min(self.canonical, default=number - 1)
+        height = number - 1
+        while parent_hash is not None and height >= max(lowest, number - settings.EVM_REORG_WINDOW):
+            known = self.canonical.get(height)
+            if known == parent_hash:
+                break
+            if known is not None:
+                reorg_from = height
+            branch[height] = parent_hash
+            if height == lowest:
+                break
+            try:
+                block = await self.adapter.eth_getBlockByHash(parent_hash, False)
+            except Exception as e:
+                logger.warning(f"Could not fetch block {parent_hash} on {self.name}: {e}")
+                break
+            parent_hash = block.get("parentHash") if block else None
+            height -= 1
+        return branch, reorg_from
+
+    async def observe(self, header: dict) -> None:
+        """Link a header into the canonical window and notify listeners."""
+        number, block_hash = _int(header["number"]), header["hash"]
+        reorg_from = None
+        if self.canonical.get(number) != block_hash:
+            branch, reorg_from = await self._branch(number, header.get("parentHash"))
+            known = self.canonical.get(number)
+            if known is not None and known != block_hash:
+                reorg_from = number if reorg_from is None else reorg_from
+            self.canonical.update(branch)
+            self.canonical[number] = block_hash
+        if reorg_from is not None:
+            # Anything above the new head belonged to the abandoned branch
+            for height in [h for h in self.canonical if h > number]:
+                del self.canonical[height]
+            self.reorgs += 1
+            logger.warning(f"Reorg on {self.name} from block {reorg_from}")
+        for height in [h for h in self.canonical if h <= number - settings.EVM_REORG_WINDOW]:
+            del self.canonical[height]
+        for listener in self.listeners:
+            listener(number, block_hash, reorg_from)
+
+    def on_stop(self) -> None:
+        # The recorded hashes go stale while nothing is polling
+        self.canonical.clear()
+        for listener in self.stop_listeners:
+            listener()
+
+    def snapshot(self) -> dict:
+        return {**super().snapshot(), "reorgs": self.reorgs}
+
+    def block_number(self, tag: str) -> int:
+        """Block number for latest/pending/safe/finalized from fresh head state, else None."""
+        state = self.fresh()
+        if not state:
+            return None
+        return state.get("number" if tag in ("latest", "pending") else tag)
@@ -0,0 +1,149 @@
+"""
+Keccak-256 as used by Ethereum (original Keccak padding, not NIST SHA3-256).
+
+``hashlib.sha3_256`` pads differently and gives other digests, so this is a
+plain Python Keccak-f[1600] over 64-bit lanes. Hashing event and function
+signatures goes through an LRU since the same few signatures are hashed over
+and over.
+"""
+
+from functools import lru_cache
+
+RATE = 136  # bytes absorbed per permutation for a 256-bit digest
+MASK = (1 << 64) - 1
+
+ROUND_CONSTANTS = (
+    0x0000000000000001, 0x0000000000008082, 0x800000000000808A, 0x8000000080008000,
+    0x000000000000808B, 0x0000000080000001, 0x8000000080008081, 0x8000000000008009,
+    0x000000000000008A, 0x0000000000000088, 0x0000000080008009, 0x000000008000000A,
+    0x000000008000808B, 0x800000000000008B, 0x8000000000008089, 0x8000000000008003,
+    0x8000000000008002, 0x8000000000000080, 0x000000000000800A, 0x800000008000000A,
+    0x8000000080008081, 0x8000000000008080, 0x0000000080000001, 0x8000000080008008,
+)  # fmt: skip
+
+# Rotation offsets indexed by lane position x + 5 * y
+ROTATIONS = (
+    0, 1, 62, 28, 27,
+    36, 44, 6, 55, 20,
+    3, 10, 43, 25, 39,
+    41, 45, 15, 21, 8,
+    18, 2, 61, 56, 14,
+)  # fmt: skip
+
+# Destination lane of each source lane in the combined rho/pi step
+PI = tuple((y + 5 * ((2 * x + 3 * y) % 5)) for y in range(5) for x in range(5))
+
+
+def _permute(lanes: list) -> None:
+    for rc in ROUND_CONSTANTS:
+        # theta
+        c = [
+            lanes[x] ^ lanes[x + 5] ^ lanes[x + 10] ^ lanes[x + 15] ^ lanes[x + 20]
+            for x in range(5)
+        ]
+        for x in range(5):
+            d = c[x - 1] ^ (((c[(x + 1) % 5] << 1) | (c[(x + 1) % 5] >> 63)) & MASK)
+            for y in range(0, 25, 5):
+                lanes[x + y] ^= d
+        # rho and pi
+        b = [0] * 25
+        for i in range(25):
+            r = ROTATIONS[i]
+            b[PI[i]] = ((lanes[i] << r) | (lanes[i] >> (64 - r))) & MASK if r else lanes[i]
+        # chi
+        for y in range(0, 25, 5):
+            row = b[y : y + 5]
+            for x in range(5):
+                lanes[x + y] = row[x] ^ (~row[(x + 1) % 5] & row[(x + 2) % 5])
+        # iota
+        lanes[0] ^= rc
+
+
+def keccak256(data: bytes) -> bytes:
+    padded = bytearray(data)
+    padded.append(0x01)
+    padded.extend(b"\x00" * (-len(padded) % RATE))
+    padded[-1] |= 0x80
+
+    lanes = [0] * 25
+    for offset in range(0, len(padded), RATE):
+        block = padded[offset : offset + RATE]
+        for i in range(RATE // 8):
+            lanes[i] ^= int.from_bytes(block[8 * i : 8 * i + 8], "little")
+        _permute(lanes)
+    return b"".join(lane.to_bytes(8, "little") for lane in lanes[:4])
+
+
+def split_params(params: str) -> list[str]:
+    """Split a comma separated parameter list, keeping tuples together."""
+    parts, depth, start = [], 0, 0
+    for i, char in enumerate(params):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            parts.append(params[start:i])
+            start = i + 1
+    parts.append(params[start:])
+    return [part.strip() for part in parts if part.strip()]
+
+
+def closing_paren(text: str, open_at: int) -> int:
+    depth = 0
+    for i in range(open_at, len(text)):
+        depth += text[i] == "("
+        depth -= text[i] == ")"
+        if depth == 0:
+            return i
+    raise ValueError(f"Unbalanced parentheses: {text}")
+
+
+def _canonical_type(param: str) -> str:
+    if param.startswith("("):
+        i = closing_paren(param, 0)
+        inner = ",".join(_canonical_type(p) for p in split_params(param[1:i]))
+        suffix = param[i + 1 :].split()[0] if param[i + 1 :].split() else ""
+        return f"({inner}){suffix if suffix.startswith('[') else ''}"
+    name = param.split()[0]
+    if name.startswith("tuple("):
+        return _canonical_type(name[5:] + param[len(name) :])
+    for short, full in (("uint", "uint256"), ("int", "int256")):
+        if name == short or name.startswith(short + "["):
+            return full + name[len(short) :]
+    return name
+
+
+@lru_cache(maxsize=4096)
+def canonical_signature(signature: str) -> str:
+    """Reduce a Solidity signature to the form that gets hashed.
+
+    Keywords, parameter names, ``indexed``/``memory`` qualifiers, trailing
+    modifiers such as ``view`` or ``returns (...)`` and whitespace are dropped
+    and ``uint``/``int`` are widened, e.g.
+    ``event Transfer(address indexed from, address indexed to, uint value)``
+    becomes ``Transfer(address,address,uint256)``.
+    """
+    signature = signature.strip()
+    for keyword in ("function ", "event ", "error "):
+        if signature.startswith(keyword):
+            signature = signature[len(keyword) :].strip()
+    open_at = signature.find("(")
+    if open_at <= 0:
+        raise ValueError(f"Invalid signature: {signature}")
+    name = signature[:open_at].strip()
+    params = split_params(signature[open_at + 1 : closing_paren(signature, open_at)])
+    return f"{name}({','.join(_canonical_type(p) for p in params)})"
+
+
+@lru_cache(maxsize=4096)
+def signature_hash(signature: str) -> bytes:
+    return keccak256(canonical_signature(signature).encode())
+
+
+def event_topic(signature: str) -> str:
+    return "0x" + signature_hash(signature).hex()
+
+
+def function_selector(signature: str) -> str:
+    return "0x" + signature_hash(signature)[:4].hex()
@@ -0,0 +1,166 @@
+"""
+Block-range splitting for eth_getLogs.
+
+Providers cap both the block range and the number of results of a single
+eth_getLogs call. ``get_logs`` resolves the requested range to block numbers,
+walks it in adaptive windows (halved when the provider refuses a window, doubled
+while results are sparse), fetches windows in parallel and returns the merged
+logs in (blockNumber, logIndex) order. A query spanning more than
+``EVM_LOGS_MAX_SPAN`` blocks or collecting more than ``EVM_LOGS_MAX_RESULTS``
+logs stops early and reports the first block it did not cover.
+"""
+
+import asyncio
+import re
+
+import httpx
+
+from common.config import settings
+from common.logger import get_logger
+from servers.evm.common.cache import block_ref
+
+logger = get_logger(__name__)
+
+# Provider messages meaning "ask for a smaller range"
+RANGE_ERROR = re.compile(
+    r"more than \d+ (results|logs|blocks)|too many (results|logs|blocks)|"
+    r"(block )?range (is )?(too large|too wide|too big|exceeds)|block range|"
+    r"response (size|is too big)|query timeout|timed out",
+    re.IGNORECASE,
+)
+
+# Throttling messages; splitting would only send more requests
+RATE_LIMIT_ERROR = re.compile(
+    r"rate limit|too many requests|request limit|daily request|quota|capacity|credits|\b429\b",
+    re.IGNORECASE,
+)
+
+# Windows returning fewer logs than this are considered sparse and grow
+SPARSE_RESULTS = 1000
+
+
+def is_range_error(error: Exception) -> bool:
+    if RATE_LIMIT_ERROR.search(str(error)):
+        return False
+    return isinstance(error, httpx.TimeoutException) or bool(RANGE_ERROR.search(str(error)))
+
+
+def _log_position(log: dict) -> tuple[int, int]:
+    return int(log.get("blockNumber") or "0x0", 16), int(log.get("logIndex") or "0x0", 16)
+
+
+async def resolve_block(adapter, block) -> int:
+    """Turn a block number or tag into a block number."""
+    kind, value = block_ref(block)
+    if kind == "number":
+        return value
+    if kind == "hash":
+        raise ValueError("Block hashes are not valid range bounds; use block_hash instead")
+    if value == "earliest":
+        return 0
+    if value in ("latest", "pending"):
+        # Tracked head state may lag by a few blocks; ask the node
+        return int(await adapter.eth_blockNumber(), 16)
+    head = getattr(adapter, "head", None)
+    number = head.block_number(value) if head else None
+    if number is not None:
+        return number
+    block = await adapter.eth_getBlockByNumber(value, False)
+    if not block:
+        raise ValueError(f"Block '{value}' is not available")
+    return int(block["number"], 16)
+
+
+async def get_logs(
+    adapter,
+    log_filter: dict,
+    window: int = None,
+    max_window: int = None,
+    concurrency: int = None,
+    max_span: int = None,
+    max_results: int = None,
+) -> tuple[list[dict], int]:
+    """Run eth_getLogs over a wide block range.
+
+    Returns the logs and the first block left out, or None when the whole range
+    was covered. Blocks past ``max_span`` are left out, and no new windows start
+    once ``max_results`` logs have been collected; windows already started (and
+    their split halves) are still finished, so the logs returned cover a
+    contiguous range from ``fromBlock`` and the next block is past it. At most
+    ``concurrency`` windows are in flight at once. A window the provider rejects
+    as too large is split in half until it is a single block; any other error
+    is raised unchanged.
+    """
+    if "blockHash" in log_filter:
+        return await adapter.eth_getLogs(log_filter), None
+
+    window = window or settings.EVM_LOGS_WINDOW
+    max_window = max_window or settings.EVM_LOGS_MAX_WINDOW
+    concurrency = concurrency or settings.EVM_LOGS_CONCURRENCY
+    max_span = max_span or settings.EVM_LOGS_MAX_SPAN
+    max_results = max_results or settings.EVM_LOGS_MAX_RESULTS
+
+    first, requested_last = await asyncio.gather(
+        resolve_block(adapter, log_filter.get("fromBlock", "latest")),
+        resolve_block(adapter, log_filter.get("toBlock", "latest")),
+    )
+    if first > requested_last:
+        return [], None
+    last = min(requested_last, first + max_span - 1)
+
+    cursor = first
+    retry: list[tuple[int, int]] = []  # halves of windows that were split
+    done: list[tuple[int, int]] = []  # block ranges fetched
+    results: list[dict] = []
+
+    def next_range():
+        nonlocal cursor
+        # Split halves all lie below the cursor and must be finished even past
+        # the result cap, or a refused first window would leave nothing covered
+        if retry:
+            return retry.pop()
+        if cursor > last or len(results) >= max_results:
+            return None
+        start, cursor = cursor, min(last, cursor + window - 1) + 1
+        return start, cursor - 1
+
+    async def worker():
+        nonlocal window
+        while (block_range := next_range()) is not None:
+            start, end = block_range
+            try:
+                logs = await adapter.eth_getLogs(
+                    {**log_filter, "fromBlock": hex(start), "toBlock": hex(end)}
+                )
+            except Exception as e:
+                if start == end or not is_range_error(e):
+                    raise
+                middle = (start + end) // 2
+                window = max(1, min(window, middle - start + 1))
+                logger.info(f"Splitting eth_getLogs window {start}-{end}: {e}")
+                retry.append((middle + 1, end))
+                retry.append((start, middle))
+                continue
+            results.extend(logs or [])
+            done.append(block_range)
+            if len(logs or []) < SPARSE_RESULTS and end - start + 1 >= window:
+                window = min(max_window, window * 2)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+    try:
+        await asyncio.gather(*workers)
+    finally:
+        # Stop the remaining windows as soon as one of them fails
+        for task in workers:
+            task.cancel()
+
+    # Windows finish out of order; keep only the contiguous prefix from the start
+    covered = first - 1
+    for start, end in sorted(done):
+        if start > covered + 1:
+            break
+        covered = max(covered, end)
+    if covered < requested_last:
+        results = [log for log in results if _log_position(log)[0] <= covered]
+    results.sort(key=_log_position)
+    return results, (covered + 1 if covered < requested_last else None)
@@ -0,0 +1,174 @@
+"""
+Batching of many eth_call requests through the Multicall3 contract.
+
+Calls are packed into ``aggregate3`` invocations, split into chunks by call
+count, calldata size and estimated gas, and the chunks are executed
+concurrently. On chains where Multicall3 is not deployed the contract code is
+injected with a state override (``MULTICALL3_BYTECODE``, or the built-in
+``AGGREGATE3_RUNTIME``); if that fails too the calls are sent as individual
+eth_call requests.
+"""
+
+from common.concurrency import gather_limited
+from common.config import settings
+from common.logger import get_logger
+from servers.evm.common.abi import (
+    WORD,
+    encode_address,
+    encode_bool,
+    encode_bytes,
+    encode_uint,
+    function_call,
+    read_bytes,
+    read_uint,
+    to_bytes,
+    to_hex,
+)
+
+logger = get_logger(__name__)
+
+AGGREGATE3_SELECTOR = "82ad56cb"  # aggregate3((address,bool,bytes)[])
+BALANCE_OF_SELECTOR = "70a08231"  # balanceOf(address)
+
+# Runtime code answering any call as aggregate3((address,bool,bytes)[]): each
+# call is forwarded with all remaining gas, a failing call with allowFailure
+# false reverts with its revert data, and (bool,bytes)[] is returned. Injected
+# where Multicall3 is missing; it avoids PUSH0 so it runs on pre-Shanghai chains.
+AGGREGATE3_RUNTIME = (
+    "0x6004356004018035602060005280602052906020019060008160051b6040015b828210156100b057"
+    "604081038260051b604001528160051b840135840180604001358101803580826020018560600137"
+    "600060008286606001600087355af180610077578360200135610077573d600060003e3d6000fd5b"
+    "8452505050604081602001523d81604001523d6000826060013e60003d826060010152601f3d01601f"
+    "191601606001906001019061001f565b6000f3"
+)
+
+
+def encode_aggregate3(calls: list[dict], allow_failure: bool = True) -> str:
+    """Calldata for aggregate3 over calls given as {"to": ..., "data": ...}."""
+    tails = [
+        encode_address(call["to"])
+        + encode_bool(call.get("allowFailure", allow_failure))
+        + encode_uint(3 * WORD)
+        + encode_bytes(to_bytes(call.get("data")))
+        for call in calls
+    ]
+    offsets = []
+    position = len(calls) * WORD
+    for tail in tails:
+        offsets.append(encode_uint(position))
+        position += len(tail)
+    body = encode_uint(WORD) + encode_uint(len(calls)) + b"".join(offsets) + b"".join(tails)
+    return "0x" + AGGREGATE3_SELECTOR + body.hex()
+
+
+def decode_aggregate3(result: str) -> list[dict]:
+    """Decode the (bool success, bytes returnData)[] returned by aggregate3."""
+    data = to_bytes(result)
+    array = read_uint(data, 0)
+    head = array + WORD
+    decoded = []
+    for i in range(read_uint(data, array)):
+        item = head + read_uint(data, head + i * WORD)
+        return_data = read_bytes(data, item + read_uint(data, item + WORD))
+        decoded.append({"success": bool(read_uint(data, item)), "returnData": to_hex(return_data)})
+    return decoded
+
+
+def plan_chunks(
+    calls: list[dict], max_calls: int, max_calldata: int, max_gas: int = None, call_gas: int = None
+) -> list[list[dict]]:
+    """Group calls so that no chunk exceeds ``max_calls``, ``max_calldata`` bytes or ``max_gas``.
+
+    A call's gas is its optional "gas" field, else ``call_gas``; without
+    ``max_gas`` gas is not counted.
+    """
+    chunks, current, size, gas = [], [], 0, 0
+    for call in calls:
+        # Each call costs its padded calldata plus five head/tail words
+        call_size = len(to_bytes(call.get("data"))) + 5 * WORD
+        cost = int(call.get("gas") or call_gas or 0)
+        if current and (
+            len(current) >= max_calls
+            or size + call_size > max_calldata
+            or (max_gas and gas + cost > max_gas)
+        ):
+            chunks.append(current)
+            current, size, gas = [], 0, 0
+        current.append(call)
+        size += call_size
+        gas += cost
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+async def multicall(
+    adapter,
+    calls: list[dict],
+    block: str = "latest",
+    allow_failure: bool = True,
+    max_calls: int = None,
+    max_calldata: int = None,
+    concurrency: int = None,
+    max_gas: int = None,
+) -> list[dict]:
+    """Execute read-only calls in as few eth_call round trips as possible.
+
+    Returns one {"success", "returnData"} entry per call, in input order. With
+    ``allow_failure`` false a single reverting call fails the whole request.
+    """
+    if not calls:
+        return []
+    chunks = plan_chunks(
+        calls,
+        max_calls or settings.MULTICALL_MAX_CALLS,
+        max_calldata or settings.MULTICALL_MAX_CALLDATA,
+        max_gas or settings.MULTICALL_MAX_GAS,
+        settings.MULTICALL_CALL_GAS,
+    )
+    concurrency = concurrency or settings.MULTICALL_CONCURRENCY
+    address = settings.MULTICALL3_ADDRESS
+
+    async def run_chunk(chunk: list[dict], overrides: dict = None):
+        call_object = {"to": address, "data": encode_aggregate3(chunk, allow_failure)}
+        result = await adapter.eth_call(call_object, block, overrides)
+        # A call to an address without code succeeds with empty return data
+        return decode_aggregate3(result) if result not in (None, "0x") else None
+
+    results = await gather_limited((run_chunk(chunk) for chunk in chunks), concurrency)
+    if None not in results:
+        return [item for chunk in results for item in chunk]
+
+    code = settings.MULTICALL3_BYTECODE or AGGREGATE3_RUNTIME
+    if code != "0x":
+        logger.info(f"Multicall3 not deployed at {address}, injecting it with a state override")
+        overrides = {address: {"code": code}}
+        try:
+            results = await gather_limited(
+                (run_chunk(chunk, overrides) for chunk in chunks), concurrency
+            )
+        except Exception as e:
+            # Not every node accepts state overrides; a strict revert recurs below
+            logger.info(f"State override rejected: {e}")
+            results = [None]
+        if None not in results:
+            return [item for chunk in results for item in chunk]
+
+    logger.info(f"Multicall3 not available at {address}, sending calls individually")
+    return await gather_limited(
+        (_single_call(adapter, call, block, allow_failure) for call in calls), concurrency
+    )
+
+
+async def _single_call(adapter, call: dict, block: str, allow_failure: bool) -> dict:
+    try:
+        result = await adapter.eth_call({"to": call["to"], "data": call.get("data")}, block)
+    except Exception as e:
+        if not call.get("allowFailure", allow_failure):
+            raise
+        return {"success": False, "returnData": "0x", "error": str(e)}
+    return {"success": True, "returnData": result}
+
+
+def balance_of_call(token: str, owner: str) -> dict:
+    return {"to": token, "data": function_call(BALANCE_OF_SELECTOR, encode_address(owner))}
@@ -2,16 +2,10 @@
 Reusable base class for all EVM-compatible blockchain adapters.
 """
 
-from common.interfaces import RpcClient
-from common.rpc import HttpxRpcClient
-from servers.evm.common.interfaces import BlockchainAdapter
+from servers.evm.common.base_adapter import EvmBaseAdapter
 
 
-class EvmAdapter(BlockchainAdapter):
-    def __init__(self, rpc_url: str, rpc_client: RpcClient = None):
-        self.rpc_url = rpc_url
-        self.rpc_client = rpc_client or HttpxRpcClient()
-
+class EvmAdapter(EvmBaseAdapter):
     async def web3_clientVersion(self) -> str:
         return await self.rpc_client.post("web3_clientVersion", [], self.rpc_url)
 
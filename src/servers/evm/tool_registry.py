@@ -1,8 +1,10 @@
 # src/servers/evm/tool_registry.py
 from mcp.server.fastmcp import FastMCP
 
+from common.rpc import rpc_lifespan
+
 # Global MCP instance
-mcp = FastMCP("EvmJsonRpcNodeMCP")
+mcp = FastMCP("EvmJsonRpcNodeMCP", lifespan=rpc_lifespan)
 
 
 def get_mcp_server():
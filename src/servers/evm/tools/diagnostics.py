@@ -0,0 +1,68 @@
+"""MCP tools exposing runtime statistics of the EVM server."""
+
+from mcp.types import CallToolResult
+
+from common import diagnostics
+from common.utils import _err, _ok
+from servers.evm.common.client import _adapter
+from servers.evm.tool_registry import mcp
+
+
+@mcp.tool(
+    name="get_rpc_cache_stats",
+    description="""
+    Returns response cache statistics for a blockchain: number of cached entries,
+    capacity and per-method hit/miss counters with hit rate. When the persistent disk
+    cache is enabled, its size and hit counters, including warm-start hits on
+    entries written before the last restart, are included under "disk".
+
+    Parameters:
+    - chain (str): Blockchain name. Run get_supported_blockchains tool to get the list of supported blockchains.
+    """,
+    annotations={"title": "RPC response cache statistics", "readOnlyHint": True},
+)
+def get_rpc_cache_stats(chain: str) -> CallToolResult:
+    try:
+        return _ok(diagnostics.cache_stats(_adapter(chain.lower())))
+    except Exception as e:
+        return _err(str(e))
+
+
+@mcp.tool(
+    name="get_rpc_endpoint_stats",
+    description="""
+    Returns per-endpoint routing statistics for a blockchain configured with several
+    RPC endpoints: EWMA latency, EWMA error rate, request/failure/selection counts
+    and whether the endpoint is currently healthy or ejected after failures.
+
+    Parameters:
+    - chain (str): Blockchain name. Run get_supported_blockchains tool to get the list of supported blockchains.
+    """,
+    annotations={"title": "RPC endpoint statistics", "readOnlyHint": True},
+)
+def get_rpc_endpoint_stats(chain: str) -> CallToolResult:
+    try:
+        return _ok(diagnostics.endpoint_stats(_adapter(chain.lower())))
+    except Exception as e:
+        return _err(str(e))
+
+
+@mcp.tool(
+    name="get_chain_head",
+    description="""
+    Returns the chain head tracked in the background, without a network call:
+    number, hash, parentHash, timestamp and baseFeePerGas of the latest block,
+    safe and finalized block numbers, and staleness_s, the seconds since the last update.
+    Tracking starts on the first request for a chain, so the first call may
+    not have a head yet.
+
+    Parameters:
+    - chain (str): Blockchain name. Run get_supported_blockchains tool to get the list of supported blockchains.
+    """,
+    annotations={"title": "Chain head", "readOnlyHint": True},
+)
+def get_chain_head(chain: str) -> CallToolResult:
+    try:
+        return _ok(diagnostics.chain_head(_adapter(chain.lower())))
+    except Exception as e:
+        return _err(str(e))
@@ -3,7 +3,9 @@
 from mcp.types import CallToolResult
 
 import servers.evm.common.client as client
+from common.projection import parse_fields, project
 from common.utils import _err, _ok
+from servers.evm.common.abi_registry import get_abi_registry
 from servers.evm.tool_registry import mcp
 
 
@@ -37,7 +39,8 @@ async def web3_clientVersion(chain: str) -> CallToolResult:
     name="web3_sha3",
     description=(
         "Call the web3_sha3 JSON-RPC method to compute the Keccak-256 (not the standardized SHA3-256) hash of the provided data.\n\n"
-        "Description: Returns Keccak-256 (not the standardized SHA3-256) of the given data.\n\n"
+        "Description: Returns Keccak-256 (not the standardized SHA3-256) of the given data. "
+        "The hash is computed locally without a network call unless WEB3_SHA3_REMOTE is set.\n\n"
         "Parameters:\n"
         "- chain (str): Blockchain name. Run get_supported_blockchains tool to get the list of supported blockchains.\n"
         "- data (str): The data to convert into a SHA3 hash (must be a hex string with 0x prefix).\n\n"
@@ -439,8 +442,10 @@ async def eth_getCode(chain: str, address: str, block: str) -> CallToolResult:
         "- override_nonce (str, optional): Fake nonce (hex).\n"
         "- override_code (str, optional): Fake EVM bytecode (hex).\n"
         "- override_state (dict, optional): Full key-value storage overrides.\n"
-        "- override_state_diff (dict, optional): Partial key-value storage diff overrides.\n\n"
-        "Returns: Hex-encoded result of the contract method execution.\n\n"
+        "- override_state_diff (dict, optional): Partial key-value storage diff overrides.\n"
+        "- decode (bool, optional): Decode the return data using the ABI of the called function (default: False).\n\n"
+        "Returns: Hex-encoded result of the contract method execution. With decode=True and a known function selector, "
+        "an object with the function signature and named outputs instead.\n\n"
         "Example:\n"
         'curl -X POST https://nd-422-757-666.p2pify.com/key -H "Content-Type: application/json" -d \'\n'
         "{\n"
@@ -471,6 +476,7 @@ async def eth_call(
     override_code: str = None,
     override_state: dict = None,
     override_state_diff: dict = None,
+    decode: bool = False,
 ) -> CallToolResult:
     try:
         call_object = {
@@ -501,7 +507,10 @@ async def eth_call(
             if override_state_diff:
                 overrides[override_address]["stateDiff"] = override_state_diff
 
-        return _ok(await client.eth_call(chain.lower(), call_object, block, overrides))
+        result = await client.eth_call(chain.lower(), call_object, block, overrides)
+        if decode:
+            result = get_abi_registry().decode_output(data, result) or result
+        return _ok(result)
     except Exception as e:
         return _err(str(e))
 
@@ -594,7 +603,8 @@ async def eth_estimateGas(
         "Parameters:\n"
         "- chain (str): Blockchain name. Run get_supported_blockchains tool to get the list of supported blockchains..\n"
         "- block_hash (str): The hash of the block.\n"
-        "- full_tx (bool): Whether to return full transaction objects or only hashes.\n\n"
+        "- full_tx (bool): Whether to return full transaction objects or only hashes.\n"
+        "- fields (str, optional): Comma-separated paths to return, e.g. 'hash,timestamp,gasUsed,transactions.hash,transactions.from'. Nested paths use dots and apply to every element of arrays. Default returns everything.\n\n"
         "Returns: A block object or null if not found.\n\n"
         "Example:\n"
         'curl -X POST https://nd-422-757-666.p2pify.com/key -H "Content-Type: application/json" -d \'\n'
@@ -607,9 +617,11 @@ async def eth_estimateGas(
     ),
     annotations={"title": "eth_getBlockByHash", "readOnlyHint": True},
 )
-async def eth_getBlockByHash(chain: str, block_hash: str, full_tx: bool) -> CallToolResult:
+async def eth_getBlockByHash(
+    chain: str, block_hash: str, full_tx: bool, fields: str = None
+) -> CallToolResult:
     try:
-        return _ok(await client.eth_getBlockByHash(chain.lower(), block_hash, full_tx))
+        return _ok(await client.get_block(chain.lower(), block_hash, full_tx, fields))
     except Exception as e:
         return _err(str(e))
 
@@ -622,7 +634,8 @@ async def eth_getBlockByHash(chain: str, block_hash: str, full_tx: bool) -> Call
         "Parameters:\n"
         "- chain (str): Blockchain name. Run get_supported_blockchains tool to get the list of supported blockchains..\n"
         "- block_number (str): The block number or keyword like 'latest'.\n"
-        "- full_tx (bool): Whether to return full transaction objects or only hashes.\n\n"
+        "- full_tx (bool): Whether to return full transaction objects or only hashes.\n"
+        "- fields (str, optional): Comma-separated paths to return, e.g. 'hash,timestamp,gasUsed,transactions.hash,transactions.from'. Nested paths use dots and apply to every element of arrays. Default returns everything.\n\n"
         "Returns: A block object or null if not found.\n\n"
         "Example:\n"
         'curl -X POST https://nd-422-757-666.p2pify.com/key -H "Content-Type: application/json" -d \'\n'
@@ -635,9 +648,11 @@ async def eth_getBlockByHash(chain: str, block_hash: str, full_tx: bool) -> Call
     ),
     annotations={"title": "eth_getBlockByNumber", "readOnlyHint": True},
 )
-async def eth_getBlockByNumber(chain: str, block_number: str, full_tx: bool) -> CallToolResult:
+async def eth_getBlockByNumber(
+    chain: str, block_number: str, full_tx: bool, fields: str = None
+) -> CallToolResult:
     try:
-        return _ok(await client.eth_getBlockByNumber(chain.lower(), block_number, full_tx))
+        return _ok(await client.get_block(chain.lower(), block_number, full_tx, fields))
     except Exception as e:
         return _err(str(e))
 
@@ -703,7 +718,9 @@ async def eth_getBlockTransactionCountByNumber(chain: str, block_number: str) ->
         "Description: Returns the information about a transaction requested by transaction hash.\n\n"
         "Parameters:\n"
         "- chain (str): Blockchain name. Run get_supported_blockchains tool to get the list of supported blockchains..\n"
-        "- tx_hash (str): The hash of the transaction.\n\n"
+        "- tx_hash (str): The hash of the transaction.\n"
+        "- decode (bool, optional): Add a decodedInput field with the called function and its arguments when the selector is known (default: False).\n"
+        "- fields (str, optional): Comma-separated paths to return, e.g. 'from,to,value,decodedInput'. Nested paths use dots and apply to every element of arrays. Default returns everything.\n\n"
         "Returns: A transaction object or null if not found.\n\n"
         "Example:\n"
         'curl -X POST https://nd-422-757-666.p2pify.com/key -H "Content-Type: application/json" -d \'\n'
@@ -716,9 +733,14 @@ async def eth_getBlockTransactionCountByNumber(chain: str, block_number: str) ->
     ),
     annotations={"title": "eth_getTransactionByHash", "readOnlyHint": True},
 )
-async def eth_getTransactionByHash(chain: str, tx_hash: str) -> CallToolResult:
+async def eth_getTransactionByHash(
+    chain: str, tx_hash: str, decode: bool = False, fields: str = None
+) -> CallToolResult:
     try:
-        return _ok(await client.eth_getTransactionByHash(chain.lower(), tx_hash))
+        tx = await client.eth_getTransactionByHash(chain.lower(), tx_hash)
+        if decode and tx:
+            tx = {**tx, "decodedInput": get_abi_registry().decode_input(tx.get("input"))}
+        return _ok(project(tx, parse_fields(fields)))
     except Exception as e:
         return _err(str(e))
 
@@ -731,7 +753,8 @@ async def eth_getTransactionByHash(chain: str, tx_hash: str) -> CallToolResult:
         "Returns null if the transaction is not yet mined or not found.\n\n"
         "Parameters:\n"
         "- chain (str): Blockchain name. Run get_supported_blockchains tool to get the list of supported blockchains..\n"
-        "- tx_hash (str): The hash of the transaction to query.\n\n"
+        "- tx_hash (str): The hash of the transaction to query.\n"
+        "- fields (str, optional): Comma-separated paths to return, e.g. 'status,gasUsed,effectiveGasPrice,logs.address'. Nested paths use dots and apply to every element of arrays. Default returns everything.\n\n"
         "Returns: A transaction receipt object or null.\n\n"
         "Returned object includes:\n"
         "- blockHash: Hash of the block where the transaction was included.\n"
@@ -760,9 +783,10 @@ async def eth_getTransactionByHash(chain: str, tx_hash: str) -> CallToolResult:
     ),
     annotations={"title": "eth_getTransactionReceipt", "readOnlyHint": True},
 )
-async def eth_getTransactionReceipt(chain: str, tx_hash: str) -> CallToolResult:
+async def eth_getTransactionReceipt(chain: str, tx_hash: str, fields: str = None) -> CallToolResult:
     try:
-        return _ok(await client.eth_getTransactionReceipt(chain.lower(), tx_hash))
+        receipt = await client.eth_getTransactionReceipt(chain.lower(), tx_hash)
+        return _ok(project(receipt, parse_fields(fields)))
     except Exception as e:
         return _err(str(e))
 
@@ -778,8 +802,13 @@ async def eth_getTransactionReceipt(chain: str, tx_hash: str) -> CallToolResult:
         "- to_block (str, optional): End block number or tag.\n"
         "- address (str, optional): Address of the contract to filter logs for.\n"
         "- topics (list[str], optional): List of topic filters (e.g., event signature hashes).\n"
-        "- block_hash (str, optional): Specific block hash to filter logs (cannot be used with fromBlock/toBlock).\n\n"
-        "Returns: An array of log objects.\n\n"
+        "- block_hash (str, optional): Specific block hash to filter logs (cannot be used with fromBlock/toBlock).\n"
+        "- decode (bool, optional): Decode logs of known events into rows with the event signature and named arguments (default: False). "
+        "Logs of unknown events are returned unchanged.\n\n"
+        "Wide block ranges are split into smaller windows automatically and fetched in parallel, so there is no need to page through the range manually.\n\n"
+        "Returns: An array of log objects ordered by block number and log index. "
+        "If the range is too wide or matches too many logs to return at once, an object "
+        "{logs, nextFromBlock} is returned instead; call again with from_block=nextFromBlock to continue.\n\n"
         "Each log object includes:\n"
         "- address: Address that emitted the log.\n"
         "- topics: List of indexed event parameters (first topic is the event signature).\n"
@@ -808,6 +837,7 @@ async def eth_getLogs(
     address: str = None,
     topics: list[str] = None,
     block_hash: str = None,
+    decode: bool = False,
 ) -> CallToolResult:
     try:
         filter_params = {}
@@ -822,7 +852,11 @@ async def eth_getLogs(
         if block_hash:
             filter_params["blockHash"] = block_hash
 
-        return _ok(await client.eth_getLogs(chain.lower(), filter_params))
+        logs, next_block = await client.get_logs(chain.lower(), filter_params)
+        logs = get_abi_registry().decode_logs(logs) if decode else logs
+        if next_block is None:
+            return _ok(logs)
+        return _ok({"logs": logs, "nextFromBlock": hex(next_block)})
     except Exception as e:
         return _err(str(e))
 
@@ -1117,7 +1151,8 @@ async def debug_traceBlockByHash(
         "- tracer (str, optional): Tracer type (e.g., 'callTracer', 'prestateTracer').\n"
         "- only_top_call (bool, optional): If true, traces only top-level calls.\n"
         "- diff_mode (bool, optional): If true, includes pre/post state differences.\n"
-        "- timeout (str, optional): Optional timeout (e.g., '5s').\n\n"
+        "- timeout (str, optional): Optional timeout (e.g., '5s').\n"
+        "- max_results (int, optional): Return only the first N transaction traces. The response is parsed as it streams in, so the rest of the block is never held in memory.\n\n"
         "Returns: A list of transaction trace objects, each with:\n"
         "- type: Type of call (CALL, STATICCALL, etc).\n"
         "- from / to: Sender and receiver addresses.\n"
@@ -1143,6 +1178,7 @@ async def debug_traceBlockByNumber(
     only_top_call: bool = None,
     diff_mode: bool = None,
     timeout: str = None,
+    max_results: int = None,
 ) -> CallToolResult:
     try:
         options = {}
@@ -1160,6 +1196,12 @@ async def debug_traceBlockByNumber(
         if timeout:
             options["timeout"] = timeout
 
+        if max_results is not None:
+            return _ok(
+                await client.collect(
+                    chain.lower(), "debug_traceBlockByNumber", [block_number, options], max_results
+                )
+            )
         return _ok(await client.debug_traceBlockByNumber(chain.lower(), block_number, options))
     except Exception as e:
         return _err(str(e))
@@ -1535,7 +1577,8 @@ async def eth_simulateV1(
         "Description: Returns all transaction receipts for a given block.\n\n"
         "Parameters:\n"
         "- chain (str): Blockchain name. Run get_supported_blockchains tool to get the list of supported blockchains.\n"
-        "- block (str): Block number (hex) or keyword like 'latest', 'earliest', or 'pending'.\n\n"
+        "- block (str): Block number (hex) or keyword like 'latest', 'earliest', or 'pending'.\n"
+        "- fields (str, optional): Comma-separated paths to return, e.g. 'transactionHash,status,gasUsed'. Nested paths use dots and apply to every receipt. Default returns everything.\n\n"
         "Returns: Array of transaction receipt objects for all transactions in the block.\n\n"
         "Example:\n"
         'curl -X POST https://nd-422-757-666.p2pify.com/key -H "Content-Type: application/json" -d \'\n'
@@ -1548,8 +1591,9 @@ async def eth_simulateV1(
     ),
     annotations={"title": "eth_getBlockReceipts", "readOnlyHint": True},
 )
-async def eth_getBlockReceipts(chain: str, block: str) -> CallToolResult:
+async def eth_getBlockReceipts(chain: str, block: str, fields: str = None) -> CallToolResult:
     try:
-        return _ok(await client.eth_getBlockReceipts(chain.lower(), block))
+        receipts = await client.eth_getBlockReceipts(chain.lower(), block)
+        return _ok(project(receipts, parse_fields(fields)))
     except Exception as e:
         return _err(str(e))
@@ -0,0 +1,79 @@
+"""MCP tools that aggregate many eth_call requests through Multicall3."""
+
+from mcp.types import CallToolResult
+
+import servers.evm.common.client as client
+from common.utils import _err, _ok
+from servers.evm.common.abi import decode_uint
+from servers.evm.common.multicall import balance_of_call
+from servers.evm.tool_registry import mcp
+
+
+@mcp.tool(
+    name="multicall",
+    description="""
+    Executes many read-only contract calls in a few eth_call requests using the Multicall3
+    aggregate3 function. Prefer this over repeated eth_call tool invocations.
+
+    Parameters:
+    - chain (str): Blockchain name. Run get_supported_blockchains tool to get the list of supported blockchains.
+    - calls (list[dict]): Calls to execute, each {"to": "0x...", "data": "0x..."}. Optional
+      "allowFailure" (bool) overrides allow_failure for that call, and optional "gas" (int)
+      estimates its cost so expensive calls are spread over more requests.
+    - block (str, optional): Block number or tag. Default is 'latest'.
+    - allow_failure (bool, optional): If false, any reverting call fails the whole request. Default is true.
+
+    Returns: One entry per call, in input order, with:
+    - success: Whether the call succeeded.
+    - returnData: Hex-encoded return data (revert data if the call failed).
+    """,
+    annotations={"title": "Multicall3 aggregate", "readOnlyHint": True},
+)
+async def multicall(
+    chain: str,
+    calls: list[dict],
+    block: str = "latest",
+    allow_failure: bool = True,
+) -> CallToolResult:
+    try:
+        return _ok(await client.aggregate_calls(chain.lower(), calls, block, allow_failure))
+    except Exception as e:
+        return _err(str(e))
+
+
+@mcp.tool(
+    name="get_erc20_balances",
+    description="""
+    Returns ERC-20 balanceOf for every combination of token and owner address, fetched
+    in bulk with Multicall3.
+
+    Parameters:
+    - chain (str): Blockchain name. Run get_supported_blockchains tool to get the list of supported blockchains.
+    - tokens (list[str]): ERC-20 token contract addresses.
+    - owners (list[str]): Holder addresses.
+    - block (str, optional): Block number or tag. Default is 'latest'.
+
+    Returns: A list of {"token", "owner", "balance"} objects. The balance is an integer in the
+    token's smallest unit, or null if the call failed.
+    """,
+    annotations={"title": "Bulk ERC-20 balances", "readOnlyHint": True},
+)
+async def get_erc20_balances(
+    chain: str,
+    tokens: list[str],
+    owners: list[str],
+    block: str = "latest",
+) -> CallToolResult:
+    try:
+        pairs = [(token, owner) for token in tokens for owner in owners]
+        calls = [balance_of_call(token, owner) for token, owner in pairs]
+        results = await client.aggregate_calls(chain.lower(), calls, block)
+        balances = []
+        for (token, owner), result in zip(pairs, results):
+            balance = None
+            if result["success"] and len(result["returnData"]) >= 66:
+                balance = decode_uint(result["returnData"])
+            balances.append({"token": token, "owner": owner, "balance": balance})
+        return _ok(balances)
+    except Exception as e:
+        return _err(str(e))
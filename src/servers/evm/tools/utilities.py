@@ -5,7 +5,14 @@ import datetime
 from mcp.types import CallToolResult
 
 from common.utils import _err, _ok
+from servers.evm.common.abi import to_bytes, to_hex
 from servers.evm.common.adapter_registry import registry
+from servers.evm.common.keccak import (
+    canonical_signature,
+    event_topic,
+    function_selector,
+    keccak256,
+)
 from servers.evm.tool_registry import mcp
 
 
@@ -109,3 +116,69 @@ def format_gas_price_in_gwei(gas_price: str) -> CallToolResult:
         return _ok(wei / 1e9)
     except Exception as e:
         return _err(str(e))
+
+
+@mcp.tool(
+    name="keccak256",
+    description="""
+    Computes Keccak-256 hashes locally, the same hash as web3_sha3, for one or many
+    inputs in a single call.
+
+    Parameters:
+    - data (list[str]): Inputs to hash. Hex strings with 0x prefix by default.
+    - encoding (str): 'hex' (default) for 0x-prefixed hex input or 'utf8' to hash text.
+
+    Example:
+    keccak256(["0x68656c6c6f20776f726c64"]) -> ["0x47173285a8d7341e5e972fc677286384f802f8ef42a5ec5f03bbfa254cb01fad"]
+    keccak256(["hello world"], "utf8") -> ["0x47173285a8d7341e5e972fc677286384f802f8ef42a5ec5f03bbfa254cb01fad"]
+    """,
+    annotations={"title": "Keccak-256 hash", "readOnlyHint": True},
+)
+def keccak256_hash(data: list[str], encoding: str = "hex") -> CallToolResult:
+    try:
+        if encoding not in ("hex", "utf8"):
+            return _err(f"Unsupported encoding: {encoding}")
+        decode = to_bytes if encoding == "hex" else str.encode
+        return _ok([to_hex(keccak256(decode(item))) for item in data])
+    except Exception as e:
+        return _err(str(e))
+
+
+@mcp.tool(
+    name="get_event_topics",
+    description="""
+    Computes event topics (topic0, the Keccak-256 of the canonical signature) for
+    one or many event signatures. Parameter names, 'indexed' and the 'event'
+    keyword are ignored, so signatures can be copied from Solidity source.
+
+    Example:
+    get_event_topics(["Transfer(address indexed from, address indexed to, uint256 value)"])
+    -> {"Transfer(address,address,uint256)": "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"}
+    """,
+    annotations={"title": "Event signatures to topics", "readOnlyHint": True},
+)
+def get_event_topics(signatures: list[str]) -> CallToolResult:
+    try:
+        return _ok({canonical_signature(s): event_topic(s) for s in signatures})
+    except Exception as e:
+        return _err(str(e))
+
+
+@mcp.tool(
+    name="get_function_selectors",
+    description="""
+    Computes 4-byte function selectors for one or many function signatures.
+    Parameter names, modifiers, return types and the 'function' keyword are
+    ignored, so signatures can be copied from Solidity source.
+
+    Example:
+    get_function_selectors(["function balanceOf(address owner) view returns (uint256)"])
+    -> {"balanceOf(address)": "0x70a08231"}
+    """,
+    annotations={"title": "Function signatures to selectors", "readOnlyHint": True},
+)
+def get_function_selectors(signatures: list[str]) -> CallToolResult:
+    try:
+        return _ok({canonical_signature(s): function_selector(s) for s in signatures})
+    except Exception as e:
+        return _err(str(e))
@@ -0,0 +1 @@
+"""Pump.fun common modules."""
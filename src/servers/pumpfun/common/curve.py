@@ -0,0 +1,238 @@
+"""
+Pump.fun bonding curve account layout and bulk parsing.
+
+A bonding curve account is an 8-byte discriminator followed by five
+little-endian u64 fields and a bool (newer accounts append the creator key,
+which is ignored here). ``parse_bonding_curves`` decodes any number of
+accounts into ``CurveColumns``, one ``array`` per field, and ``curve_metrics``
+computes price, progress and market cap for every curve in one pass over those
+columns.
+
+For bulk parsing each account body is padded to six 8-byte words, so the whole
+batch is read into a single ``array("Q")`` and every column is a strided slice
+of it; only the prefix that holds the curve fields is decoded.
+"""
+
+import base64
+import binascii
+import heapq
+import struct
+import sys
+from array import array
+
+import base58
+
+LAMPORTS_PER_SOL = 1_000_000_000
+TOKEN_DECIMALS = 6
+EXPECTED_DISCRIMINATOR = struct.pack("<Q", 6966180631402821399)
+
+# Pump.fun supply constants (with 6 decimals)
+TOTAL_SUPPLY = 1_000_000_000_000_000  # 1B tokens
+RESERVED_TOKENS = 206_900_000_000_000  # 206.9M tokens reserved for migration
+INITIAL_REAL_TOKEN_RESERVES = TOTAL_SUPPLY - RESERVED_TOKENS  # 793.1M tokens
+
+CURVE_LAYOUT = struct.Struct("<QQQQQ?")
+CURVE_SIZE = len(EXPECTED_DISCRIMINATOR) + CURVE_LAYOUT.size
+
+# Padding that widens the trailing bool to a full word in the bulk buffer
+_ROW_PAD = bytes(-CURVE_LAYOUT.size % 8)
+_ROW_WORDS = (CURVE_LAYOUT.size + len(_ROW_PAD)) // 8
+# Offset and length of the curve fields, for getProgramAccounts dataSlice
+FIELDS_SLICE = {"offset": len(EXPECTED_DISCRIMINATOR), "length": CURVE_LAYOUT.size}
+# Offsets of the fields the graduation filters compare
+REAL_TOKEN_RESERVES_OFFSET = 8 + 2 * 8
+COMPLETE_OFFSET = 8 + 5 * 8
+
+FIELDS = (
+    "virtual_token_reserves",
+    "virtual_sol_reserves",
+    "real_token_reserves",
+    "real_sol_reserves",
+    "token_total_supply",
+    "complete",
+)
+
+# Remaining real token reserves below which a curve counts as close to graduating
+GRADUATION_THRESHOLD = 100_000_000_000_000  # 100M tokens
+
+SORT_KEYS = ("price_sol", "progress", "market_cap_sol")
+
+# Lamports per token unit -> SOL per whole token
+_PRICE_SCALE = 10**TOKEN_DECIMALS / LAMPORTS_PER_SOL
+
+
+def decode_account_data(data: str, encoding: str = "base64") -> bytes:
+    return base64.b64decode(data) if encoding == "base64" else bytes.fromhex(data)
+
+
+def parse_bonding_curve(raw: bytes) -> dict:
+    if raw[:8] != EXPECTED_DISCRIMINATOR:
+        raise ValueError("Invalid discriminator for bonding curve")
+    return dict(zip(FIELDS, CURVE_LAYOUT.unpack_from(raw, 8)))
+
+
+def curve_price(state: dict) -> float:
+    """Spot price of one whole token in SOL."""
+    return state["virtual_sol_reserves"] / state["virtual_token_reserves"] * _PRICE_SCALE
+
+
+def curve_progress(state: dict) -> float:
+    """Completion percent (0-100) based on the real token reserves left."""
+    if state["complete"]:
+        return 100.0
+    progress = 100 - (state["real_token_reserves"] * 100) / INITIAL_REAL_TOKEN_RESERVES
+    return max(0.0, min(100.0, progress))
+
+
+class CurveColumns:
+    """Bonding curve fields of many accounts stored column-wise.
+
+    ``keys`` holds the account address (or input index) of each row; inputs that
+    failed to decode are listed in ``errors`` as ``{"key", "error"}`` and have no row.
+    """
+
+    def __init__(self):
+        self.keys: list = []
+        self.virtual_token_reserves = array("Q")
+        self.virtual_sol_reserves = array("Q")
+        self.real_token_reserves = array("Q")
+        self.real_sol_reserves = array("Q")
+        self.token_total_supply = array("Q")
+        self.complete = array("B")
+        self.errors: list[dict] = []
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def row(self, i: int) -> dict:
+        state = {name: getattr(self, name)[i] for name in FIELDS}
+        state["complete"] = bool(state["complete"])
+        return state
+
+
+def _account_parts(item, index: int, encoding: str) -> tuple:
+    """(key, data, encoding) of a blob or a getProgramAccounts/getMultipleAccounts entry."""
+    if isinstance(item, str):
+        return index, item, encoding
+    account = item.get("account", item)
+    data = account["data"]
+    if isinstance(data, list):  # ["<data>", "base64"]
+        data, encoding = data
+    return item.get("pubkey", index), data, encoding
+
+
+def _decode_prefix(data: str, encoding: str, size: int) -> bytes:
+    """Decode just enough of ``data`` to cover its first ``size`` bytes."""
+    if encoding == "base64":
+        return binascii.a2b_base64(data[: -(-size // 3) * 4])
+    return bytes.fromhex(data[: size * 2])
+
+
+def parse_bonding_curves(
+    accounts: list, encoding: str = "base64", sliced: bool = False
+) -> CurveColumns:
+    """Decode many bonding curve accounts into columns.
+
+    ``accounts`` may mix raw base64/hex strings and account objects as returned
+    by getProgramAccounts (``{"pubkey", "account": {"data": [...]}}``). With
+    ``sliced`` the data holds only the curve fields, as fetched with a
+    ``FIELDS_SLICE`` dataSlice, and has no discriminator to check.
+    """
+    start, size = (0, CURVE_LAYOUT.size) if sliced else (8, CURVE_SIZE)
+    columns = CurveColumns()
+    body = bytearray()
+    for index, item in enumerate(accounts):
+        key = index
+        try:
+            if item is None:
+                raise ValueError("Account not found")
+            key, data, item_encoding = _account_parts(item, index, encoding)
+            raw = _decode_prefix(data, item_encoding, size)
+            if not sliced and raw[:8] != EXPECTED_DISCRIMINATOR:
+                raise ValueError("Invalid discriminator for bonding curve")
+            if len(raw) < size:
+                raise ValueError("Bonding curve data is too short")
+        except Exception as e:
+            columns.errors.append({"key": key, "error": str(e)})
+            continue
+        columns.keys.append(key)
+        body += raw[start:size]
+        body += _ROW_PAD
+
+    words = array("Q")
+    words.frombytes(body)
+    if sys.byteorder == "big":
+        words.byteswap()
+    for i, name in enumerate(FIELDS[:-1]):
+        setattr(columns, name, words[i::_ROW_WORDS])
+    columns.complete = array("B", words[_ROW_WORDS - 1 :: _ROW_WORDS])
+    return columns
+
+
+def curve_metrics(columns: CurveColumns) -> dict[str, array]:
+    """Price (SOL per token), progress (%) and market cap (SOL) of every curve."""
+    price = array(
+        "d",
+        [
+            sol / tokens * _PRICE_SCALE if tokens else 0.0
+            for sol, tokens in zip(columns.virtual_sol_reserves, columns.virtual_token_reserves)
+        ],
+    )
+    scale = 100 / INITIAL_REAL_TOKEN_RESERVES
+    progress = array(
+        "d",
+        [
+            100.0 if done else min(100.0, max(0.0, 100 - left * scale))
+            for left, done in zip(columns.real_token_reserves, columns.complete)
+        ],
+    )
+    market_cap = array(
+        "d",
+        [p * supply / 10**TOKEN_DECIMALS for p, supply in zip(price, columns.token_total_supply)],
+    )
+    return {"price_sol": price, "progress": progress, "market_cap_sol": market_cap}
+
+
+def rank_curves(
+    columns: CurveColumns, metrics: dict, sort_by: str = None, limit: int = None, rows=None
+) -> list[dict]:
+    """Rows of ``columns`` with their metrics, optionally the top ``limit`` by ``sort_by``.
+
+    ``rows`` restricts the result to those row indices.
+    """
+    order = range(len(columns)) if rows is None else rows
+    if sort_by:
+        column = metrics[sort_by]
+        order = heapq.nlargest(
+            len(order) if limit is None else limit, order, key=column.__getitem__
+        )
+    elif limit is not None:
+        order = order[:limit]
+    return [
+        {
+            "key": columns.keys[i],
+            **columns.row(i),
+            **{name: values[i] for name, values in metrics.items()},
+        }
+        for i in order
+    ]
+
+
+def graduation_filters(max_real_token_reserves: int) -> list[dict]:
+    """getProgramAccounts filters for open curves with few tokens left.
+
+    memcmp only matches exact bytes, so the reserve bound is approximated by
+    requiring the high bytes that any value up to ``max_real_token_reserves``
+    leaves zero to be zero; callers apply the exact bound after decoding.
+    """
+    zero_bytes = 8 - (max_real_token_reserves.bit_length() + 7) // 8
+    filters = [
+        {"memcmp": {"offset": 0, "bytes": base58.b58encode(EXPECTED_DISCRIMINATOR).decode()}},
+        {"memcmp": {"offset": COMPLETE_OFFSET, "bytes": base58.b58encode(b"\x00").decode()}},
+    ]
+    if zero_bytes:
+        offset = REAL_TOKEN_RESERVES_OFFSET + 8 - zero_bytes
+        filters.insert(
+            1, {"memcmp": {"offset": offset, "bytes": base58.b58encode(bytes(zero_bytes)).decode()}}
+        )
+    return filters
@@ -0,0 +1,59 @@
+"""
+Pump.fun program derived addresses.
+
+Program keys are parsed once at import and derivations are memoized per mint,
+since ``find_program_address`` hashes candidate seeds until it finds an
+off-curve point and agents tend to derive the same launches repeatedly.
+"""
+
+from functools import lru_cache
+
+from solders.pubkey import Pubkey
+
+from common.config import settings
+
+PUMP_PROGRAM_ID = "6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P"
+TOKEN_PROGRAM_ID = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
+ATA_PROGRAM_ID = "ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL"
+
+PUMP_PROGRAM = Pubkey.from_string(PUMP_PROGRAM_ID)
+TOKEN_PROGRAM = Pubkey.from_string(TOKEN_PROGRAM_ID)
+ATA_PROGRAM = Pubkey.from_string(ATA_PROGRAM_ID)
+
+BONDING_CURVE_SEED = b"bonding-curve"
+_TOKEN_PROGRAM_BYTES = bytes(TOKEN_PROGRAM)
+
+
+@lru_cache(maxsize=settings.PUMPFUN_PDA_CACHE_SIZE)
+def derive_curve_addresses(mint: str) -> tuple[Pubkey, int, Pubkey]:
+    """(bonding curve, bump, associated bonding curve token account) of a mint."""
+    mint_bytes = bytes(Pubkey.from_string(mint))
+    curve, bump = Pubkey.find_program_address([BONDING_CURVE_SEED, mint_bytes], PUMP_PROGRAM)
+    assoc, _ = Pubkey.find_program_address(
+        [bytes(curve), _TOKEN_PROGRAM_BYTES, mint_bytes], ATA_PROGRAM
+    )
+    return curve, bump, assoc
+
+
+def derive_many(mints: list[str]) -> tuple[list[dict], list[dict]]:
+    """Derive addresses for many mints, returning (rows, errors).
+
+    Each distinct mint is derived once and lands in exactly one of the two
+    lists, which keep the order of each mint's first appearance in ``mints``.
+    """
+    rows, errors = [], []
+    for mint in dict.fromkeys(mints):
+        try:
+            curve, bump, assoc = derive_curve_addresses(mint)
+        except Exception as e:
+            errors.append({"mint": mint, "error": str(e)})
+            continue
+        rows.append(
+            {
+                "mint": mint,
+                "bonding_curve_address": str(curve),
+                "bump": bump,
+                "associated_bonding_curve": str(assoc),
+            }
+        )
+    return rows, errors
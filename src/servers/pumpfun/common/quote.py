@@ -0,0 +1,119 @@
+"""
+Buy and sell quotes against a Pump.fun bonding curve.
+
+The curve is a constant product of the virtual reserves, so a quote is a few
+integer operations on the parsed curve state: amounts are in lamports and raw
+token units (6 decimals), rounded the way the program rounds, against the
+trader. Fees are charged on the SOL side, in basis points. Each quote of a
+ladder starts from the same curve state.
+"""
+
+from servers.pumpfun.common.curve import LAMPORTS_PER_SOL, TOKEN_DECIMALS
+
+BPS = 10_000
+DEFAULT_FEE_BPS = 100
+DEFAULT_SLIPPAGE_BPS = 100
+
+
+def _ceil_div(a: int, b: int) -> int:
+    return -(-a // b)
+
+
+def _fee(lamports: int, fee_bps: int) -> int:
+    return _ceil_div(lamports * fee_bps, BPS)
+
+
+def _price(sol: int, tokens: int) -> float:
+    """SOL per whole token for a lamport / raw token amount pair."""
+    return sol / tokens * 10**TOKEN_DECIMALS / LAMPORTS_PER_SOL if tokens else 0.0
+
+
+def _check(state: dict, amount: int) -> None:
+    if state["complete"]:
+        raise ValueError("Bonding curve is complete; trades go through the AMM pool")
+    if amount <= 0:
+        raise ValueError(f"Trade amount must be positive: {amount}")
+
+
+def quote_buy(
+    state: dict,
+    sol_in: int,
+    fee_bps: int = DEFAULT_FEE_BPS,
+    slippage_bps: int = DEFAULT_SLIPPAGE_BPS,
+) -> dict:
+    """Tokens received for spending ``sol_in`` lamports, fee included."""
+    _check(state, sol_in)
+    vsol, vtok = state["virtual_sol_reserves"], state["virtual_token_reserves"]
+    net = sol_in * BPS // (BPS + fee_bps)
+    while net + _fee(net, fee_bps) > sol_in:  # the fee rounds up
+        net -= 1
+    tokens_out = net * vtok // (vsol + net)
+    capped = tokens_out > state["real_token_reserves"]
+    if capped:
+        # Only the tokens left on the curve can be bought; pay just for those
+        tokens_out = state["real_token_reserves"]
+        net = _ceil_div(tokens_out * vsol, vtok - tokens_out)
+    fee = _fee(net, fee_bps)
+    spot = _price(vsol, vtok)
+    average = _price(net, tokens_out)
+    return {
+        "side": "buy",
+        "sol_in": net + fee,
+        "fee": fee,
+        "tokens_out": tokens_out,
+        "min_tokens_out": tokens_out * (BPS - slippage_bps) // BPS,
+        "spot_price_sol": spot,
+        "average_price_sol": average,
+        "price_after_sol": _price(vsol + net, vtok - tokens_out),
+        "price_impact_pct": (average / spot - 1) * 100 if spot and tokens_out else 0.0,
+        "capped": capped,
+    }
+
+
+def quote_sell(
+    state: dict,
+    tokens_in: int,
+    fee_bps: int = DEFAULT_FEE_BPS,
+    slippage_bps: int = DEFAULT_SLIPPAGE_BPS,
+) -> dict:
+    """Lamports received for selling ``tokens_in`` raw token units, after fees."""
+    _check(state, tokens_in)
+    vsol, vtok = state["virtual_sol_reserves"], state["virtual_token_reserves"]
+    gross = tokens_in * vsol // (vtok + tokens_in)
+    capped = gross > state["real_sol_reserves"]
+    if capped:
+        # Only the SOL left on the curve can be paid out; sell just the tokens it buys
+        gross = state["real_sol_reserves"]
+        tokens_in = _ceil_div(gross * vtok, vsol - gross)
+    fee = _fee(gross, fee_bps)
+    sol_out = gross - fee
+    spot = _price(vsol, vtok)
+    average = _price(gross, tokens_in)
+    return {
+        "side": "sell",
+        "tokens_in": tokens_in,
+        "fee": fee,
+        "sol_out": sol_out,
+        "min_sol_out": sol_out * (BPS - slippage_bps) // BPS,
+        "spot_price_sol": spot,
+        "average_price_sol": average,
+        "price_after_sol": _price(vsol - gross, vtok + tokens_in),
+        "price_impact_pct": (1 - average / spot) * 100 if spot and tokens_in else 0.0,
+        "capped": capped,
+    }
+
+
+def quote_ladder(
+    state: dict,
+    side: str,
+    amounts: list[int],
+    fee_bps: int = DEFAULT_FEE_BPS,
+    slippage_bps: int = DEFAULT_SLIPPAGE_BPS,
+) -> list[dict]:
+    """Independent quotes for each trade size, all against ``state``."""
+    if side not in ("buy", "sell"):
+        raise ValueError(f"side must be 'buy' or 'sell': {side}")
+    if not 0 <= fee_bps < BPS or not 0 <= slippage_bps <= BPS:
+        raise ValueError("fee_bps and slippage_bps must be between 0 and 10000")
+    quote = quote_buy if side == "buy" else quote_sell
+    return [quote(state, int(amount), fee_bps, slippage_bps) for amount in amounts]
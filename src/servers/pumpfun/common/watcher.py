@@ -0,0 +1,238 @@
+"""
+Incremental bonding curve monitoring.
+
+A CurveWatcher remembers the raw curve fields of every watched mint and, on
+each poll, reports only the curves whose fields changed since the previous
+poll. Curves are fetched with chunked getMultipleAccounts requests sliced to
+the 41 bytes of curve fields; unchanged accounts are skipped by comparing those
+bytes, so parsing and delta work scale with the number of changed curves.
+
+When ``SOLANA_WS_URL`` is set and the optional ``websockets`` package is
+installed, every watched curve is also subscribed to with accountSubscribe.
+Pushed updates are buffered between polls and only curves without a live
+subscription are fetched over HTTP.
+"""
+
+import asyncio
+import binascii
+import json
+
+from common.config import settings
+from common.logger import get_logger
+from servers.pumpfun.common.curve import (
+    CURVE_LAYOUT,
+    CURVE_SIZE,
+    EXPECTED_DISCRIMINATOR,
+    FIELDS,
+    FIELDS_SLICE,
+    curve_price,
+    curve_progress,
+)
+from servers.pumpfun.common.pda import derive_curve_addresses
+from servers.solana.common import client
+
+try:
+    import websockets
+except ImportError:  # pragma: no cover - optional dependency
+    websockets = None
+
+logger = get_logger(__name__)
+
+_curve_watcher: "CurveWatcher" = None
+
+
+def _fields_bytes(data: list, sliced: bool) -> bytes:
+    """Raw curve fields of a ``[base64, "base64"]`` account data pair."""
+    encoded = data[0]
+    if sliced:
+        return binascii.a2b_base64(encoded)
+    raw = binascii.a2b_base64(encoded[: -(-CURVE_SIZE // 3) * 4])
+    if raw[:8] != EXPECTED_DISCRIMINATOR:
+        raise ValueError("Invalid discriminator for bonding curve")
+    return raw[8:CURVE_SIZE]
+
+
+class CurveWatcher:
+    def __init__(self, ws_url: str = None, commitment: str = "confirmed"):
+        self.ws_url = ws_url or None
+        self.commitment = commitment
+        self.mints: dict[str, str] = {}  # bonding curve -> mint
+        self.raw: dict[str, bytes] = {}  # bonding curve -> curve fields at the last poll
+        self.pushed: dict[str, bytes] = {}  # updates received over the websocket since then
+        self.subscriptions: dict[str, int] = {}  # bonding curve -> subscription id
+        self._subscribed: dict[int, str] = {}  # subscription id -> bonding curve
+        self._pending: dict[int, str] = {}  # request id -> bonding curve
+        self._next_id = 0
+        self._ws = None
+        self._task: asyncio.Task = None
+        self._sends: set[asyncio.Task] = set()  # (un)subscribe requests in flight
+        self.polls = 0
+        self.errors = 0
+
+    def watch(self, mints: list[str]) -> None:
+        for mint in mints:
+            curve = str(derive_curve_addresses(mint)[0])
+            self.mints[curve] = mint
+        self._ensure_subscriber()
+
+    def unwatch(self, mints: list[str]) -> None:
+        for mint in mints:
+            curve = str(derive_curve_addresses(mint)[0])
+            self.mints.pop(curve, None)
+            self.raw.pop(curve, None)
+            self.pushed.pop(curve, None)
+            subscription = self.subscriptions.pop(curve, None)
+            self._subscribed.pop(subscription, None)
+            if subscription is not None and self._ws is not None:
+                self._spawn(self._send("accountUnsubscribe", [subscription]))
+
+    async def poll(self) -> list[dict]:
+        """Changes since the previous poll; a curve seen for the first time is reported whole."""
+        updates, self.pushed = self.pushed, {}
+        live = self._ws is not None
+        stale = [c for c in self.mints if not (live and c in self.subscriptions and c in self.raw)]
+        if stale:
+            options = {
+                "encoding": "base64",
+                "commitment": self.commitment,
+                "dataSlice": FIELDS_SLICE,
+            }
+            result = await client.getmultipleaccounts_chunked("solana", stale, options)
+            for curve, account in zip(stale, result["value"]):
+                updates[curve] = _fields_bytes(account["data"], True) if account else None
+        self.polls += 1
+
+        changes = []
+        for curve, raw in updates.items():
+            if curve not in self.mints:
+                continue  # unwatched while the update was in flight
+            previous = self.raw.get(curve, b"")
+            if raw == previous:
+                continue
+            self.raw[curve] = raw
+            changes.append(self._delta(curve, previous, raw))
+        return changes
+
+    def _delta(self, curve: str, previous: bytes, raw: bytes) -> dict:
+        row = {"mint": self.mints[curve], "bonding_curve": curve}
+        if raw is None:
+            return {**row, "event": "missing"}
+        state = dict(zip(FIELDS, CURVE_LAYOUT.unpack(raw)))
+        metrics = {"progress": curve_progress(state), "price_sol": curve_price(state)}
+        if not previous:
+            return {**row, "event": "new", **state, **metrics}
+        before = dict(zip(FIELDS, CURVE_LAYOUT.unpack(previous)))
+        changed = {
+            name: state[name] - before[name] for name in FIELDS[:-1] if state[name] != before[name]
+        }
+        event = "completed" if state["complete"] and not before["complete"] else "changed"
+        return {**row, "event": event, "changes": changed, **state, **metrics}
+
+    def snapshot(self) -> dict:
+        return {
+            "watched": len(self.mints),
+            "subscribed": len(self.subscriptions),
+            "websocket": self._ws is not None,
+            "polls": self.polls,
+            "errors": self.errors,
+        }
+
+    def _ensure_subscriber(self) -> None:
+        if not self.ws_url or not self.mints:
+            return
+        if websockets is None:
+            logger.warning("websockets is not installed; polling bonding curves only")
+            self.ws_url = None
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._subscribe_loop())
+        elif self._ws is not None:
+            self._spawn(self._subscribe_missing())
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.ensure_future(coro)
+        self._sends.add(task)
+        task.add_done_callback(self._sends.discard)
+
+    def _request(self, method: str, params: list) -> str:
+        self._next_id += 1
+        return json.dumps(
+            {"jsonrpc": "2.0", "id": self._next_id, "method": method, "params": params}
+        )
+
+    async def _send(self, method: str, params: list) -> None:
+        await self._ws.send(self._request(method, params))
+
+    async def _subscribe_missing(self) -> None:
+        # Curves are marked pending before the first send so concurrent calls skip them
+        requested = set(self.subscriptions).union(self._pending.values())
+        options = {"encoding": "base64", "commitment": self.commitment}
+        requests = []
+        for curve in self.mints:
+            if curve not in requested:
+                requests.append(self._request("accountSubscribe", [curve, options]))
+                self._pending[self._next_id] = curve
+        for request in requests:
+            await self._ws.send(request)
+
+    def _on_message(self, message: dict) -> None:
+        if "id" in message:
+            curve = self._pending.pop(message["id"], None)
+            if curve in self.mints and "result" in message:
+                self.subscriptions[curve] = message["result"]
+                self._subscribed[message["result"]] = curve
+            return
+        params = message.get("params")
+        if message.get("method") != "accountNotification" or not isinstance(params, dict):
+            return
+        curve = self._subscribed.get(params.get("subscription"))
+        if curve is None:
+            return
+        value = params["result"]["value"]
+        try:
+            self.pushed[curve] = _fields_bytes(value["data"], False) if value else None
+        except ValueError as e:
+            self.errors += 1
+            logger.warning(f"Ignoring update of bonding curve {curve}: {e}")
+
+    async def _subscribe_loop(self) -> None:
+        while self.mints:
+            try:
+                async with websockets.connect(self.ws_url) as ws:
+                    self._ws = ws
+                    await self._subscribe_missing()
+                    async for message in ws:
+                        self._on_message(json.loads(message))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"Bonding curve subscription failed: {e}")
+            finally:
+                self._ws = None
+                self.subscriptions.clear()
+                self._subscribed.clear()
+                self._pending.clear()
+            await asyncio.sleep(settings.HEAD_POLL_INTERVAL)
+
+    async def stop(self) -> None:
+        """Cancel the subscriber and any requests still being sent."""
+        tasks = [*self._sends, *([self._task] if self._task is not None else [])]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        self._sends.clear()
+
+
+def get_curve_watcher() -> CurveWatcher:
+    """Return the process-wide watcher, subscribing over SOLANA_WS_URL when it is set."""
+    global _curve_watcher
+    if _curve_watcher is None:
+        _curve_watcher = CurveWatcher(settings.SOLANA_WS_URL)
+    return _curve_watcher
+
+
+async def stop_curve_watcher() -> None:
+    if _curve_watcher is not None:
+        await _curve_watcher.stop()
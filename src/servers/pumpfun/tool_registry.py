@@ -1,7 +1,13 @@
 from mcp.server.fastmcp import FastMCP
 
+from common.rpc import on_shutdown, rpc_lifespan
+from servers.pumpfun.common.watcher import stop_curve_watcher
+
+# Close the bonding curve subscriptions together with the shared RPC pools
+on_shutdown(stop_curve_watcher)
+
 # Global MCP instance
-mcp = FastMCP("PumpFunMCP")
+mcp = FastMCP("PumpFunMCP", lifespan=rpc_lifespan)
 
 
 def get_mcp_server():
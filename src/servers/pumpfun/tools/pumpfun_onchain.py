@@ -0,0 +1,139 @@
+"""
+Pump.fun tools that read bonding curve accounts from a Solana node.
+"""
+
+from mcp.types import CallToolResult
+
+import servers.solana.common.client as client
+from common.utils import _err, _ok
+from servers.pumpfun.common.curve import (
+    FIELDS_SLICE,
+    GRADUATION_THRESHOLD,
+    SORT_KEYS,
+    curve_metrics,
+    graduation_filters,
+    parse_bonding_curves,
+    rank_curves,
+)
+from servers.pumpfun.common.pda import PUMP_PROGRAM_ID
+from servers.pumpfun.common.watcher import get_curve_watcher
+from servers.pumpfun.tool_registry import mcp
+
+# Fields of each scan result; the rest of the curve state is dropped to keep it compact
+SCAN_FIELDS = (
+    "real_token_reserves",
+    "real_sol_reserves",
+    "progress",
+    "price_sol",
+    "market_cap_sol",
+)
+
+
+@mcp.tool(
+    name="scan_graduating_bonding_curves",
+    description="""
+    Find Pump.fun bonding curves close to graduation in one call. Queries
+    getProgramAccounts with graduation filters, fetching only the curve reserve
+    fields, applies the exact thresholds below and returns the top candidates.
+    This is for Pump.fun tokens on bonding curve operations.
+
+    Parameters:
+    - max_real_token_reserves (int, optional): Largest remaining real token
+      reserves in raw units (6 decimals). Default is 100000000000000 (100M tokens).
+    - min_progress (float, optional): Smallest bonding curve progress percent (0-100).
+    - sort_by (str, optional): Rank by 'progress' (default), 'price_sol' or 'market_cap_sol'.
+    - limit (int, optional): Number of curves to return. Default is 20.
+    - commitment (str, optional): Commitment level. Default is 'confirmed'.
+
+    Returns: Dictionary with 'curves' (bonding_curve address, real_token_reserves,
+    real_sol_reserves, progress, price_sol, market_cap_sol), 'matched' (curves
+    passing the thresholds) and 'scanned' (accounts returned by the node).
+    """,
+    annotations={"title": "Scan graduating Pump.fun curves", "readOnlyHint": True},
+)
+async def scan_graduating_bonding_curves(
+    max_real_token_reserves: int = GRADUATION_THRESHOLD,
+    min_progress: float = None,
+    sort_by: str = "progress",
+    limit: int = 20,
+    commitment: str = "confirmed",
+) -> CallToolResult:
+    try:
+        if sort_by not in SORT_KEYS:
+            return _err(f"sort_by must be one of {', '.join(SORT_KEYS)}")
+        options = {
+            "encoding": "base64",
+            "commitment": commitment,
+            "filters": graduation_filters(max_real_token_reserves),
+            "dataSlice": FIELDS_SLICE,
+        }
+        accounts = await client.getprogramaccounts("solana", PUMP_PROGRAM_ID, options)
+        columns = parse_bonding_curves(accounts, sliced=True)
+        metrics = curve_metrics(columns)
+
+        reserves, progress = columns.real_token_reserves, metrics["progress"]
+        floor = -1.0 if min_progress is None else min_progress
+        rows = [
+            i
+            for i in range(len(columns))
+            if reserves[i] <= max_real_token_reserves and progress[i] >= floor
+        ]
+        curves = [
+            {"bonding_curve": row["key"], **{name: row[name] for name in SCAN_FIELDS}}
+            for row in rank_curves(columns, metrics, sort_by, limit, rows)
+        ]
+        return _ok({"curves": curves, "matched": len(rows), "scanned": len(accounts)})
+    except Exception as e:
+        return _err(str(e))
+
+
+@mcp.tool(
+    name="watch_bonding_curves",
+    description="""
+    Add Pump.fun token mints to (or remove them from) the set of bonding curves
+    followed by poll_bonding_curve_changes. When SOLANA_WS_URL is configured the
+    curves are also subscribed to with accountSubscribe.
+    This is for Pump.fun tokens on bonding curve operations.
+
+    Parameters:
+    - mints (list[str]): Base-58 mint addresses.
+    - remove (bool, optional): Stop watching these mints instead. Default is false.
+
+    Returns: Dictionary with the number of watched and subscribed curves.
+    """,
+    annotations={"title": "Watch bonding curves", "readOnlyHint": True},
+)
+async def watch_bonding_curves(mints: list[str], remove: bool = False) -> CallToolResult:
+    try:
+        watcher = get_curve_watcher()
+        if remove:
+            watcher.unwatch(mints)
+        else:
+            watcher.watch(mints)
+        return _ok(watcher.snapshot())
+    except Exception as e:
+        return _err(str(e))
+
+
+@mcp.tool(
+    name="poll_bonding_curve_changes",
+    description="""
+    Report changes of the watched bonding curves since the previous poll.
+    Unchanged curves are left out; use watch_bonding_curves to choose the mints.
+    This is for Pump.fun tokens on bonding curve operations.
+
+    Returns: Dictionary with 'changes' and watcher counters. Each change has
+    mint, bonding_curve and event: 'new' (first poll of the curve), 'changed',
+    'completed' (the curve just finished) or 'missing' (no account). Except for
+    'missing' it carries the current curve fields, progress and price_sol, and
+    'changes' maps each changed reserve field to its difference.
+    """,
+    annotations={"title": "Poll bonding curve changes", "readOnlyHint": True},
+)
+async def poll_bonding_curve_changes() -> CallToolResult:
+    try:
+        watcher = get_curve_watcher()
+        changes = await watcher.poll()
+        return _ok({"changes": changes, **watcher.snapshot()})
+    except Exception as e:
+        return _err(str(e))
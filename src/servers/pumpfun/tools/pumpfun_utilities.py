@@ -1,36 +1,27 @@
-import base64
 import json
-import struct
 
-import base58
 from mcp.types import CallToolResult
-from solders.pubkey import Pubkey
 
 from common.utils import _err, _ok
+from servers.pumpfun.common.curve import (
+    GRADUATION_THRESHOLD,
+    SORT_KEYS,
+    curve_metrics,
+    curve_price,
+    curve_progress,
+    decode_account_data,
+    graduation_filters,
+    parse_bonding_curve,
+    parse_bonding_curves,
+    rank_curves,
+)
+from servers.pumpfun.common.pda import derive_curve_addresses, derive_many
+from servers.pumpfun.common.quote import DEFAULT_FEE_BPS, DEFAULT_SLIPPAGE_BPS, quote_ladder
 from servers.pumpfun.tool_registry import mcp
 
-LAMPORTS_PER_SOL = 1_000_000_000
-TOKEN_DECIMALS = 6
-EXPECTED_DISCRIMINATOR = struct.pack("<Q", 6966180631402821399)
-
-PUMP_PROGRAM_ID = "6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P"
-TOKEN_PROGRAM_ID = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
-ATA_PROGRAM_ID = "ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL"
-
 
 def _parse_bonding_curve_data(data: str, encoding: str) -> dict:
-    raw = base64.b64decode(data) if encoding == "base64" else bytes.fromhex(data)
-    if raw[:8] != EXPECTED_DISCRIMINATOR:
-        raise ValueError("Invalid discriminator for bonding curve")
-    fields = struct.unpack_from("<QQQQQ?", raw, 8)
-    return {
-        "virtual_token_reserves": fields[0],
-        "virtual_sol_reserves": fields[1],
-        "real_token_reserves": fields[2],
-        "real_sol_reserves": fields[3],
-        "token_total_supply": fields[4],
-        "complete": fields[5],
-    }
+    return parse_bonding_curve(decode_account_data(data, encoding))
 
 
 @mcp.tool(
@@ -48,9 +39,7 @@ def _parse_bonding_curve_data(data: str, encoding: str) -> dict:
 )
 def calculate_bonding_curve_address(mint: str) -> CallToolResult:
     try:
-        program_id = Pubkey.from_string(PUMP_PROGRAM_ID)
-        mint_key = Pubkey.from_string(mint)
-        curve, bump = Pubkey.find_program_address([b"bonding-curve", bytes(mint_key)], program_id)
+        curve, bump, _ = derive_curve_addresses(mint)
         return _ok({"bonding_curve_address": str(curve), "bump": bump})
     except Exception as e:
         return _err(str(e))
@@ -71,20 +60,34 @@ def calculate_bonding_curve_address(mint: str) -> CallToolResult:
 )
 def calc_associated_bonding_curve_addr(mint: str) -> CallToolResult:
     try:
-        token_program = Pubkey.from_string(TOKEN_PROGRAM_ID)
-        ata_program = Pubkey.from_string(ATA_PROGRAM_ID)
-        pump_program = Pubkey.from_string(PUMP_PROGRAM_ID)
-
-        mint_key = Pubkey.from_string(mint)
-        curve, _ = Pubkey.find_program_address([b"bonding-curve", bytes(mint_key)], pump_program)
-        assoc, _ = Pubkey.find_program_address(
-            [bytes(curve), bytes(token_program), bytes(mint_key)], ata_program
-        )
+        _, _, assoc = derive_curve_addresses(mint)
         return _ok(str(assoc))
     except Exception as e:
         return _err(str(e))
 
 
+@mcp.tool(
+    name="derive_bonding_curve_addresses",
+    description="""
+    Derive bonding curve addresses for many token mints in one call.
+    This is for Pump.fun tokens on bonding curve operations.
+
+    Parameters:
+    - mints (list[str]): Base-58 mint addresses. Duplicates are derived once.
+
+    Returns: Dictionary with 'addresses' (mint, bonding_curve_address, bump,
+    associated_bonding_curve) and 'errors' for mints that are not valid pubkeys.
+    """,
+    annotations={"title": "Derive bonding curve addresses", "readOnlyHint": True},
+)
+def derive_bonding_curve_addresses(mints: list[str]) -> CallToolResult:
+    try:
+        rows, errors = derive_many(mints)
+        return _ok({"addresses": rows, "errors": errors})
+    except Exception as e:
+        return _err(str(e))
+
+
 @mcp.tool(
     name="get_bonding_curve_data",
     description="""
@@ -117,11 +120,7 @@ def get_bonding_curve_data(data: str, encoding: str = "base64") -> CallToolResul
 )
 def calculate_bonding_curve_price(data: str, encoding: str = "base64") -> CallToolResult:
     try:
-        state = _parse_bonding_curve_data(data, encoding)
-        price = (state["virtual_sol_reserves"] / LAMPORTS_PER_SOL) / (
-            state["virtual_token_reserves"] / 10**TOKEN_DECIMALS
-        )
-        return _ok(price)
+        return _ok(curve_price(_parse_bonding_curve_data(data, encoding)))
     except Exception as e:
         return _err(str(e))
 
@@ -137,23 +136,48 @@ def calculate_bonding_curve_price(data: str, encoding: str = "base64") -> CallTo
 )
 def calculate_bonding_curve_progress(data: str, encoding: str = "base64") -> CallToolResult:
     try:
-        state = _parse_bonding_curve_data(data, encoding)
-
-        if state["complete"]:
-            return _ok(100.0)
-
-        # Pump.fun constants (with 6 decimals)
-        TOTAL_SUPPLY = 1000000000000000  # 1B tokens with 6 decimals
-        RESERVED_TOKENS = 206900000000000  # 206.9M tokens with 6 decimals reserved for migration
+        return _ok(curve_progress(_parse_bonding_curve_data(data, encoding)))
+    except Exception as e:
+        return _err(str(e))
 
-        initial_real_token_reserves = TOTAL_SUPPLY - RESERVED_TOKENS  # 793.1M tokens
-        if initial_real_token_reserves <= 0:
-            return _ok(0.0)
 
-        left_tokens = state["real_token_reserves"]
-        progress = 100 - (left_tokens * 100) / initial_real_token_reserves
+@mcp.tool(
+    name="quote_bonding_curve_trades",
+    description="""
+    Quote buys or sells of one or more sizes against bonding curve state data.
+    This is for Pump.fun tokens on bonding curve operations.
+    Requires base64/hex input from getAccountInfo. Computed locally with exact
+    integer math; every size is quoted against the same curve state.
 
-        return _ok(max(0.0, min(100.0, progress)))
+    Parameters:
+    - data (str): Base64 or hex bonding curve account data.
+    - side (str): 'buy' (spend SOL) or 'sell' (sell tokens).
+    - amounts (list[int]): Trade sizes, lamports for buys and raw token units
+      (6 decimals) for sells, e.g. [100000000, 1000000000] for 0.1 and 1 SOL.
+    - encoding (str): One of 'base64' (default) or 'hex'.
+    - fee_bps (int, optional): Trading fee in basis points. Default is 100.
+    - slippage_bps (int, optional): Slippage tolerance in basis points. Default is 100.
+
+    Returns: List of quotes. Buys report sol_in (fee included), fee, tokens_out,
+    min_tokens_out and capped (size exceeds the tokens left on the curve, so
+    only those are bought); sells report tokens_in, fee, sol_out, min_sol_out
+    and capped (the payout exceeds the SOL left on the curve, so tokens_in is
+    reduced to the amount that clears). Both include spot, average and
+    post-trade prices in SOL per token and price_impact_pct.
+    """,
+    annotations={"title": "Quote bonding curve trades", "readOnlyHint": True},
+)
+def quote_bonding_curve_trades(
+    data: str,
+    side: str,
+    amounts: list[int],
+    encoding: str = "base64",
+    fee_bps: int = DEFAULT_FEE_BPS,
+    slippage_bps: int = DEFAULT_SLIPPAGE_BPS,
+) -> CallToolResult:
+    try:
+        state = _parse_bonding_curve_data(data, encoding)
+        return _ok(quote_ladder(state, side, amounts, fee_bps, slippage_bps))
     except Exception as e:
         return _err(str(e))
 
@@ -164,7 +188,8 @@ def calculate_bonding_curve_progress(data: str, encoding: str = "base64") -> Cal
     Returns memcmp filters for Solana getProgramAccounts to find bonding curves
     that are likely close to graduation. NOTE: This is a coarse filter that may
     return tokens with up to ~281M tokens remaining. Additional client-side
-    filtering recommended.
+    filtering recommended, or use scan_graduating_bonding_curves to run the
+    query and exact filtering in one call.
     
     Filters for:
     - Bonding curve discriminator
@@ -174,16 +199,40 @@ def calculate_bonding_curve_progress(data: str, encoding: str = "base64") -> Cal
     annotations={"title": "Find graduating Pump.fun tokens (coarse filter)", "readOnlyHint": True},
 )
 def get_graduating_bonding_curves() -> CallToolResult:
-    threshold = 100_000_000_000_000
-    msb_prefix = threshold.to_bytes(8, "little")[6:]
-
     try:
-        filters = [
-            {"memcmp": {"offset": 0, "bytes": base58.b58encode(EXPECTED_DISCRIMINATOR).decode()}},
-            {"memcmp": {"offset": 30, "bytes": base58.b58encode(msb_prefix).decode()}},
-            {"memcmp": {"offset": 48, "bytes": base58.b58encode(b"\x00").decode()}},
-        ]
-        return _ok(json.dumps(filters))
+        return _ok(json.dumps(graduation_filters(GRADUATION_THRESHOLD)))
 
     except Exception as e:
         return _err(str(e))
+
+
+@mcp.tool(
+    name="parse_bonding_curves",
+    description="""
+    Parse many bonding curve accounts at once and compute price, progress and
+    market cap for each. This is for Pump.fun tokens on bonding curve operations.
+
+    Parameters:
+    - accounts (list): Account data as base64/hex strings, or account objects as
+      returned by getprogramaccounts / getmultipleaccounts (base64 encoding).
+    - encoding (str): Encoding of plain string inputs, 'base64' (default) or 'hex'.
+    - sort_by (str, optional): Rank by 'price_sol', 'progress' or 'market_cap_sol' (descending).
+    - limit (int, optional): Return only the top N curves after sorting.
+
+    Returns: Dictionary with 'curves' (key, parsed fields, price_sol, progress,
+    market_cap_sol), 'count' of valid curves and 'errors' for inputs that could
+    not be parsed. The key is the account pubkey when given, otherwise the input index.
+    """,
+    annotations={"title": "Bulk parse bonding curves", "readOnlyHint": True},
+)
+def parse_bonding_curves_tool(
+    accounts: list, encoding: str = "base64", sort_by: str = None, limit: int = None
+) -> CallToolResult:
+    try:
+        if sort_by and sort_by not in SORT_KEYS:
+            return _err(f"sort_by must be one of {', '.join(SORT_KEYS)}")
+        columns = parse_bonding_curves(accounts, encoding)
+        curves = rank_curves(columns, curve_metrics(columns), sort_by, limit)
+        return _ok({"curves": curves, "count": len(columns), "errors": columns.errors})
+    except Exception as e:
+        return _err(str(e))
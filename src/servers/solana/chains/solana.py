@@ -4,6 +4,7 @@ Solana-specific implementation of the BlockchainAdapter.
 
 from common.config import settings
 from common.interfaces import RpcClient
+from common.rpc import get_shared_rpc_client
 from servers.solana.common.adapter_registry import register_adapter
 from servers.solana.solana import SolanaAdapter
 
@@ -11,4 +12,9 @@ from servers.solana.solana import SolanaAdapter
 @register_adapter("solana")
 class SolanaChainAdapter(SolanaAdapter):
     def __init__(self, rpc_client: RpcClient = None):
-        super().__init__(rpc_url=settings.SOLANA_RPC_URL, rpc_client=rpc_client)
+        super().__init__(
+            rpc_url=settings.SOLANA_RPC_URLS,
+            rpc_client=rpc_client or get_shared_rpc_client(settings.SOLANA_RPC_BATCHING),
+            chain="solana",
+            ws_url=settings.SOLANA_WS_URL,
+        )
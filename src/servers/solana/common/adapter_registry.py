@@ -1,15 +1,29 @@
 """
 Decorator-based registry for automatically registering blockchain adapters.
+
+An adapter that cannot be built from its settings (for example a blank
+``*_RPC_URL``) is left out with a warning so the other chains keep working;
+calls for that chain fail with the reason.
 """
 
+from common.logger import get_logger
 from servers.solana.common.interfaces import BlockchainAdapter
 
+logger = get_logger(__name__)
+
 registry: dict[str, BlockchainAdapter] = {}
 
+# Chains whose adapter could not be built, with the reason
+unavailable: dict[str, str] = {}
+
 
 def register_adapter(chain: str):
     def wrapper(adapter_cls):
-        registry[chain] = adapter_cls()
+        try:
+            registry[chain] = adapter_cls()
+        except ValueError as e:
+            unavailable[chain] = str(e)
+            logger.warning(f"Chain {chain} is disabled: {e}")
         return adapter_cls
 
     return wrapper
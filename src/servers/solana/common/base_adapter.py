@@ -0,0 +1,18 @@
+"""
+Hand-written base of the generated SolanaAdapter: head tracking and the Solana
+response cache.
+"""
+
+from common.adapter import RpcAdapter
+from common.config import settings
+from servers.solana.common.cache import SolanaCachingRpcClient
+from servers.solana.common.head import SolanaHeadTracker
+from servers.solana.common.interfaces import BlockchainAdapter
+
+
+class SolanaBaseAdapter(RpcAdapter, BlockchainAdapter):
+    head_tracker_class = SolanaHeadTracker
+    caching_client_class = SolanaCachingRpcClient
+
+    def cache_enabled(self) -> bool:
+        return settings.SOLANA_CACHE_ENABLED
@@ -0,0 +1,72 @@
+"""
+Finality-aware response cache for Solana JSON-RPC calls.
+
+Transactions, blocks and block times never change once their slot is finalized,
+so those results are kept in a bounded LRU. A call made at ``finalized``
+commitment is final as soon as it returns; a ``confirmed`` result is kept once
+the finalized slot (from the head tracker, or fetched and cached for a short
+TTL) has caught up with it.
+"""
+
+from common.cache import HEAD, IMMUTABLE, VOLATILE, CachingRpcClient
+from common.config import settings
+from common.disk_cache import DiskCache
+from common.head import HeadTracker
+from common.interfaces import RpcClient
+
+STATIC_METHODS = {"getGenesisHash"}
+
+# Methods whose result is immutable once the slot they refer to is finalized
+SLOT_METHODS = {"getTransaction", "getBlock", "getBlockTime"}
+
+
+def _commitment(params: list) -> str:
+    options = params[1] if len(params) > 1 and isinstance(params[1], dict) else {}
+    # Nodes default to finalized when no commitment is given
+    return options.get("commitment", "finalized")
+
+
+class SolanaCachingRpcClient(CachingRpcClient):
+    """CachingRpcClient with Solana commitment rules."""
+
+    identity_method = "getGenesisHash"
+
+    def __init__(
+        self,
+        inner: RpcClient,
+        max_entries: int = None,
+        head_ttl: float = None,
+        head: HeadTracker = None,
+        disk: DiskCache = None,
+        namespace: str = "",
+    ):
+        super().__init__(
+            inner,
+            max_entries=max_entries or settings.SOLANA_CACHE_MAX_ENTRIES,
+            head_ttl=head_ttl if head_ttl is not None else settings.SOLANA_CACHE_HEAD_TTL,
+            disk=disk,
+            namespace=namespace,
+        )
+        self.head = head
+
+    def classify(self, method: str, params: list) -> str:
+        if method in STATIC_METHODS:
+            return IMMUTABLE
+        if method in SLOT_METHODS and _commitment(params) != "processed":
+            return IMMUTABLE
+        if method == "getSlot" and params and params[0] == {"commitment": "finalized"}:
+            return HEAD
+        return VOLATILE
+
+    async def is_settled(self, method: str, params: list, result, endpoint: str) -> bool:
+        if result is None:
+            return False
+        if method in STATIC_METHODS or _commitment(params) == "finalized":
+            return True
+        slot = result.get("slot") if method == "getTransaction" else params[0]
+        if not isinstance(slot, int):
+            return False
+        finalized = self.head.finalized_slot() if self.head else None
+        if finalized is None or slot > finalized:
+            finalized = await self.post("getSlot", [{"commitment": "finalized"}], endpoint)
+        return slot <= finalized
@@ -3,16 +3,42 @@ Client dispatcher that routes blockchain transaction requests
 through registered BlockchainAdapter instances.
 """
 
-from servers.solana.common.adapter_registry import registry
+import asyncio
+import time
+from contextlib import aclosing
+
+from common.concurrency import chunked, gather_limited
+from common.config import settings
+from servers.solana.common import history
+from servers.solana.common.adapter_registry import registry, unavailable
+
+# Largest number of keys a node accepts in one getMultipleAccounts / getSignatureStatuses
+MAX_ACCOUNTS_PER_REQUEST = 100
+MAX_SIGNATURES_PER_REQUEST = 256
+
+COMMITMENT_LEVELS = {"processed": 0, "confirmed": 1, "finalized": 2}
 
 
 def _adapter(chain: str):
     ad = registry.get(chain)
     if not ad:
+        if chain in unavailable:
+            raise ValueError(f"Blockchain {chain} is not configured: {unavailable[chain]}")
         raise ValueError(f"Unsupported blockchain: {chain}")
     return ad
 
 
+async def collect(chain, method, params, max_results=None):
+    """Read an array result as a stream, stopping after ``max_results`` elements."""
+    items = []
+    async with aclosing(_adapter(chain).stream(method, params)) as stream:
+        async for item in stream:
+            items.append(item)
+            if max_results is not None and len(items) >= max_results:
+                break
+    return items
+
+
 async def getaccountinfo(chain, account, options):
     return await _adapter(chain).getaccountinfo(account, options)
 
@@ -25,6 +51,24 @@ async def getblock(chain, slot_number, options):
     return await _adapter(chain).getblock(slot_number, options)
 
 
+def narrow_block_options(options: dict, tree: dict) -> dict:
+    """Lower getBlock detail options to what a projection actually reads.
+
+    Transactions, signatures and rewards the projection leaves out are then
+    never sent by the node at all.
+    """
+    if not tree:
+        return options
+    options = dict(options)
+    details = options.get("transactionDetails", "full")
+    if "transactions" not in tree:
+        details = "signatures" if "signatures" in tree and details != "none" else "none"
+    options["transactionDetails"] = details
+    if "rewards" not in tree:
+        options["rewards"] = False
+    return options
+
+
 async def getblockcommitment(chain, slot_number):
     return await _adapter(chain).getblockcommitment(slot_number)
 
@@ -125,6 +169,34 @@ async def getmultipleaccounts(chain, pubkeys, options):
     return await _adapter(chain).getmultipleaccounts(pubkeys, options)
 
 
+async def getmultipleaccounts_chunked(chain, pubkeys, options, concurrency=None):
+    """getMultipleAccounts for any number of pubkeys.
+
+    The keys are requested in chunks of 100, in parallel and with the same
+    options (including minContextSlot). Accounts are returned in input order;
+    the context reports the lowest slot as ``slot`` and the highest as ``maxSlot``.
+    """
+    chunks = chunked(list(pubkeys), MAX_ACCOUNTS_PER_REQUEST)
+    if len(chunks) <= 1:
+        return await getmultipleaccounts(chain, pubkeys, options)
+
+    adapter = _adapter(chain)
+    results = await gather_limited(
+        (adapter.getmultipleaccounts(chunk, options) for chunk in chunks),
+        concurrency or settings.SOLANA_RPC_CONCURRENCY,
+    )
+    return _merge_chunks(results)
+
+
+def _merge_chunks(results: list[dict]) -> dict:
+    """Join chunked {"context", "value"} responses, keeping the slot range observed."""
+    slots = [result["context"]["slot"] for result in results]
+    return {
+        "context": {**results[0]["context"], "slot": min(slots), "maxSlot": max(slots)},
+        "value": [item for result in results for item in result["value"]],
+    }
+
+
 async def getprogramaccounts(chain, pubkey, options):
     return await _adapter(chain).getprogramaccounts(pubkey, options)
 
@@ -141,10 +213,95 @@ async def getsignaturesforaddress(chain, account, options):
     return await _adapter(chain).getsignaturesforaddress(account, options)
 
 
+async def get_signature_history(
+    chain, address, options, max_signatures=None, min_slot=None, min_block_time=None, prefetch=None
+):
+    """Page through an address history and return a compact summary of the signatures."""
+    signatures = []
+    pages = history.iter_signature_pages(
+        _adapter(chain), address, options, max_signatures, min_slot, min_block_time, prefetch
+    )
+    async with aclosing(pages) as pages:
+        async for page in pages:
+            signatures.extend(history.compact_signature(entry) for entry in page)
+    return {
+        "count": len(signatures),
+        "failed": sum(1 for entry in signatures if "err" in entry),
+        "newestSlot": signatures[0]["slot"] if signatures else None,
+        "oldestSlot": signatures[-1]["slot"] if signatures else None,
+        # Pass as `before` to continue the walk further back
+        "before": signatures[-1]["signature"] if signatures else None,
+        "signatures": signatures,
+    }
+
+
 async def getsignaturestatuses(chain, signatures, options):
     return await _adapter(chain).getsignaturestatuses(signatures, options)
 
 
+async def getsignaturestatuses_chunked(chain, signatures, options, concurrency=None):
+    """getSignatureStatuses for any number of signatures, in parallel chunks of 256."""
+    chunks = chunked(list(signatures), MAX_SIGNATURES_PER_REQUEST)
+    if len(chunks) <= 1:
+        return await getsignaturestatuses(chain, signatures, options)
+
+    adapter = _adapter(chain)
+    results = await gather_limited(
+        (adapter.getsignaturestatuses(chunk, options) for chunk in chunks),
+        concurrency or settings.SOLANA_RPC_CONCURRENCY,
+    )
+    return _merge_chunks(results)
+
+
+def _reached(status: dict, commitment: str) -> bool:
+    if status is None:
+        return False
+    if status.get("confirmationStatus") is None:
+        # Older nodes only report confirmations, which is null once the slot is rooted
+        return status.get("confirmations") is None
+    return COMMITMENT_LEVELS[status["confirmationStatus"]] >= COMMITMENT_LEVELS[commitment]
+
+
+async def wait_for_signatures(
+    chain,
+    signatures,
+    commitment="finalized",
+    timeout=60.0,
+    interval=0.5,
+    max_interval=5.0,
+    search_transaction_history=False,
+):
+    """Poll signature statuses until every signature reaches ``commitment`` or time runs out.
+
+    Only signatures that have not reached the target are re-checked, and the
+    polling interval grows by half after each round up to ``max_interval``.
+    """
+    if commitment not in COMMITMENT_LEVELS:
+        raise ValueError(f"Unknown commitment: {commitment}")
+    options = {"searchTransactionHistory": search_transaction_history}
+    statuses = dict.fromkeys(signatures)
+    pending = list(statuses)
+    deadline = time.monotonic() + timeout
+    polls = 0
+    while pending:
+        result = await getsignaturestatuses_chunked(chain, pending, options)
+        polls += 1
+        for signature, status in zip(pending, result["value"]):
+            statuses[signature] = status
+        pending = [sig for sig in pending if not _reached(statuses[sig], commitment)]
+        remaining = deadline - time.monotonic()
+        if not pending or remaining <= 0:
+            break
+        await asyncio.sleep(min(interval, remaining))
+        interval = min(max_interval, interval * 1.5)
+    return {
+        "reached": len(statuses) - len(pending),
+        "pending": pending,
+        "polls": polls,
+        "statuses": [{"signature": sig, "status": statuses[sig]} for sig in signatures],
+    }
+
+
 async def getslot(chain, options):
     return await _adapter(chain).getslot(options)
 
@@ -189,6 +346,29 @@ async def gettransaction(chain, account, options):
     return await _adapter(chain).gettransaction(account, options)
 
 
+async def gettransactions(chain, signatures, options, concurrency=None):
+    """Fetch many transactions in parallel; failures are reported per signature."""
+    adapter = _adapter(chain)
+    if concurrency is None:
+        # With batching enabled, concurrent calls are merged into batch requests
+        concurrency = (
+            settings.RPC_MAX_BATCH_SIZE
+            if settings.SOLANA_RPC_BATCHING
+            else settings.SOLANA_RPC_CONCURRENCY
+        )
+
+    async def fetch(signature):
+        try:
+            return {
+                "signature": signature,
+                "transaction": await adapter.gettransaction(signature, options),
+            }
+        except Exception as e:
+            return {"signature": signature, "error": str(e)}
+
+    return await gather_limited((fetch(signature) for signature in signatures), concurrency)
+
+
 async def gettransactioncount(chain, options):
     return await _adapter(chain).gettransactioncount(options)
 
@@ -0,0 +1,40 @@
+"""
+Head tracker for Solana.
+"""
+
+import asyncio
+
+from common.head import HeadTracker
+
+
+class SolanaHeadTracker(HeadTracker):
+    """Tracks the confirmed slot, block height and finalized slot."""
+
+    subscribe_method = "slotSubscribe"
+
+    def __init__(self, adapter, name: str, ws_url: str = None, interval: float = None):
+        super().__init__(name, ws_url, interval)
+        self.adapter = adapter
+
+    async def poll(self) -> dict:
+        slot, block_height, finalized_slot = await asyncio.gather(
+            self.adapter.post_uncached("getSlot", [{"commitment": "confirmed"}]),
+            self.adapter.post_uncached("getBlockHeight", [{"commitment": "confirmed"}]),
+            self.adapter.post_uncached("getSlot", [{"commitment": "finalized"}]),
+        )
+        return {
+            "slot": max(slot, self.state.get("slot", 0)),
+            "blockHeight": block_height,
+            "finalizedSlot": max(finalized_slot, self.state.get("finalizedSlot", 0)),
+        }
+
+    def on_notification(self, result) -> dict:
+        # slotNotification reports the slot being processed and the node's root
+        return {
+            "processedSlot": result["slot"],
+            "finalizedSlot": max(result["root"], self.state.get("finalizedSlot", 0)),
+        }
+
+    def finalized_slot(self) -> int:
+        state = self.fresh()
+        return state.get("finalizedSlot") if state else None
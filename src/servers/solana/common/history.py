@@ -0,0 +1,88 @@
+"""
+Automatic pagination of getSignaturesForAddress.
+
+``iter_signature_pages`` walks an address history backwards with the ``before``
+cursor, one page of up to 1000 signatures per request, until a signature count,
+slot or block time bound is reached. A background task keeps up to ``prefetch``
+pages requested ahead of the consumer.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+from common.config import settings
+
+PAGE_SIZE = 1000
+
+_END = object()
+
+
+def _within_bounds(entry: dict, min_slot: int, min_block_time: int) -> bool:
+    if min_slot is not None and entry["slot"] < min_slot:
+        return False
+    block_time = entry.get("blockTime")
+    if min_block_time is not None and block_time is not None and block_time < min_block_time:
+        return False
+    return True
+
+
+async def iter_signature_pages(
+    adapter,
+    address: str,
+    options: dict = None,
+    max_signatures: int = None,
+    min_slot: int = None,
+    min_block_time: int = None,
+    prefetch: int = None,
+) -> AsyncIterator[list[dict]]:
+    """Yield pages of signature info, newest first, until a bound is reached.
+
+    ``options`` are passed to every request (``before`` sets the starting point,
+    ``until`` an inclusive stop signature handled by the node). Entries older
+    than ``min_slot`` or ``min_block_time`` end the walk and are not returned.
+    """
+    options = dict(options or {})
+    prefetch = prefetch or settings.SOLANA_SIGNATURES_PREFETCH
+    pages: asyncio.Queue = asyncio.Queue(maxsize=max(1, prefetch))
+
+    async def produce():
+        remaining = max_signatures
+        try:
+            while remaining is None or remaining > 0:
+                limit = PAGE_SIZE if remaining is None else min(PAGE_SIZE, remaining)
+                page = await adapter.getsignaturesforaddress(address, {**options, "limit": limit})
+                page = page or []
+                kept = [e for e in page if _within_bounds(e, min_slot, min_block_time)]
+                if remaining is not None:
+                    kept = kept[:remaining]
+                    remaining -= len(kept)
+                if kept:
+                    await pages.put(kept)
+                if len(kept) < len(page) or len(page) < limit:
+                    break  # hit a bound or the beginning of the history
+                options["before"] = page[-1]["signature"]
+            await pages.put(_END)
+        except Exception as e:
+            await pages.put(e)
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while (page := await pages.get()) is not _END:
+            if isinstance(page, Exception):
+                raise page
+            yield page
+    finally:
+        producer.cancel()
+
+
+def compact_signature(entry: dict) -> dict:
+    """Keep the fields useful for analysis and drop nulls."""
+    compact = {
+        "signature": entry["signature"],
+        "slot": entry["slot"],
+        "blockTime": entry.get("blockTime"),
+    }
+    for key in ("err", "memo"):
+        if entry.get(key) is not None:
+            compact[key] = entry[key]
+    return compact
@@ -2,16 +2,10 @@
 Auto-generated adapter class for solana-compatible blockchain.
 """
 
-from common.interfaces import RpcClient
-from common.rpc import HttpxRpcClient
-from servers.solana.common.interfaces import BlockchainAdapter
+from servers.solana.common.base_adapter import SolanaBaseAdapter
 
 
-class SolanaAdapter(BlockchainAdapter):
-    def __init__(self, rpc_url: str, rpc_client: RpcClient = None):
-        self.rpc_url = rpc_url
-        self.rpc_client = rpc_client or HttpxRpcClient()
-
+class SolanaAdapter(SolanaBaseAdapter):
     async def getaccountinfo(self, account, options) -> str:
         return await self.rpc_client.post("getAccountInfo", [account, options], self.rpc_url)
 
@@ -1,8 +1,10 @@
 # src/servers/solana/tool_registry.py
 from mcp.server.fastmcp import FastMCP
 
+from common.rpc import rpc_lifespan
+
 # Global MCP instance
-mcp = FastMCP("SolanaJsonRpcNodeMCP")
+mcp = FastMCP("SolanaJsonRpcNodeMCP", lifespan=rpc_lifespan)
 
 
 def get_mcp_server():
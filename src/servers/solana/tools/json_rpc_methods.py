@@ -7,6 +7,7 @@ import json
 from mcp.types import CallToolResult
 
 import servers.solana.common.client as client
+from common.projection import parse_fields, project
 from common.utils import _err, _ok
 from servers.solana.tool_registry import mcp
 
@@ -118,7 +119,9 @@ async def getbalance(
         "- commitment (str, optional): Desired commitment level (processed, confirmed or finalized). Default is finalized.\n"
         "- transaction_details (str, optional): Level of transaction detail: 'full', 'accounts', 'signatures', or 'none'. Default is 'full'.\n"
         "- max_supported_transaction_version (int, optional): Maximum transaction version to return. Default is 0.\n"
-        "- rewards (bool, optional): Whether to include rewards array. Default is True.\n\n"
+        "- rewards (bool, optional): Whether to include rewards array. Default is True.\n"
+        "- fields (str, optional): Comma-separated paths to return, e.g. 'blockhash,blockTime,signatures' or 'blockTime,transactions.meta.fee'. "
+        "Nested paths use dots and apply to every element of arrays. Transactions, signatures and rewards left out of the projection are not requested from the node. Default returns everything.\n\n"
         "Returns: Block details including transactions, blockhash, parent slot, block height, and optionally rewards.\n\n"
         "Example:\n"
         'curl -X POST https://api.devnet.solana.com -H "Content-Type: application/json" -d \'\n'
@@ -147,6 +150,7 @@ async def getblock(
     transaction_details: str = "signatures",
     max_supported_transaction_version: int = 0,
     rewards: bool = False,
+    fields: str = None,
 ) -> CallToolResult:
     try:
         options = {
@@ -156,7 +160,9 @@ async def getblock(
             "maxSupportedTransactionVersion": max_supported_transaction_version,
             "rewards": rewards,
         }
-        return _ok(await client.getblock(chain.lower(), slot, options))
+        tree = parse_fields(fields)
+        options = client.narrow_block_options(options, tree)
+        return _ok(project(await client.getblock(chain.lower(), slot, options), tree))
     except Exception as e:
         return _err(str(e))
 
@@ -841,7 +847,7 @@ async def getleaderschedule(
         "Call the getMultipleAccounts JSON-RPC method to retrieve account info for a list of public keys.\n\n"
         "Parameters:\n"
         "- chain (str): Must be 'solana'.\n"
-        "- pubkeys (List[str]): List of base-58 encoded public keys.\n"
+        "- pubkeys (List[str]): List of base-58 encoded public keys. Any length; lists over 100 keys are fetched in parallel chunks of 100.\n"
         "- encoding (str, optional): Data encoding. Options:\n"
         "  - 'base58'\n"
         "  - 'base64' (default)\n"
@@ -850,7 +856,7 @@ async def getleaderschedule(
         "- commitment (str, optional): Desired commitment level (processed, confirmed or finalized). Default is finalized.\n"
         "- min_context_slot (int, optional): Minimum context slot.\n"
         "- data_slice (dict, optional): Object with 'offset' and 'length' keys to specify data range.\n\n"
-        "Returns: Account information array for the specified pubkeys.\n\n"
+        "Returns: Account information array for the specified pubkeys, in input order. When the list was chunked, context.slot is the lowest and context.maxSlot the highest slot observed.\n\n"
         "Example:\n"
         'curl -X POST https://api.mainnet-beta.solana.com -H "Content-Type: application/json" -d \'{\n'
         '  "jsonrpc": "2.0", "id": 1, "method": "getMultipleAccounts",\n'
@@ -877,7 +883,9 @@ async def getmultipleaccounts(
             options["minContextSlot"] = min_context_slot
         if data_slice:
             options["dataSlice"] = data_slice
-        return _ok(await client.getmultipleaccounts(chain.lower(), pubkeys, options or None))
+        return _ok(
+            await client.getmultipleaccounts_chunked(chain.lower(), pubkeys, options or None)
+        )
     except Exception as e:
         return _err(str(e))
 
@@ -897,7 +905,8 @@ async def getmultipleaccounts(
         "  Example: [{'memcmp': {'offset': 0, 'bytes': '4y6pru6YvC7'}}]\n"
         "  Use output from get_graduating_bonding_curves() directly.\n"
         "- data_slice (dict, optional): Object with 'offset' and 'length'.\n"
-        "- with_context (bool, optional): Whether to include response context.\n\n"
+        "- with_context (bool, optional): Whether to include response context.\n"
+        "- max_results (int, optional): Stop after this many accounts. The response is parsed as it streams in, so large programs can be sampled without loading every account. Ignored when with_context is true.\n\n"
         "Usage:\n"
         "1. filters_list = get_graduating_bonding_curves()  # Returns filter list\n"
         "2. getprogramaccounts('solana', program_id, filters=filters_list)\n\n"
@@ -913,6 +922,7 @@ async def getprogramaccounts(
     filters: list = None,
     data_slice: dict = None,
     with_context: bool = None,
+    max_results: int = None,
 ) -> CallToolResult:
     try:
         options = {}
@@ -927,6 +937,12 @@ async def getprogramaccounts(
         if with_context is not None:
             options["withContext"] = with_context
 
+        if max_results is not None and not with_context:
+            return _ok(
+                await client.collect(
+                    chain.lower(), "getProgramAccounts", [program_id, options], max_results
+                )
+            )
         return _ok(await client.getprogramaccounts(chain, program_id, options))
     except Exception as e:
         return _err(str(e))
@@ -1031,13 +1047,63 @@ async def getsignaturesforaddress(
         return _err(str(e))
 
 
+@mcp.tool(
+    name="get_signature_history",
+    description=(
+        "Walk the transaction history of an address with getSignaturesForAddress, paging automatically (1,000 signatures per request) "
+        "until a count, slot or block time bound is reached. Use this instead of calling getsignaturesforaddress repeatedly with `before`.\n\n"
+        "Parameters:\n"
+        "- chain (str): Must be 'solana'.\n"
+        "- address (str): Base-58 encoded address.\n"
+        "- max_signatures (int, optional): Stop after this many signatures. Default is 1,000; "
+        "pass the returned `before` cursor to fetch the next batch.\n"
+        "- min_slot (int, optional): Stop at signatures older than this slot.\n"
+        "- min_block_time (int, optional): Stop at signatures older than this Unix timestamp.\n"
+        "- before (str, optional): Start searching backward before this signature.\n"
+        "- until (str, optional): Stop when this signature is reached.\n"
+        "- commitment (str, optional): Desired commitment level (confirmed or finalized). Default is finalized.\n"
+        "- prefetch (int, optional): Number of pages requested ahead while earlier pages are processed.\n\n"
+        "Returns: An object with count, failed (signatures with an error), newestSlot, oldestSlot, "
+        "before (cursor to continue further back) and signatures, a newest-first list of "
+        "{signature, slot, blockTime, err?, memo?} entries."
+    ),
+    annotations={"title": "Signature history", "readOnlyHint": True},
+)
+async def get_signature_history(
+    chain: str,
+    address: str,
+    max_signatures: int = 1000,
+    min_slot: int = None,
+    min_block_time: int = None,
+    before: str = None,
+    until: str = None,
+    commitment: str = "finalized",
+    prefetch: int = None,
+) -> CallToolResult:
+    try:
+        options = {}
+        if before:
+            options["before"] = before
+        if until:
+            options["until"] = until
+        if commitment:
+            options["commitment"] = commitment
+        return _ok(
+            await client.get_signature_history(
+                chain.lower(), address, options, max_signatures, min_slot, min_block_time, prefetch
+            )
+        )
+    except Exception as e:
+        return _err(str(e))
+
+
 @mcp.tool(
     name="getsignaturestatuses",
     description=(
         "Call the getSignatureStatuses JSON-RPC method to retrieve the status of one or more transaction signatures.\n\n"
         "Parameters:\n"
         "- chain (str): Must be 'solana'.\n"
-        "- signatures (List[str]): List of transaction signature strings.\n"
+        "- signatures (List[str]): List of transaction signature strings. Any length; lists over 256 signatures are checked in parallel chunks.\n"
         "- search_transaction_history (bool, optional): If true, search the entire ledger.\n\n"
         "Returns: Status information for the provided signatures.\n\n"
         "Example:\n"
@@ -1057,7 +1123,50 @@ async def getsignaturestatuses(
         options = {}
         if search_transaction_history is not None:
             options["searchTransactionHistory"] = search_transaction_history
-        return _ok(await client.getsignaturestatuses(chain.lower(), signatures, options or None))
+        return _ok(
+            await client.getsignaturestatuses_chunked(chain.lower(), signatures, options or None)
+        )
+    except Exception as e:
+        return _err(str(e))
+
+
+@mcp.tool(
+    name="wait_for_signatures",
+    description=(
+        "Wait until transaction signatures reach a commitment level by polling getSignatureStatuses server-side. "
+        "Only signatures that have not yet reached the target are re-checked, with a growing interval between polls.\n\n"
+        "Parameters:\n"
+        "- chain (str): Must be 'solana'.\n"
+        "- signatures (List[str]): Transaction signatures to wait for. Any number.\n"
+        "- commitment (str, optional): Target commitment: processed, confirmed or finalized. Default is finalized.\n"
+        "- timeout (float, optional): Maximum seconds to wait. Default is 60.\n"
+        "- interval (float, optional): Initial seconds between polls. Default is 0.5.\n"
+        "- search_transaction_history (bool, optional): If true, search the entire ledger.\n\n"
+        "Returns: An object with reached (count at the target commitment), pending (signatures that timed out), "
+        "polls and statuses, a list in input order of {signature, status} where status is the last "
+        "getSignatureStatuses entry (null if not found). Check status.err for failed transactions."
+    ),
+    annotations={"title": "Wait for signatures", "readOnlyHint": True},
+)
+async def wait_for_signatures(
+    chain: str,
+    signatures: list[str],
+    commitment: str = "finalized",
+    timeout: float = 60.0,
+    interval: float = 0.5,
+    search_transaction_history: bool = False,
+) -> CallToolResult:
+    try:
+        return _ok(
+            await client.wait_for_signatures(
+                chain.lower(),
+                signatures,
+                commitment,
+                timeout,
+                interval,
+                search_transaction_history=search_transaction_history,
+            )
+        )
     except Exception as e:
         return _err(str(e))
 
@@ -1430,7 +1539,8 @@ async def gettokensupply(
         "- signature (str): Base-58 encoded transaction signature.\n"
         "- encoding (str, optional): Encoding format: 'json', 'jsonParsed', 'base58', 'base64'. Default is base64.\n"
         "- commitment (str, optional): Desired commitment level (processed, confirmed or finalized). Default is finalized.\n"
-        "- max_supported_transaction_version (int, optional): Max tx version to return. Currently, the only valid value for this parameter is 0. Setting it to 0 allows you to fetch all transactions, including both Versioned and legacy transactions.\n\n"
+        "- max_supported_transaction_version (int, optional): Max tx version to return. Currently, the only valid value for this parameter is 0. Setting it to 0 allows you to fetch all transactions, including both Versioned and legacy transactions.\n"
+        "- fields (str, optional): Comma-separated paths to return, e.g. 'slot,blockTime,meta.fee,meta.err'. Nested paths use dots and apply to every element of arrays. Default returns everything.\n\n"
         "Returns: Transaction object, optionally parsed.\n\n"
         "Example:\n"
         'curl -X POST https://api.mainnet-beta.solana.com -H "Content-Type: application/json" -d \'{\n'
@@ -1446,6 +1556,45 @@ async def gettransaction(
     encoding: str = "base64",
     commitment: str = "confirmed",
     max_supported_transaction_version: int = 0,
+    fields: str = None,
+) -> CallToolResult:
+    try:
+        options = {}
+        if encoding:
+            options["encoding"] = encoding
+        if commitment:
+            options["commitment"] = commitment
+        if max_supported_transaction_version is not None:
+            options["maxSupportedTransactionVersion"] = max_supported_transaction_version
+        tx = await client.gettransaction(chain.lower(), signature, options or None)
+        return _ok(project(tx, parse_fields(fields)))
+    except Exception as e:
+        return _err(str(e))
+
+
+@mcp.tool(
+    name="gettransactions",
+    description=(
+        "Fetch many transactions by signature in one tool call. Signatures are requested in parallel and finalized results are cached.\n\n"
+        "Parameters:\n"
+        "- chain (str): Must be 'solana'.\n"
+        "- signatures (List[str]): Base-58 encoded transaction signatures.\n"
+        "- encoding (str, optional): Encoding format: 'json', 'jsonParsed', 'base58', 'base64'. Default is base64.\n"
+        "- commitment (str, optional): Desired commitment level (confirmed or finalized). Default is confirmed.\n"
+        "- max_supported_transaction_version (int, optional): Max tx version to return. Default 0 returns both Versioned and legacy transactions.\n"
+        "- fields (str, optional): Comma-separated paths to keep in each transaction, e.g. 'slot,blockTime,meta.fee,meta.err'. Default returns everything.\n\n"
+        "Returns: A list in input order of {signature, transaction} objects, or {signature, error} for signatures that could not be fetched. "
+        "transaction is null for unknown signatures."
+    ),
+    annotations={"title": "getTransaction (bulk)", "readOnlyHint": True},
+)
+async def gettransactions(
+    chain: str,
+    signatures: list[str],
+    encoding: str = "base64",
+    commitment: str = "confirmed",
+    max_supported_transaction_version: int = 0,
+    fields: str = None,
 ) -> CallToolResult:
     try:
         options = {}
@@ -1455,7 +1604,16 @@ async def gettransaction(
             options["commitment"] = commitment
         if max_supported_transaction_version is not None:
             options["maxSupportedTransactionVersion"] = max_supported_transaction_version
-        return _ok(await client.gettransaction(chain.lower(), signature, options or None))
+        results = await client.gettransactions(chain.lower(), signatures, options or None)
+        tree = parse_fields(fields)
+        if tree:
+            results = [
+                {**item, "transaction": project(item["transaction"], tree)}
+                if "transaction" in item
+                else item
+                for item in results
+            ]
+        return _ok(results)
     except Exception as e:
         return _err(str(e))
 
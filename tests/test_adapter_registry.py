@@ -0,0 +1,31 @@
+import pytest
+
+from common.rpc import endpoint_for
+from servers.evm.common import adapter_registry, client
+
+
+def test_blank_url_list_is_rejected():
+    with pytest.raises(ValueError, match="No RPC endpoint configured"):
+        endpoint_for([])
+
+
+def test_unconfigured_chain_is_skipped(monkeypatch):
+    monkeypatch.setattr(adapter_registry, "registry", {})
+    monkeypatch.setattr(adapter_registry, "unavailable", {})
+    monkeypatch.setattr(client, "registry", adapter_registry.registry)
+    monkeypatch.setattr(client, "unavailable", adapter_registry.unavailable)
+
+    @adapter_registry.register_adapter("configured")
+    class Configured:
+        pass
+
+    @adapter_registry.register_adapter("blank")
+    class Blank:
+        def __init__(self):
+            endpoint_for([])
+
+    assert isinstance(client._adapter("configured"), Configured)
+    with pytest.raises(ValueError, match="blank is not configured: No RPC endpoint"):
+        client._adapter("blank")
+    with pytest.raises(ValueError, match="Unsupported blockchain: other"):
+        client._adapter("other")
@@ -0,0 +1,134 @@
+import pytest
+
+from common import cache as cache_module
+from common.cache import HEAD, IMMUTABLE, VOLATILE, LruCache, request_key
+from servers.evm.common.cache import EvmCachingRpcClient, block_ref
+
+TX = "0x" + "ab" * 32
+BLOCK_HASH = "0x" + "cd" * 32
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LruCache(2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == (True, 1)
+    cache.set("c", 3)
+    assert cache.get("b") == (False, None)
+    assert len(cache) == 2
+    cache.delete("a")
+    assert cache.get("a") == (False, None)
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_lru_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = LruCache(4)
+    cache.set("head", 1, ttl=1.0)
+    cache.set("final", 2)
+    now[0] += 0.5
+    assert cache.get("head") == (True, 1)
+    now[0] += 0.6
+    assert cache.get("head") == (False, None)
+    assert cache.get("final") == (True, 2)
+    assert len(cache) == 1
+
+
+def test_request_key_ignores_dict_order():
+    a = request_key("eth_call", [{"to": "0x1", "data": "0x"}, "latest"])
+    b = request_key("eth_call", [{"data": "0x", "to": "0x1"}, "latest"])
+    assert a == b
+    assert a != request_key("eth_call", [{"to": "0x1", "data": "0x"}, "0x1"])
+
+
+@pytest.mark.parametrize(
+    "block, ref",
+    [
+        ("latest", ("tag", "latest")),
+        ("0x10", ("number", 16)),
+        (16, ("number", 16)),
+        ("16", ("number", 16)),
+        (BLOCK_HASH, ("hash", BLOCK_HASH)),
+        ({"blockHash": BLOCK_HASH}, ("hash", BLOCK_HASH)),
+        ({"blockNumber": "0x10"}, ("number", 16)),
+    ],
+)
+def test_block_ref(block, ref):
+    assert block_ref(block) == ref
+
+
+@pytest.mark.parametrize(
+    "method, params, kind",
+    [
+        ("eth_chainId", [], IMMUTABLE),
+        ("eth_getTransactionReceipt", [TX], IMMUTABLE),
+        ("eth_getBlockByHash", [BLOCK_HASH, False], IMMUTABLE),
+        ("eth_blockNumber", [], HEAD),
+        ("eth_getBalance", ["0x1", "latest"], HEAD),
+        ("eth_getBalance", ["0x1"], HEAD),
+        ("eth_getBalance", ["0x1", "0x10"], IMMUTABLE),
+        ("eth_call", [{"to": "0x1"}, "finalized"], HEAD),
+        ("eth_getLogs", [{"fromBlock": "0x1", "toBlock": "0x2"}], IMMUTABLE),
+        ("eth_getLogs", [{"fromBlock": "0x1"}], HEAD),
+        ("eth_getLogs", [{"blockHash": BLOCK_HASH}], IMMUTABLE),
+        ("eth_sendRawTransaction", ["0x00"], VOLATILE),
+        ("eth_estimateGas", [{"to": "0x1"}], VOLATILE),
+    ],
+)
+def test_classify(method, params, kind):
+    assert EvmCachingRpcClient(FakeNode(), max_entries=8).classify(method, params) == kind
+
+
+class FakeNode:
+    def __init__(self, head: int = 100, tx_block: int = None):
+        self.head = head
+        self.tx_block = tx_block
+        self.calls = []
+
+    async def post(self, method, params, endpoint):
+        self.calls.append(method)
+        if method == "eth_blockNumber":
+            return hex(self.head)
+        if method == "eth_getTransactionByHash":
+            block = None if self.tx_block is None else hex(self.tx_block)
+            return {"hash": params[0], "blockNumber": block}
+        if method == "eth_getBalance":
+            return "0x1"
+        return None
+
+
+def _client(node: FakeNode) -> EvmCachingRpcClient:
+    return EvmCachingRpcClient(node, max_entries=8, head_ttl=10, confirmations=12)
+
+
+async def test_deep_block_results_are_cached_and_shallow_ones_are_not():
+    node = FakeNode(head=100)
+    client = _client(node)
+    for _ in range(2):
+        await client.post("eth_getBalance", ["0x1", hex(80)], "url")
+    assert node.calls.count("eth_getBalance") == 1
+    for _ in range(2):
+        await client.post("eth_getBalance", ["0x1", hex(95)], "url")
+    assert node.calls.count("eth_getBalance") == 3
+
+
+async def test_transactions_settle_once_their_block_is_deep():
+    pending = _client(FakeNode(head=100, tx_block=None))
+    assert not await pending.is_settled("eth_getTransactionByHash", [TX], {"blockNumber": None}, "")
+    deep = _client(FakeNode(head=100, tx_block=50))
+    assert await deep.is_settled("eth_getTransactionByHash", [TX], {"blockNumber": "0x32"}, "")
+    shallow = _client(FakeNode(head=100, tx_block=95))
+    assert not await shallow.is_settled("debug_traceTransaction", [TX], {}, "")
+
+
+async def test_head_results_are_reused_and_volatile_calls_are_not():
+    node = FakeNode()
+    client = _client(node)
+    await client.post("eth_blockNumber", [], "url")
+    await client.post("eth_blockNumber", [], "url")
+    assert node.calls == ["eth_blockNumber"]
+    await client.post("eth_sendRawTransaction", ["0x00"], "url")
+    await client.post("eth_sendRawTransaction", ["0x00"], "url")
+    assert node.calls.count("eth_sendRawTransaction") == 2
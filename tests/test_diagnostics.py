@@ -0,0 +1,41 @@
+import pytest
+
+from common import diagnostics
+from common.cache import CachingRpcClient
+from common.head import HeadTracker
+from common.rpc import EndpointSelector
+
+
+class IdleTracker(HeadTracker):
+    async def poll(self) -> dict:
+        return {}
+
+
+class FakeAdapter:
+    chain = "test"
+
+    def __init__(self, rpc_client=None, rpc_url="http://node"):
+        self.rpc_client = rpc_client
+        self.rpc_url = rpc_url
+        self.head = IdleTracker("test")
+
+
+def test_cache_stats():
+    with pytest.raises(ValueError, match="Response cache is disabled for test"):
+        diagnostics.cache_stats(FakeAdapter())
+    stats = diagnostics.cache_stats(FakeAdapter(CachingRpcClient(None, 8, 1.0)))
+    assert stats == {"entries": 0, "max_entries": 8, "methods": {}}
+
+
+def test_endpoint_stats():
+    with pytest.raises(ValueError, match="Only one RPC endpoint is configured for test"):
+        diagnostics.endpoint_stats(FakeAdapter())
+    adapter = FakeAdapter(rpc_url=EndpointSelector(["http://a", "http://b"]))
+    assert len(diagnostics.endpoint_stats(adapter)) == 2
+
+
+def test_chain_head_marks_tracker_used():
+    adapter = FakeAdapter()
+    snapshot = diagnostics.chain_head(adapter)
+    assert snapshot["staleness_s"] is None
+    assert adapter.head.last_used is not None
@@ -0,0 +1,148 @@
+from common.cache import CachingRpcClient
+from common.disk_cache import TOUCH_BATCH, DiskCache
+
+
+def drain(disk: DiskCache) -> None:
+    """Wait for queued writes on the worker thread."""
+    disk._executor.submit(lambda: None).result()
+
+
+async def test_round_trip(tmp_path):
+    disk = DiskCache(str(tmp_path / "cache.db"), 1 << 20)
+    assert await disk.get("a") == (False, None)
+    disk.set("a", {"x": [1, 2]})
+    drain(disk)
+    assert await disk.get("a") == (True, {"x": [1, 2]})
+    stats = disk.stats()
+    assert (stats["hits"], stats["misses"], stats["writes"], stats["entries"]) == (1, 1, 1, 1)
+
+
+async def test_warm_start_hit(tmp_path):
+    path = str(tmp_path / "cache.db")
+    first = DiskCache(path, 1 << 20)
+    first.set("a", 1)
+    first.checkpoint()
+    second = DiskCache(path, 1 << 20)
+    assert await second.get("a") == (True, 1)
+    assert second.stats()["warm_hits"] == 1
+    assert second.stats()["entries"] == 1
+
+
+async def test_access_times_are_batched(tmp_path):
+    disk = DiskCache(str(tmp_path / "cache.db"), 1 << 20)
+    disk.set("a", 1)
+    drain(disk)
+    accessed = disk._db.execute("SELECT accessed FROM entries").fetchone()[0]
+    await disk.get("a")
+    assert disk._db.execute("SELECT accessed FROM entries").fetchone()[0] == accessed
+    assert list(disk._touched) == ["a"]
+    disk.checkpoint()
+    assert disk._db.execute("SELECT accessed FROM entries").fetchone()[0] > accessed
+    assert not disk._touched
+
+    for i in range(TOUCH_BATCH):
+        disk._touched[f"k{i}"] = 0.0
+    await disk.get("a")
+    assert not disk._touched
+
+
+async def test_compaction_keeps_recent_entries(tmp_path):
+    disk = DiskCache(str(tmp_path / "cache.db"), 2000)
+    for i in range(30):
+        disk.set(f"k{i}", "x" * 90)
+    drain(disk)
+    stats = disk.stats()
+    assert stats["bytes"] <= 2000
+    assert stats["evictions"] > 0
+    assert await disk.get("k29") == (True, "x" * 90)
+    assert await disk.get("k0") == (False, None)
+
+
+async def test_errors_fail_soft(tmp_path):
+    disk = DiskCache(str(tmp_path / "cache.db"), 1 << 20)
+    disk._db.execute("DROP TABLE entries")
+    assert await disk.get("a") == (False, None)
+    disk.set("a", 1)
+    drain(disk)
+    assert disk.stats()["errors"] == 2
+
+
+class FakeClient:
+    def __init__(self):
+        self.calls = []
+
+    async def post(self, method, params, endpoint=None):
+        self.calls.append(method)
+        return {"method": method}
+
+
+class FakeCachingClient(CachingRpcClient):
+    def classify(self, method, params):
+        return "immutable"
+
+    async def is_settled(self, method, params, result, endpoint):
+        return True
+
+
+async def test_broken_disk_falls_through_to_network(tmp_path):
+    disk = DiskCache(str(tmp_path / "cache.db"), 1 << 20)
+    disk._db.close()
+    inner = FakeClient()
+    client = FakeCachingClient(inner, 10, 1.0, disk=disk, namespace="chain")
+    assert await client.post("m", [], "http://node") == {"method": "m"}
+    assert inner.calls == ["m"]
+    drain(disk)
+    assert disk.stats()["errors"] == 2
+
+
+class ChainClient(FakeClient):
+    def __init__(self, chain_id: str, fail: bool = False):
+        super().__init__()
+        self.chain_id = chain_id
+        self.fail = fail
+
+    async def post(self, method, params, endpoint=None):
+        self.calls.append(method)
+        if method == "eth_chainId":
+            if self.fail:
+                raise ValueError("unreachable")
+            return self.chain_id
+        return {"chain": self.chain_id}
+
+
+class IdentityCachingClient(FakeCachingClient):
+    identity_method = "eth_chainId"
+
+
+async def test_entries_are_keyed_by_chain_identity(tmp_path):
+    disk = DiskCache(str(tmp_path / "cache.db"), 1 << 20)
+    mainnet = IdentityCachingClient(ChainClient("0x1"), 10, 1.0, disk=disk, namespace="ethereum")
+    assert await mainnet.post("m", [], "http://node") == {"chain": "0x1"}
+    assert await mainnet.post("n", [], "http://node") == {"chain": "0x1"}
+    assert mainnet.inner.calls == ["eth_chainId", "m", "n"]
+    drain(disk)
+
+    # Same chain name, endpoint now serving another network
+    inner = ChainClient("0xaa36a7")
+    sepolia = IdentityCachingClient(inner, 10, 1.0, disk=disk, namespace="ethereum")
+    assert await sepolia.post("m", [], "http://node") == {"chain": "0xaa36a7"}
+    assert inner.calls == ["eth_chainId", "m"]
+
+    inner = ChainClient("0x1")
+    restarted = IdentityCachingClient(inner, 10, 1.0, disk=disk, namespace="ethereum")
+    assert await restarted.post("m", [], "http://node") == {"chain": "0x1"}
+    assert inner.calls == ["eth_chainId"]
+
+
+async def test_unknown_identity_skips_disk(tmp_path):
+    disk = DiskCache(str(tmp_path / "cache.db"), 1 << 20)
+    inner = ChainClient("0x1", fail=True)
+    client = IdentityCachingClient(inner, 10, 1.0, disk=disk, namespace="ethereum")
+    assert await client.post("m", [], "http://node") == {"chain": "0x1"}
+    drain(disk)
+    assert disk.stats()["writes"] == 0
+    inner.fail = False
+    client.cache.clear()
+    await client.post("m", [], "http://node")
+    drain(disk)
+    assert disk.stats()["writes"] == 1
@@ -0,0 +1,131 @@
+import pytest
+
+from servers.evm.common.abi import (
+    decode_params,
+    decode_uint,
+    encode_address,
+    encode_bytes,
+    head_size,
+    is_dynamic,
+    to_bytes,
+)
+from servers.evm.common.abi_registry import AbiRegistry, abi_type, parse_human_readable
+from servers.evm.common.keccak import event_topic, function_selector
+
+ALICE = "0x" + "aa" * 20
+BOB = "0x" + "bb" * 20
+
+
+def w(value: int) -> str:
+    return f"{value % (1 << 256):064x}"
+
+
+def address_word(address: str) -> str:
+    return address[2:].rjust(64, "0")
+
+
+def test_static_and_dynamic_types():
+    assert not is_dynamic("uint256") and not is_dynamic("(address,bool)[2]")
+    assert is_dynamic("string") and is_dynamic("uint8[]") and is_dynamic("(address,bytes)")
+    assert is_dynamic("bytes32[2][]")
+    assert head_size("(address,bool)[2]") == 4 * 32
+    assert head_size("string") == 32
+
+
+def test_decode_params_head_and_tail():
+    data = to_bytes(
+        w(7)
+        + w(0xA0)  # string
+        + w(0xE0)  # uint8[]
+        + w(0x140)  # (address,bytes)
+        + w(-5)  # int24
+        + w(5)
+        + b"hello".hex().ljust(64, "0")
+        + w(2)
+        + w(1)
+        + w(2)
+        + address_word(ALICE)
+        + w(0x40)
+        + w(3)
+        + b"abc".hex().ljust(64, "0")
+    )
+    types = ["uint256", "string", "uint8[]", "(address,bytes)", "int24"]
+    assert decode_params(types, data) == [7, "hello", [1, 2], [ALICE, "0x616263"], -5]
+
+
+def test_decode_fixed_arrays_bool_and_bytes32():
+    data = to_bytes(w(1) + w(0) + "ff" * 32)
+    assert decode_params(["bool[2]", "bytes32"], data) == [[True, False], "0x" + "ff" * 32]
+
+
+def test_truncated_data_raises():
+    with pytest.raises(ValueError, match="too short"):
+        decode_params(["uint256", "uint256"], to_bytes(w(1)))
+    with pytest.raises(ValueError, match="too short"):
+        decode_params(["string"], to_bytes(w(0x20) + w(100)))
+
+
+def test_encoders():
+    assert encode_address(ALICE).hex() == address_word(ALICE)
+    with pytest.raises(ValueError, match="Invalid address"):
+        encode_address("0x1234")
+    assert encode_bytes(b"abc").hex() == w(3) + b"abc".hex().ljust(64, "0")
+    assert decode_uint("0x" + w(10**18)) == 10**18
+
+
+def test_human_readable_and_tuple_types():
+    entry = parse_human_readable("function balanceOf(address owner) view returns (uint256)")
+    assert entry["inputs"] == [{"type": "address", "name": "owner", "indexed": False}]
+    assert entry["outputs"] == [{"type": "uint256", "name": "", "indexed": False}]
+    param = {
+        "type": "tuple[]",
+        "components": [{"type": "address", "name": "to"}, {"type": "uint", "name": "amount"}],
+    }
+    assert abi_type(param) == "(address,uint256)[]"
+    with pytest.raises(ValueError):
+        parse_human_readable("constructor(uint256)")
+
+
+def _registry() -> AbiRegistry:
+    registry = AbiRegistry()
+    registry.add_abi(
+        [
+            "event Transfer(address indexed from, address indexed to, uint256 value)",
+            "event Transfer(address indexed from, address indexed to, uint256 indexed tokenId)",
+            "function transfer(address to, uint256 value) returns (bool)",
+            "function balanceOf(address owner) returns (uint256)",
+        ]
+    )
+    return registry
+
+
+def test_decode_logs_tells_erc20_and_erc721_transfers_apart():
+    topic = event_topic("Transfer(address,address,uint256)")
+    erc20 = {
+        "address": "0xtoken",
+        "topics": [topic, "0x" + address_word(ALICE), "0x" + address_word(BOB)],
+        "data": "0x" + w(100),
+        "logIndex": "0x0",
+    }
+    erc721 = {**erc20, "topics": erc20["topics"] + ["0x" + w(42)], "data": "0x"}
+    unknown = {"topics": ["0x" + "00" * 32], "data": "0x"}
+    rows = _registry().decode_logs([erc20, erc721, unknown])
+    assert rows[0]["args"] == {"from": ALICE, "to": BOB, "value": 100}
+    assert rows[1]["args"] == {"from": ALICE, "to": BOB, "tokenId": 42}
+    assert rows[2] is unknown
+
+
+def test_decode_input_and_output():
+    registry = _registry()
+    data = function_selector("transfer(address,uint256)") + address_word(BOB) + w(5)
+    assert registry.decode_input(data) == {
+        "function": "transfer(address,uint256)",
+        "args": {"to": BOB, "value": 5},
+    }
+    call = function_selector("balanceOf(address)") + address_word(ALICE)
+    assert registry.decode_output(call, "0x" + w(9)) == {
+        "function": "balanceOf(address)",
+        "outputs": {"0": 9},
+    }
+    assert registry.decode_input("0xdeadbeef") is None
+    assert registry.decode_input(data[:20]) is None
@@ -0,0 +1,75 @@
+import hashlib
+
+import pytest
+
+from servers.evm.common import keccak
+from servers.evm.common.keccak import (
+    canonical_signature,
+    event_topic,
+    function_selector,
+    keccak256,
+)
+
+
+@pytest.mark.parametrize(
+    "data, digest",
+    [
+        (b"", "c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470"),
+        (b"abc", "4e03657aea45a94fc7d47ba826c8d667c0d1e6e33a64a036ec44f58fa12d6c45"),
+    ],
+)
+def test_known_digests(data, digest):
+    assert keccak256(data).hex() == digest
+
+
+def _sha3_256(data: bytes) -> bytes:
+    """SHA3-256 built on the module's permutation; differs from Keccak only in padding."""
+    padded = bytearray(data)
+    padded.append(0x06)
+    padded.extend(b"\x00" * (-len(padded) % keccak.RATE))
+    padded[-1] |= 0x80
+    lanes = [0] * 25
+    for offset in range(0, len(padded), keccak.RATE):
+        block = padded[offset : offset + keccak.RATE]
+        for i in range(keccak.RATE // 8):
+            lanes[i] ^= int.from_bytes(block[8 * i : 8 * i + 8], "little")
+        keccak._permute(lanes)
+    return b"".join(lane.to_bytes(8, "little") for lane in lanes[:4])
+
+
+@pytest.mark.parametrize("length", [0, 1, 135, 136, 137, 271, 272, 1000])
+def test_permutation_matches_hashlib_across_block_boundaries(length):
+    data = bytes(range(256)) * 4
+    assert _sha3_256(data[:length]) == hashlib.sha3_256(data[:length]).digest()
+
+
+@pytest.mark.parametrize(
+    "signature, selector",
+    [
+        ("transfer(address,uint256)", "0xa9059cbb"),
+        ("function balanceOf(address owner) view returns (uint256)", "0x70a08231"),
+        ("approve(address spender, uint amount)", "0x095ea7b3"),
+        ("aggregate3((address target, bool allowFailure, bytes callData)[] calls)", "0x82ad56cb"),
+    ],
+)
+def test_function_selectors(signature, selector):
+    assert function_selector(signature) == selector
+
+
+def test_event_topics():
+    transfer = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+    assert event_topic("Transfer(address,address,uint256)") == transfer
+    assert event_topic("event Transfer(address indexed from, address indexed to, uint value)") == (
+        transfer
+    )
+    assert event_topic("Approval(address,address,uint256)") == (
+        "0x8c5be1e5ebec7d5bd14f71427d1e84f3dd0314c0f7b2291e5b200ac8c7c3b925"
+    )
+
+
+def test_canonical_signature():
+    assert canonical_signature("f(uint[] a, (int, bytes32)[2] b, tuple(uint8,string) c)") == (
+        "f(uint256[],(int256,bytes32)[2],(uint8,string))"
+    )
+    with pytest.raises(ValueError):
+        canonical_signature("nonsense")
@@ -0,0 +1,140 @@
+import pytest
+
+from servers.evm.common.logs import get_logs, is_range_error
+
+
+class FakeAdapter:
+    """Chain with one log every ``every`` blocks; refuses windows wider than ``max_range``."""
+
+    head = None
+
+    def __init__(self, head: int, max_range: int = None, every: int = 1, error: str = None):
+        self.number = head
+        self.max_range = max_range
+        self.every = every
+        self.error = error
+        self.windows = []
+
+    async def eth_blockNumber(self):
+        return hex(self.number)
+
+    async def eth_getLogs(self, log_filter):
+        start, end = int(log_filter["fromBlock"], 16), int(log_filter["toBlock"], 16)
+        self.windows.append((start, end))
+        if self.error:
+            raise ValueError(self.error)
+        if self.max_range and end - start + 1 > self.max_range:
+            raise ValueError("RPC Error (-32005): query returned more than 10000 results")
+        return [
+            {"blockNumber": hex(n), "logIndex": "0x0"}
+            for n in range(start, end + 1)
+            if n % self.every == 0
+        ]
+
+
+def _numbers(logs):
+    return [int(log["blockNumber"], 16) for log in logs]
+
+
+async def test_refused_windows_are_halved_until_accepted():
+    adapter = FakeAdapter(head=999, max_range=100)
+    logs, next_block = await get_logs(
+        adapter, {"fromBlock": "0x0", "toBlock": "latest"}, window=400, concurrency=1
+    )
+    assert next_block is None
+    assert _numbers(logs) == list(range(1000))
+    assert adapter.windows[:3] == [(0, 399), (0, 199), (0, 99)]
+
+
+async def test_sparse_windows_grow_up_to_max_window():
+    adapter = FakeAdapter(head=9999, every=1000)
+    logs, _ = await get_logs(
+        adapter,
+        {"fromBlock": "0x0", "toBlock": hex(9999)},
+        window=100,
+        max_window=800,
+        concurrency=1,
+    )
+    sizes = [end - start + 1 for start, end in adapter.windows]
+    assert sizes[:4] == [100, 200, 400, 800]
+    assert max(sizes) == 800
+    assert _numbers(logs) == list(range(0, 10000, 1000))
+
+
+async def test_parallel_windows_are_merged_in_order():
+    adapter = FakeAdapter(head=5000, every=7)
+    logs, _ = await get_logs(adapter, {"fromBlock": "0x0"}, window=64, concurrency=4)
+    assert _numbers(logs) == list(range(0, 5001, 7))
+
+
+async def test_rate_limit_errors_are_not_split():
+    adapter = FakeAdapter(head=1000, error="RPC Error (-32005): daily request limit exceeded")
+    with pytest.raises(ValueError, match="daily request"):
+        await get_logs(adapter, {"fromBlock": "0x0"}, window=1000, concurrency=1)
+    assert adapter.windows == [(0, 999)]
+
+
+def test_range_error_classification():
+    assert is_range_error(ValueError("query returned more than 10000 results"))
+    assert is_range_error(ValueError("block range is too wide"))
+    assert not is_range_error(ValueError("rate limit exceeded"))
+    assert not is_range_error(ValueError("Too Many Requests"))
+    assert not is_range_error(ValueError("execution reverted"))
+
+
+async def test_span_cap_returns_a_cursor():
+    adapter = FakeAdapter(head=10_000, every=10)
+    logs, next_block = await get_logs(
+        adapter, {"fromBlock": "0x0"}, window=100, concurrency=2, max_span=1000
+    )
+    assert next_block == 1000
+    assert _numbers(logs) == list(range(0, 1000, 10))
+
+
+async def test_result_cap_returns_a_contiguous_prefix():
+    adapter = FakeAdapter(head=10_000)
+    logs, next_block = await get_logs(
+        adapter,
+        {"fromBlock": "0x0"},
+        window=100,
+        max_window=100,
+        concurrency=4,
+        max_results=250,
+    )
+    assert next_block is not None and 250 <= next_block < 10_000
+    assert _numbers(logs) == list(range(next_block))
+
+
+async def test_latest_is_resolved_from_the_node():
+    class StaleHead:
+        def block_number(self, tag):
+            return 10
+
+    adapter = FakeAdapter(head=50)
+    adapter.head = StaleHead()
+    logs, _ = await get_logs(adapter, {"fromBlock": hex(40), "toBlock": "latest"})
+    assert _numbers(logs) == list(range(40, 51))
+
+
+async def test_refused_dense_first_window_still_makes_progress():
+    class DenseStart(FakeAdapter):
+        """Twelve logs per block below 2000, one per block above; dense windows are refused."""
+
+        async def eth_getLogs(self, log_filter):
+            start, end = int(log_filter["fromBlock"], 16), int(log_filter["toBlock"], 16)
+            self.windows.append((start, end))
+            if start < 2000 and end - start + 1 > 100:
+                raise ValueError("RPC Error (-32005): query returned more than 10000 results")
+            return [
+                {"blockNumber": hex(n), "logIndex": hex(i)}
+                for n in range(start, end + 1)
+                for i in range(12 if n < 2000 else 1)
+            ]
+
+    adapter = DenseStart(head=100_000)
+    logs, next_block = await get_logs(
+        adapter, {"fromBlock": "0x0"}, window=2000, concurrency=4, max_results=10_000
+    )
+    assert next_block is not None and next_block >= 2000
+    assert len(logs) >= 10_000
+    assert sorted(set(_numbers(logs))) == list(range(next_block))
@@ -0,0 +1,266 @@
+import asyncio
+
+import pytest
+
+from common.concurrency import chunked, gather_limited
+from common.config import settings
+from servers.evm.common.multicall import (
+    AGGREGATE3_RUNTIME,
+    balance_of_call,
+    decode_aggregate3,
+    encode_aggregate3,
+    multicall,
+    plan_chunks,
+)
+
+TOKEN = "0x" + "11" * 20
+OWNER = "0x" + "22" * 20
+
+
+def w(value: int) -> str:
+    return f"{value:064x}"
+
+
+def address_word(address: str) -> str:
+    return address[2:].rjust(64, "0")
+
+
+def test_encode_aggregate3_layout():
+    call = balance_of_call(TOKEN, OWNER)
+    assert call["data"] == "0x70a08231" + address_word(OWNER)
+    encoded = encode_aggregate3([call, {"to": OWNER, "data": "0x", "allowFailure": False}])
+    tail0 = (
+        address_word(TOKEN)
+        + w(1)  # allowFailure
+        + w(0x60)  # offset of callData within the tuple
+        + w(36)
+        + call["data"][2:].ljust(128, "0")
+    )
+    tail1 = address_word(OWNER) + w(0) + w(0x60) + w(0)
+    expected = (
+        "0x82ad56cb"
+        + w(0x20)  # offset of the array
+        + w(2)  # length
+        + w(0x40)  # offset of the first tuple, from the start of the offsets
+        + w(0x40 + len(tail0) // 2)
+        + tail0
+        + tail1
+    )
+    assert encoded == expected
+
+
+def test_decode_aggregate3():
+    value = "ab" * 32
+    result = (
+        "0x"
+        + w(0x20)
+        + w(2)
+        + w(0x40)
+        + w(0xC0)
+        + (w(1) + w(0x40) + w(32) + value)
+        + (w(0) + w(0x40) + w(0))
+    )
+    assert decode_aggregate3(result) == [
+        {"success": True, "returnData": "0x" + value},
+        {"success": False, "returnData": "0x"},
+    ]
+    with pytest.raises(ValueError, match="too short"):
+        decode_aggregate3(result[:-64])
+
+
+def test_plan_chunks_respects_call_and_size_limits():
+    calls = [{"to": TOKEN, "data": "0x" + "00" * 36}] * 10  # 196 bytes each
+    assert [len(c) for c in plan_chunks(calls, 4, 10**6)] == [4, 4, 2]
+    assert [len(c) for c in plan_chunks(calls, 100, 400)] == [2] * 5
+    # A call larger than the size cap still gets its own chunk
+    big = [{"to": TOKEN, "data": "0x" + "00" * 1000}]
+    assert plan_chunks(big + calls[:1], 100, 400) == [big, calls[:1]]
+    assert plan_chunks([], 4, 400) == []
+
+
+def test_plan_chunks_respects_the_gas_limit():
+    heavy = {"to": TOKEN, "data": "0x", "gas": 4_000_000}
+    light = {"to": TOKEN, "data": "0x"}
+    chunks = plan_chunks([heavy] * 3 + [light] * 7, 100, 10**6, 10_000_000, 1_000_000)
+    assert [len(c) for c in chunks] == [2, 7, 1]
+    # Without a gas limit only count and size matter
+    assert len(plan_chunks([heavy] * 3, 100, 10**6)) == 1
+
+
+def test_chunked():
+    assert chunked(list(range(7)), 3) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert chunked([], 3) == []
+
+
+async def test_gather_limited_keeps_order_and_bounds_concurrency():
+    running, peak = 0, 0
+
+    async def job(i):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001 * (5 - i % 5))
+        running -= 1
+        return i
+
+    assert await gather_limited((job(i) for i in range(20)), 3) == list(range(20))
+    assert peak == 3
+
+
+class FakeAdapter:
+    """eth_call against a chain without Multicall3: the aggregate call returns 0x."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def eth_call(self, call, block, overrides=None):
+        self.calls.append(call["to"])
+        if overrides:
+            raise ValueError("state overrides are not supported")
+        if call["to"] == TOKEN:
+            return "0x" + w(5)
+        if call["data"].startswith("0x82ad56cb"):
+            return "0x"
+        raise ValueError("execution reverted")
+
+
+async def test_multicall_falls_back_to_single_calls(monkeypatch):
+    monkeypatch.setattr(settings, "MULTICALL3_BYTECODE", "0x")
+    adapter = FakeAdapter()
+    calls = [balance_of_call(TOKEN, OWNER), {"to": OWNER, "data": "0x"}]
+    results = await multicall(adapter, calls, max_calls=1)
+    assert results[0] == {"success": True, "returnData": "0x" + w(5)}
+    assert results[1]["success"] is False and "reverted" in results[1]["error"]
+    with pytest.raises(ValueError):
+        await multicall(adapter, calls, allow_failure=False)
+
+    # The built-in runtime is tried first and rejected by this node
+    monkeypatch.setattr(settings, "MULTICALL3_BYTECODE", "")
+    results = await multicall(adapter, calls)
+    assert results[0] == {"success": True, "returnData": "0x" + w(5)}
+
+
+def run_evm(code: str, calldata: bytes, contracts: dict) -> tuple[bool, bytes]:
+    """Interpret the opcodes AGGREGATE3_RUNTIME uses; CALL dispatches to ``contracts``."""
+    code, stack, memory, returned = bytes.fromhex(code[2:]), [], bytearray(), b""
+    mask = (1 << 256) - 1
+
+    def mem(offset, size):
+        if len(memory) < offset + size:
+            memory.extend(bytes(offset + size - len(memory)))
+        return memory[offset : offset + size]
+
+    def word(data, offset):
+        return int.from_bytes(data[offset : offset + 32].ljust(32, b"\0"), "big")
+
+    binary = {0x01: lambda a, b: a + b, 0x03: lambda a, b: a - b, 0x10: lambda a, b: int(a < b)}
+    binary |= {0x16: lambda a, b: a & b, 0x1B: lambda a, b: b << a}
+    pc = 0
+    while True:
+        op = code[pc]
+        pc += 1
+        if 0x60 <= op <= 0x7F:
+            size = op - 0x5F
+            stack.append(int.from_bytes(code[pc : pc + size], "big"))
+            pc += size
+        elif 0x80 <= op <= 0x8F:
+            stack.append(stack[-(op - 0x7F)])
+        elif op == 0x90:
+            stack[-1], stack[-2] = stack[-2], stack[-1]
+        elif op in binary:
+            a, b = stack.pop(), stack.pop()
+            stack.append(binary[op](a, b) & mask)
+        elif op == 0x15:
+            stack.append(int(stack.pop() == 0))
+        elif op == 0x19:
+            stack.append(~stack.pop() & mask)
+        elif op == 0x35:
+            stack.append(word(calldata, stack.pop()))
+        elif op in (0x37, 0x3E):
+            dest, offset, size = stack.pop(), stack.pop(), stack.pop()
+            source = calldata if op == 0x37 else returned
+            mem(dest, size)
+            memory[dest : dest + size] = source[offset : offset + size].ljust(size, b"\0")
+        elif op == 0x3D:
+            stack.append(len(returned))
+        elif op == 0x50:
+            stack.pop()
+        elif op == 0x52:
+            offset, value = stack.pop(), stack.pop()
+            mem(offset, 32)
+            memory[offset : offset + 32] = value.to_bytes(32, "big")
+        elif op == 0x56:
+            pc = stack.pop()
+        elif op == 0x57:
+            dest, condition = stack.pop(), stack.pop()
+            pc = dest if condition else pc
+        elif op == 0x5A:
+            stack.append(10**6)
+        elif op == 0x5B:
+            pass
+        elif op == 0xF1:
+            _gas, to, _value, offset, size, _out, _out_size = (stack.pop() for _ in range(7))
+            target = contracts.get(f"0x{to:040x}")
+            success, returned = target(bytes(mem(offset, size))) if target else (True, b"")
+            stack.append(int(success))
+        elif op in (0xF3, 0xFD):
+            offset, size = stack.pop(), stack.pop()
+            return op == 0xF3, bytes(mem(offset, size))
+        else:
+            raise AssertionError(f"unexpected opcode {op:#x}")
+
+
+def test_builtin_runtime_implements_aggregate3():
+    value = bytes.fromhex(w(5))
+    contracts = {
+        TOKEN: lambda data: (True, value + b"\x07"),  # 33 bytes, needs padding
+        OWNER: lambda data: (False, b"\x08\xc3\x79\xa0"),
+    }
+    calls = [balance_of_call(TOKEN, OWNER), {"to": OWNER, "data": "0x01"}, {"to": "0x" + "33" * 20}]
+    success, output = run_evm(
+        AGGREGATE3_RUNTIME, bytes.fromhex(encode_aggregate3(calls)[2:]), contracts
+    )
+    assert success and len(output) % 32 == 0
+    assert decode_aggregate3("0x" + output.hex()) == [
+        {"success": True, "returnData": "0x" + w(5) + "07"},
+        {"success": False, "returnData": "0x08c379a0"},
+        {"success": True, "returnData": "0x"},
+    ]
+    # Padding after return data is zeroed
+    assert value + b"\x07" + bytes(31) in output
+
+    strict = encode_aggregate3(calls, allow_failure=False)
+    assert run_evm(AGGREGATE3_RUNTIME, bytes.fromhex(strict[2:]), contracts) == (
+        False,
+        b"\x08\xc3\x79\xa0",
+    )
+    assert run_evm(AGGREGATE3_RUNTIME, bytes.fromhex(encode_aggregate3([])[2:]), {}) == (
+        True,
+        bytes.fromhex(w(0x20) + w(0)),
+    )
+
+
+class NoMulticallAdapter:
+    """Node without Multicall3 that honours code state overrides."""
+
+    def __init__(self):
+        self.overrides = []
+
+    async def eth_call(self, call, block, overrides=None):
+        self.overrides.append(overrides)
+        if not overrides:
+            return "0x"
+        code = overrides[call["to"]]["code"]
+        contracts = {TOKEN: lambda data: (True, bytes.fromhex(w(5)))}
+        success, output = run_evm(code, bytes.fromhex(call["data"][2:]), contracts)
+        assert success
+        return "0x" + output.hex()
+
+
+async def test_builtin_runtime_is_injected_by_default(monkeypatch):
+    monkeypatch.setattr(settings, "MULTICALL3_BYTECODE", "")
+    adapter = NoMulticallAdapter()
+    results = await multicall(adapter, [balance_of_call(TOKEN, OWNER)] * 3)
+    assert results == [{"success": True, "returnData": "0x" + w(5)}] * 3
+    assert adapter.overrides[0] is None
+    assert adapter.overrides[1] == {settings.MULTICALL3_ADDRESS: {"code": AGGREGATE3_RUNTIME}}
@@ -0,0 +1,113 @@
+import asyncio
+
+from common.config import settings
+from servers.evm.common.cache import EvmCachingRpcClient
+from servers.evm.common.head import EvmHeadTracker
+
+
+def _chain(prefix: str, start: int, end: int, parent: str) -> dict:
+    """Blocks start..end named <prefix><n>, the first one built on ``parent``."""
+    blocks = {}
+    for n in range(start, end + 1):
+        blocks[f"{prefix}{n}"] = {"number": hex(n), "hash": f"{prefix}{n}", "parentHash": parent}
+        parent = f"{prefix}{n}"
+    return blocks
+
+
+MAIN = _chain("a", 0, 30, None)
+# Fork replacing blocks 12 and above, built on a11
+FORK = _chain("b", 12, 30, "a11")
+
+
+class FakeAdapter:
+    def __init__(self):
+        self.blocks = {**MAIN, **FORK}
+        self.fetched = []
+
+    async def eth_getBlockByHash(self, block_hash, full_tx):
+        self.fetched.append(block_hash)
+        return self.blocks.get(block_hash)
+
+
+class FakeRpc:
+    def __init__(self, results: dict):
+        self.results = results
+
+    async def post(self, method, params, endpoint):
+        return self.results[method]
+
+
+def _tracker() -> tuple[EvmHeadTracker, list]:
+    tracker = EvmHeadTracker(FakeAdapter(), "test")
+    seen = []
+    tracker.listeners.append(lambda number, block_hash, reorg_from: seen.append(reorg_from))
+    return tracker, seen
+
+
+async def test_gap_between_polls_is_filled_from_parents():
+    tracker, seen = _tracker()
+    await tracker.observe(MAIN["a10"])
+    await tracker.observe(MAIN["a14"])
+    assert {n: tracker.canonical[n] for n in range(9, 15)} == {n: f"a{n}" for n in range(9, 15)}
+    assert tracker.adapter.fetched == ["a13", "a12", "a11"]
+    assert seen == [None, None]
+
+
+async def test_next_block_needs_no_fetch():
+    tracker, _ = _tracker()
+    await tracker.observe(MAIN["a10"])
+    await tracker.observe(MAIN["a11"])
+    assert tracker.adapter.fetched == []
+
+
+async def test_reorg_inside_a_gap_is_detected_at_the_fork():
+    tracker, seen = _tracker()
+    await tracker.observe(MAIN["a10"])
+    await tracker.observe(MAIN["a14"])
+    await tracker.observe(FORK["b16"])
+    assert seen[-1] == 12
+    assert tracker.reorgs == 1
+    assert all(tracker.canonical[n] == f"b{n}" for n in range(12, 17))
+    assert tracker.canonical[11] == "a11"
+
+
+async def test_orphaned_and_unverified_near_head_entries_are_evicted():
+    tracker, _ = _tracker()
+    tracker.update({"number": 14})
+    await tracker.observe(MAIN["a10"])
+    await tracker.observe(MAIN["a14"])
+    block = {"number": hex(13), "hash": "a13", "transactions": []}
+    cache = EvmCachingRpcClient(
+        FakeRpc({"eth_getBlockByNumber": block}), confirmations=64, head=tracker
+    )
+    await cache.post("eth_getBlockByNumber", [hex(13), False], "e")
+    assert cache.stats()["near_head_entries"] == 1
+
+    await tracker.observe(FORK["b16"])
+    assert cache.stats()["near_head_entries"] == 0
+    assert cache.reorg_evictions == 1
+
+
+async def test_near_head_entries_are_dropped_when_the_tracker_stops(monkeypatch):
+    monkeypatch.setattr(settings, "HEAD_TRACKING", True)
+    monkeypatch.setattr(settings, "HEAD_IDLE_TIMEOUT", 0.05)
+    tracker, _ = _tracker()
+    tracker.interval = 0.01
+    tracker.poll = lambda: asyncio.sleep(0, {})
+    tracker.update({"number": 14})
+    await tracker.observe(MAIN["a14"])
+    block = {"number": hex(13), "hash": "a13", "transactions": []}
+    rpc = FakeRpc({"eth_getBlockByNumber": block})
+    cache = EvmCachingRpcClient(rpc, confirmations=64, head=tracker)
+    await cache.post("eth_getBlockByNumber", [hex(13), False], "e")
+    assert tracker.running()
+    assert cache.stats()["near_head_entries"] == 1
+
+    # Hits do not keep the tracker alive; once it stops the entry is gone
+    await asyncio.sleep(0.15)
+    assert not tracker.running()
+    assert cache.stats()["near_head_entries"] == 0
+    assert not tracker.canonical
+    rpc.results = {"eth_getBlockByNumber": {**block, "hash": "b13"}}
+    assert (await cache.post("eth_getBlockByNumber", [hex(13), False], "e"))["hash"] == "b13"
+    await tracker.stop()
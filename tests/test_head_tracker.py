@@ -0,0 +1,42 @@
+import asyncio
+
+from common.config import settings
+from common.head import HeadTracker
+
+
+class CountingTracker(HeadTracker):
+    def __init__(self):
+        super().__init__("test", interval=0.01)
+        self.polls = 0
+
+    async def poll(self) -> dict:
+        self.polls += 1
+        return {"number": self.polls}
+
+
+async def test_tracker_starts_on_first_read_and_stops_when_idle(monkeypatch):
+    monkeypatch.setattr(settings, "HEAD_TRACKING", True)
+    monkeypatch.setattr(settings, "HEAD_IDLE_TIMEOUT", 0.05)
+    tracker = CountingTracker()
+    await asyncio.sleep(0.03)
+    assert tracker.polls == 0 and not tracker.running()
+
+    assert tracker.fresh() is None
+    await asyncio.sleep(0.03)
+    assert tracker.running()
+    assert tracker.fresh()["number"] >= 1
+
+    await asyncio.sleep(0.15)
+    assert not tracker.running()
+    polls = tracker.polls
+    await asyncio.sleep(0.03)
+    assert tracker.polls == polls
+    await tracker.stop()
+
+
+async def test_tracking_disabled(monkeypatch):
+    monkeypatch.setattr(settings, "HEAD_TRACKING", False)
+    tracker = CountingTracker()
+    assert tracker.fresh() is None
+    await asyncio.sleep(0.03)
+    assert tracker.polls == 0 and not tracker.running()
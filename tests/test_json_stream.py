@@ -0,0 +1,71 @@
+import json
+import random
+
+import pytest
+
+from common.json_stream import JsonResultStream
+
+BODY = json.dumps(
+    {
+        "jsonrpc": "2.0",
+        "result": [
+            {"pubkey": "abc", "uiAmount": -25000000000.5, "decimals": 6, "ratio": 1.5e-7},
+            12345678901234567890,
+            -0.0,
+            3e10,
+            "snowman ☃ and \U0001f600",
+            [1, [2, 3.25], {"n": None, "t": True, "f": False}],
+            {},
+            [],
+            1.0,
+        ],
+        "id": 1,
+    },
+    ensure_ascii=False,
+).encode()
+
+SCALAR_BODY = b'{"jsonrpc":"2.0","id":1,"result":-1.5e+3}'
+
+
+def _stream(chunks: list) -> list:
+    stream = JsonResultStream()
+    items = []
+    for chunk in chunks:
+        items.extend(stream.feed(chunk))
+    items.extend(stream.close())
+    return items
+
+
+@pytest.mark.parametrize("body", [BODY, SCALAR_BODY])
+def test_split_at_every_offset(body):
+    expected = json.loads(body)["result"]
+    expected = expected if isinstance(expected, list) else [expected]
+    for offset in range(len(body) + 1):
+        assert _stream([body[:offset], body[offset:]]) == expected, offset
+
+
+def test_byte_by_byte():
+    assert _stream([bytes([b]) for b in BODY]) == json.loads(BODY)["result"]
+
+
+def test_random_chunking():
+    rng = random.Random(7)
+    expected = json.loads(BODY)["result"]
+    for _ in range(200):
+        chunks, rest = [], BODY
+        while rest:
+            size = rng.randint(1, 12)
+            chunks.append(rest[:size])
+            rest = rest[size:]
+        assert _stream(chunks) == expected
+
+
+def test_error_member_raises():
+    body = b'{"jsonrpc":"2.0","id":1,"error":{"code":-32005,"message":"too many"}}'
+    with pytest.raises(ValueError, match="-32005"):
+        _stream([body[:20], body[20:]])
+
+
+def test_truncated_body_raises():
+    with pytest.raises(ValueError):
+        _stream([BODY[:-10]])
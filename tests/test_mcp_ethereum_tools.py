@@ -1,4 +1,4 @@
-import ast
+import json
 
 import servers.evm.chains
 from servers.evm.tools import json_rpc_methods as tools
@@ -43,7 +43,7 @@ async def test_net_listening():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    assert text in ["True", "False"]
+    assert text in ["true", "false"]
 
 
 async def test_net_peer_count():
@@ -65,7 +65,7 @@ async def test_eth_syncing():
     assert len(result.content) == 1
     text = result.content[0].text
     # Can be "false" if not syncing, or JSON object if syncing
-    assert text == "False" or text.startswith("{")
+    assert text == "false" or text.startswith("{")
 
 
 async def test_eth_chain_id():
@@ -131,7 +131,7 @@ async def test_eth_fee_history():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed_result = ast.literal_eval(text)
+    parsed_result = json.loads(text)
     assert isinstance(parsed_result, dict)
     assert "baseFeePerGas" in parsed_result
     assert "gasUsedRatio" in parsed_result
@@ -281,7 +281,7 @@ async def test_eth_get_block_by_number():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed_result = ast.literal_eval(text)
+    parsed_result = json.loads(text)
     assert isinstance(parsed_result, dict)
     assert "number" in parsed_result
     assert "hash" in parsed_result
@@ -294,7 +294,7 @@ async def test_eth_get_block_by_number_full_tx():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed_result = ast.literal_eval(text)
+    parsed_result = json.loads(text)
     assert isinstance(parsed_result, dict)
     assert "transactions" in parsed_result
     assert isinstance(parsed_result["transactions"], list)
@@ -310,7 +310,7 @@ async def test_eth_get_block_by_hash():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed_result = ast.literal_eval(text)
+    parsed_result = json.loads(text)
     assert isinstance(parsed_result, dict) or parsed_result is None
 
 
@@ -350,7 +350,7 @@ async def test_eth_get_transaction_by_hash():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed_result = ast.literal_eval(text)
+    parsed_result = json.loads(text)
     assert isinstance(parsed_result, dict) or parsed_result is None
 
 
@@ -363,7 +363,7 @@ async def test_eth_get_transaction_receipt():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed_result = ast.literal_eval(text)
+    parsed_result = json.loads(text)
     assert isinstance(parsed_result, dict) or parsed_result is None
     if parsed_result:
         assert "blockHash" in parsed_result
@@ -382,7 +382,7 @@ async def test_eth_get_logs():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed_result = ast.literal_eval(text)
+    parsed_result = json.loads(text)
     assert isinstance(parsed_result, list)
 
 
@@ -397,7 +397,7 @@ async def test_eth_get_logs_with_topics():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed_result = ast.literal_eval(text)
+    parsed_result = json.loads(text)
     assert isinstance(parsed_result, list)
 
 
@@ -424,7 +424,7 @@ async def test_debug_trace_transaction():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed_result = ast.literal_eval(text)
+    parsed_result = json.loads(text)
     assert isinstance(parsed_result, dict)
 
 
@@ -438,7 +438,7 @@ async def test_debug_trace_transaction_with_call_tracer():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed_result = ast.literal_eval(text)
+    parsed_result = json.loads(text)
     assert isinstance(parsed_result, dict)
 
 
@@ -453,7 +453,7 @@ async def test_debug_trace_call():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed_result = ast.literal_eval(text)
+    parsed_result = json.loads(text)
     assert isinstance(parsed_result, dict)
 
 
@@ -469,7 +469,7 @@ async def test_debug_trace_call_with_tracer():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed_result = ast.literal_eval(text)
+    parsed_result = json.loads(text)
     assert isinstance(parsed_result, dict)
 
 
@@ -481,7 +481,7 @@ async def test_debug_trace_block_by_number():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed_result = ast.literal_eval(text)
+    parsed_result = json.loads(text)
     assert isinstance(parsed_result, list)
 
 
@@ -495,7 +495,7 @@ async def test_debug_trace_block_by_hash():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed_result = ast.literal_eval(text)
+    parsed_result = json.loads(text)
     assert isinstance(parsed_result, list)
 
 
@@ -511,7 +511,7 @@ async def test_trace_call():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed_result = ast.literal_eval(text)
+    parsed_result = json.loads(text)
     assert isinstance(parsed_result, dict)
 
 
@@ -530,7 +530,7 @@ async def test_trace_call_many():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed_result = ast.literal_eval(text)
+    parsed_result = json.loads(text)
     assert isinstance(parsed_result, list)
 
 
@@ -544,7 +544,7 @@ async def test_trace_raw_transaction():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed_result = ast.literal_eval(text)
+    parsed_result = json.loads(text)
     assert isinstance(parsed_result, list)
 
 
@@ -558,7 +558,7 @@ async def test_trace_replay_transaction():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed_result = ast.literal_eval(text)
+    parsed_result = json.loads(text)
     assert isinstance(parsed_result, dict)
 
 
@@ -570,7 +570,7 @@ async def test_trace_replay_block_transactions():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed_result = ast.literal_eval(text)
+    parsed_result = json.loads(text)
     assert isinstance(parsed_result, list)
 
 
@@ -580,7 +580,7 @@ async def test_trace_block():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed_result = ast.literal_eval(text)
+    parsed_result = json.loads(text)
     assert isinstance(parsed_result, list)
 
 
@@ -589,7 +589,7 @@ async def test_get_supported_blockchains():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    supported_chains = ast.literal_eval(text)
+    supported_chains = json.loads(text)
     assert isinstance(supported_chains, list)
     assert "ethereum" in supported_chains
 
@@ -723,7 +723,7 @@ async def test_eth_get_logs_erc20_transfer():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed_result = ast.literal_eval(text)
+    parsed_result = json.loads(text)
     assert isinstance(parsed_result, list)
 
 
@@ -738,7 +738,7 @@ async def test_eth_get_proof():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed_result = ast.literal_eval(text)
+    parsed_result = json.loads(text)
     assert isinstance(parsed_result, dict)
     assert "accountProof" in parsed_result
     assert "balance" in parsed_result
@@ -769,7 +769,7 @@ async def test_eth_simulate_v1():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed_result = ast.literal_eval(text)
+    parsed_result = json.loads(text)
     assert isinstance(parsed_result, (dict, list))
 
 
@@ -779,7 +779,7 @@ async def test_eth_get_block_receipts():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed_result = ast.literal_eval(text)
+    parsed_result = json.loads(text)
     assert isinstance(parsed_result, list)
     for receipt in parsed_result:
         assert isinstance(receipt, dict)
@@ -1,4 +1,4 @@
-import ast
+import json
 
 import servers.solana.chains
 from servers.solana.tools import json_rpc_methods as tools
@@ -11,7 +11,7 @@ async def test_getaccountinfo_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -22,7 +22,7 @@ async def test_getbalance_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -33,7 +33,7 @@ async def test_getblock_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -44,7 +44,7 @@ async def test_getblockcommitment_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -54,7 +54,7 @@ async def test_getblockheight_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert isinstance(parsed, int)
 
 
@@ -64,7 +64,7 @@ async def test_getblockproduction_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -76,7 +76,7 @@ async def test_getblocks_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -88,7 +88,7 @@ async def test_getblockswithlimit_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -99,7 +99,7 @@ async def test_getblocktime_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert isinstance(parsed, int)
 
 
@@ -109,7 +109,7 @@ async def test_getclusternodes_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -119,7 +119,7 @@ async def test_getepochinfo_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -129,7 +129,7 @@ async def test_getepochschedule_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -140,7 +140,7 @@ async def test_getfeeformessage_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -150,7 +150,7 @@ async def test_getfirstavailableblock_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert isinstance(parsed, int)
 
 
@@ -175,7 +175,7 @@ async def test_gethighestsnapshotslot_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -185,7 +185,7 @@ async def test_getidentity_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -195,7 +195,7 @@ async def test_getinflationgovernor_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -205,7 +205,7 @@ async def test_getinflationrate_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -216,7 +216,7 @@ async def test_getinflationreward_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -226,7 +226,7 @@ async def test_getlargestaccounts_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -236,7 +236,7 @@ async def test_getlatestblockhash_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -246,7 +246,7 @@ async def test_getleaderschedule_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -256,7 +256,7 @@ async def test_getmaxretransmitslot_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert isinstance(parsed, int)
 
 
@@ -266,7 +266,7 @@ async def test_getmaxshredinsertslot_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert isinstance(parsed, int)
 
 
@@ -277,7 +277,7 @@ async def test_getminimumbalanceforrentexemption_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert isinstance(parsed, int)
 
 
@@ -291,7 +291,7 @@ async def test_getmultipleaccounts_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -302,7 +302,7 @@ async def test_getprogramaccounts_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -312,7 +312,7 @@ async def test_getrecentperformancesamples_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -323,7 +323,7 @@ async def test_getrecentprioritizationfees_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -334,7 +334,7 @@ async def test_getsignaturesforaddress_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -347,7 +347,7 @@ async def test_getsignaturestatuses_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -357,7 +357,7 @@ async def test_getslot_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert isinstance(parsed, int)
 
 
@@ -376,7 +376,7 @@ async def test_getslotleaders_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -387,7 +387,7 @@ async def test_getstakeminimumdelegation_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -397,7 +397,7 @@ async def test_getsupply_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -408,7 +408,7 @@ async def test_gettokenaccountbalance_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -420,7 +420,7 @@ async def test_gettokenaccountsbydelegate_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -432,7 +432,7 @@ async def test_gettokenaccountsbyowner_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -443,7 +443,7 @@ async def test_gettokenlargestaccounts_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -454,7 +454,7 @@ async def test_gettokensupply_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -467,7 +467,7 @@ async def test_gettransaction_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -477,7 +477,7 @@ async def test_gettransactioncount_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert isinstance(parsed, int)
 
 
@@ -487,7 +487,7 @@ async def test_getversion_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
 
 
@@ -498,5 +498,5 @@ async def test_simulatetransaction_live():
     assert isinstance(result.content, list)
     assert len(result.content) == 1
     text = result.content[0].text
-    parsed = ast.literal_eval(text)
+    parsed = json.loads(text)
     assert "value" in parsed or "result" in parsed or isinstance(parsed, (dict, list))
@@ -0,0 +1,55 @@
+import copy
+
+import pytest
+
+from common.projection import parse_fields, project
+
+BLOCK = {
+    "hash": "0xb",
+    "number": "0x10",
+    "timestamp": "0x5",
+    "transactions": [
+        {"hash": "0x1", "from": "0xa", "to": "0xc", "input": "0x" + "00" * 100},
+        {"hash": "0x2", "from": "0xd", "to": None, "input": "0x"},
+    ],
+}
+
+
+def test_parse_fields():
+    assert parse_fields("") == {}
+    assert parse_fields(None) == {}
+    assert parse_fields(" hash , transactions.hash,transactions.from ") == {
+        "hash": {},
+        "transactions": {"hash": {}, "from": {}},
+    }
+
+
+def test_whole_ancestor_wins_in_either_order():
+    expected = {"transactions": {}}
+    assert parse_fields("transactions,transactions.hash") == expected
+    assert parse_fields("transactions.hash,transactions") == expected
+
+
+def test_invalid_paths():
+    with pytest.raises(ValueError, match="Invalid field path"):
+        parse_fields("transactions..hash")
+    with pytest.raises(ValueError, match="Invalid field path"):
+        parse_fields(".hash")
+
+
+def test_project_descends_into_arrays_and_copies():
+    original = copy.deepcopy(BLOCK)
+    projected = project(BLOCK, parse_fields("hash,transactions.hash,transactions.to,missing"))
+    assert projected == {
+        "hash": "0xb",
+        "transactions": [{"hash": "0x1", "to": "0xc"}, {"hash": "0x2", "to": None}],
+    }
+    assert BLOCK == original
+
+
+def test_project_edge_cases():
+    assert project(BLOCK, {}) is BLOCK
+    assert project(None, parse_fields("hash")) is None
+    assert project([BLOCK, None], parse_fields("number")) == [{"number": "0x10"}, None]
+    # Selecting into a scalar keeps the scalar
+    assert project(BLOCK, parse_fields("hash.x")) == {"hash": "0xb"}
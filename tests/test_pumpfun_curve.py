@@ -0,0 +1,91 @@
+import base64
+import random
+import struct
+
+from servers.pumpfun.common.curve import (
+    CURVE_LAYOUT,
+    EXPECTED_DISCRIMINATOR,
+    FIELDS,
+    FIELDS_SLICE,
+    REAL_TOKEN_RESERVES_OFFSET,
+    curve_metrics,
+    curve_price,
+    curve_progress,
+    graduation_filters,
+    parse_bonding_curve,
+    parse_bonding_curves,
+    rank_curves,
+)
+
+
+def _account(rng: random.Random) -> bytes:
+    values = [rng.randrange(1 << 64) for _ in range(5)] + [rng.random() < 0.2]
+    # Real accounts carry more data after the curve fields
+    return EXPECTED_DISCRIMINATOR + CURVE_LAYOUT.pack(*values) + bytes(rng.randrange(0, 40))
+
+
+def test_columns_match_the_single_account_parser():
+    rng = random.Random(7)
+    raws = [_account(rng) for _ in range(300)]
+    items = []
+    for i, raw in enumerate(raws):
+        encoded = base64.b64encode(raw).decode()
+        if i % 3 == 0:
+            items.append(encoded)
+        elif i % 3 == 1:
+            items.append({"pubkey": f"key{i}", "account": {"data": [encoded, "base64"]}})
+        else:
+            items.append({"pubkey": f"key{i}", "account": {"data": [raw.hex(), "hex"]}})
+    columns = parse_bonding_curves(items)
+    assert columns.errors == []
+    assert len(columns) == len(raws)
+    for i, raw in enumerate(raws):
+        assert columns.row(i) == parse_bonding_curve(raw)
+        assert columns.keys[i] == (i if i % 3 == 0 else f"key{i}")
+
+
+def test_sliced_data_has_no_discriminator():
+    rng = random.Random(8)
+    raws = [_account(rng) for _ in range(20)]
+    start, end = FIELDS_SLICE["offset"], FIELDS_SLICE["offset"] + FIELDS_SLICE["length"]
+    items = [base64.b64encode(raw[start:end]).decode() for raw in raws]
+    columns = parse_bonding_curves(items, sliced=True)
+    assert [columns.row(i) for i in range(20)] == [parse_bonding_curve(raw) for raw in raws]
+
+
+def test_bad_accounts_become_errors_without_rows():
+    good = _account(random.Random(9))
+    items = [
+        None,
+        base64.b64encode(b"\x00" * 8 + good[8:]).decode(),
+        base64.b64encode(good[:30]).decode(),
+        base64.b64encode(good).decode(),
+    ]
+    columns = parse_bonding_curves(items)
+    assert columns.keys == [3]
+    assert [e["key"] for e in columns.errors] == [0, 1, 2]
+    assert "discriminator" in columns.errors[1]["error"]
+    assert "too short" in columns.errors[2]["error"]
+
+
+def test_metrics_and_ranking_match_the_scalar_helpers():
+    rng = random.Random(10)
+    raws = [_account(rng) for _ in range(50)]
+    columns = parse_bonding_curves([base64.b64encode(raw).decode() for raw in raws])
+    metrics = curve_metrics(columns)
+    for i, raw in enumerate(raws):
+        state = parse_bonding_curve(raw)
+        assert metrics["price_sol"][i] == curve_price(state)
+        assert metrics["progress"][i] == curve_progress(state)
+    top = rank_curves(columns, metrics, "progress", 5)
+    assert [row["progress"] for row in top] == sorted(metrics["progress"], reverse=True)[:5]
+    assert set(top[0]) == {"key", *FIELDS, "price_sol", "progress", "market_cap_sol"}
+
+
+def test_graduation_filters_zero_the_high_reserve_bytes():
+    filters = graduation_filters(100_000_000_000_000)  # fits in 6 bytes
+    memcmp = filters[1]["memcmp"]
+    assert memcmp["offset"] == REAL_TOKEN_RESERVES_OFFSET + 6
+    assert memcmp["bytes"] == "11"  # base58 of two zero bytes
+    assert struct.pack("<Q", 100_000_000_000_000)[6:] == b"\x00\x00"
+    assert len(graduation_filters(1 << 63)) == 2
@@ -0,0 +1,26 @@
+from solders.pubkey import Pubkey
+
+from servers.pumpfun.common.pda import (
+    BONDING_CURVE_SEED,
+    PUMP_PROGRAM,
+    derive_curve_addresses,
+    derive_many,
+)
+
+MINT_A = "So11111111111111111111111111111111111111112"
+MINT_B = "EPjFWdd5AufqSSqeM2qA1xYHaVfz3sn4BEXHnYmW2tF1"
+
+
+def test_curve_address_matches_program_derivation():
+    curve, bump, _ = derive_curve_addresses(MINT_A)
+    expected = Pubkey.find_program_address(
+        [BONDING_CURVE_SEED, bytes(Pubkey.from_string(MINT_A))], PUMP_PROGRAM
+    )
+    assert (curve, bump) == expected
+
+
+def test_derive_many_dedupes_and_keeps_first_appearance_order():
+    rows, errors = derive_many([MINT_B, "not-a-key", MINT_A, MINT_B, "not-a-key"])
+    assert [row["mint"] for row in rows] == [MINT_B, MINT_A]
+    assert [error["mint"] for error in errors] == ["not-a-key"]
+    assert rows[1]["bonding_curve_address"] == str(derive_curve_addresses(MINT_A)[0])
@@ -0,0 +1,131 @@
+import random
+
+import pytest
+
+from servers.pumpfun.common.quote import BPS, quote_buy, quote_ladder, quote_sell
+
+# Fresh curve: 30 virtual SOL against 1.073B virtual tokens
+FRESH = {
+    "virtual_token_reserves": 1_073_000_000_000_000,
+    "virtual_sol_reserves": 30_000_000_000,
+    "real_token_reserves": 793_100_000_000_000,
+    "real_sol_reserves": 0,
+    "token_total_supply": 1_000_000_000_000_000,
+    "complete": False,
+}
+
+
+def _curve(real_sol: int) -> dict:
+    """Curve state after buys totalling ``real_sol`` lamports (net of fees)."""
+    vsol = FRESH["virtual_sol_reserves"] + real_sol
+    vtok = FRESH["virtual_sol_reserves"] * FRESH["virtual_token_reserves"] // vsol
+    sold = FRESH["virtual_token_reserves"] - vtok
+    return {
+        **FRESH,
+        "virtual_sol_reserves": vsol,
+        "virtual_token_reserves": vtok,
+        "real_token_reserves": FRESH["real_token_reserves"] - sold,
+        "real_sol_reserves": real_sol,
+    }
+
+
+def _k(state: dict) -> int:
+    return state["virtual_sol_reserves"] * state["virtual_token_reserves"]
+
+
+@pytest.mark.parametrize("fee_bps", [0, 25, 100, 9999])
+def test_buy_never_lowers_the_product_and_rounds_against_the_buyer(fee_bps):
+    rng = random.Random(fee_bps)
+    for _ in range(500):
+        state = _curve(rng.randrange(0, 80_000_000_000))
+        sol_in = rng.randrange(1, 10**11)
+        quote = quote_buy(state, sol_in, fee_bps)
+        net = quote["sol_in"] - quote["fee"]
+        assert quote["sol_in"] <= sol_in
+        assert quote["fee"] * BPS >= net * fee_bps  # fee rounds up
+        after = (state["virtual_sol_reserves"] + net) * (
+            state["virtual_token_reserves"] - quote["tokens_out"]
+        )
+        assert after >= _k(state)
+        assert quote["tokens_out"] <= state["real_token_reserves"]
+        if not quote["capped"]:
+            # One more token would need more SOL than was paid
+            one_more = (state["virtual_sol_reserves"] + net) * (
+                state["virtual_token_reserves"] - quote["tokens_out"] - 1
+            )
+            assert one_more < _k(state)
+
+
+@pytest.mark.parametrize("fee_bps", [0, 100])
+def test_sell_never_lowers_the_product_and_rounds_against_the_seller(fee_bps):
+    rng = random.Random(fee_bps)
+    for _ in range(500):
+        state = _curve(rng.randrange(1_000_000_000, 80_000_000_000))
+        sold = FRESH["real_token_reserves"] - state["real_token_reserves"]
+        tokens_in = rng.randrange(1, sold)
+        quote = quote_sell(state, tokens_in, fee_bps)
+        gross = quote["sol_out"] + quote["fee"]
+        assert quote["fee"] * BPS >= gross * fee_bps
+        after = (state["virtual_sol_reserves"] - gross) * (
+            state["virtual_token_reserves"] + quote["tokens_in"]
+        )
+        assert after >= _k(state)
+        assert gross <= state["real_sol_reserves"]
+        if quote["capped"]:
+            continue
+        # One more lamport would break the invariant
+        more = (state["virtual_sol_reserves"] - gross - 1) * (
+            state["virtual_token_reserves"] + quote["tokens_in"]
+        )
+        assert more < _k(state)
+
+
+def test_buy_is_capped_at_the_tokens_left():
+    state = _curve(84_000_000_000)
+    quote = quote_buy(state, 10**12)
+    assert quote["capped"]
+    assert quote["tokens_out"] == state["real_token_reserves"]
+    assert quote["sol_in"] < 10**12
+
+
+def test_sell_is_capped_at_the_sol_left():
+    # More tokens in circulation than the SOL on the curve can buy back
+    state = {**_curve(1_000_000_000), "real_sol_reserves": 500_000_000}
+    quote = quote_sell(state, 10**14)
+    assert quote["capped"]
+    assert quote["sol_out"] + quote["fee"] == state["real_sol_reserves"]
+    assert quote["tokens_in"] < 10**14
+    vsol, vtok = state["virtual_sol_reserves"], state["virtual_token_reserves"]
+    t = quote["tokens_in"]
+    # tokens_in is the smallest amount that clears the payout
+    assert t * vsol // (vtok + t) >= state["real_sol_reserves"]
+    assert (t - 1) * vsol // (vtok + t - 1) < state["real_sol_reserves"]
+    assert quote["average_price_sol"] == pytest.approx(
+        state["real_sol_reserves"] / t * 10**6 / 10**9
+    )
+
+
+def test_slippage_bounds_round_down():
+    quote = quote_buy(FRESH, 1_000_000_000, slippage_bps=333)
+    assert quote["min_tokens_out"] == quote["tokens_out"] * (BPS - 333) // BPS
+    quote = quote_sell(_curve(5_000_000_000), 10**12, slippage_bps=333)
+    assert quote["min_sol_out"] == quote["sol_out"] * (BPS - 333) // BPS
+
+
+def test_ladder_quotes_are_independent():
+    amounts = [10**8, 10**9, 10**10]
+    ladder = quote_ladder(FRESH, "buy", amounts)
+    assert ladder == [quote_buy(FRESH, amount) for amount in amounts]
+    assert [q["tokens_out"] for q in ladder] == sorted(q["tokens_out"] for q in ladder)
+    assert ladder[0]["price_impact_pct"] < ladder[-1]["price_impact_pct"]
+
+
+def test_invalid_quotes():
+    with pytest.raises(ValueError, match="complete"):
+        quote_buy({**FRESH, "complete": True}, 1)
+    with pytest.raises(ValueError, match="positive"):
+        quote_sell(FRESH, 0)
+    with pytest.raises(ValueError, match="side"):
+        quote_ladder(FRESH, "swap", [1])
+    with pytest.raises(ValueError, match="fee_bps"):
+        quote_ladder(FRESH, "buy", [1], fee_bps=BPS)
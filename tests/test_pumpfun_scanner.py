@@ -0,0 +1,92 @@
+import base64
+import json
+
+import servers.solana.common.client as client
+from servers.pumpfun.common.curve import CURVE_LAYOUT, INITIAL_REAL_TOKEN_RESERVES
+from servers.pumpfun.tools.pumpfun_onchain import scan_graduating_bonding_curves
+
+MILLION = 1_000_000_000_000  # one million tokens in raw units
+
+
+def _curve(key: str, real_tokens: int, virtual_sol: int) -> dict:
+    fields = CURVE_LAYOUT.pack(
+        real_tokens + 279_900 * MILLION // 1000,  # virtual token reserves
+        virtual_sol,
+        real_tokens,
+        virtual_sol - 30_000_000_000,
+        10**15,
+        False,
+    )
+    return {"pubkey": key, "account": {"data": [base64.b64encode(fields).decode(), "base64"]}}
+
+
+class FakeProgram:
+    def __init__(self, accounts: list[dict]):
+        self.accounts = accounts
+        self.options = None
+
+    async def getprogramaccounts(self, chain, program, options):
+        self.options = options
+        return self.accounts
+
+
+def _result(tool_result) -> dict:
+    assert not tool_result.isError, tool_result.content[0].text
+    return json.loads(tool_result.content[0].text)
+
+
+async def test_thresholds_are_applied_exactly(monkeypatch):
+    # The memcmp filter only bounds the high bytes, so the node over-returns
+    accounts = [
+        _curve("a", 50 * MILLION, 80_000_000_000),
+        _curve("b", 100 * MILLION, 70_000_000_000),
+        _curve("c", 100 * MILLION + 1, 70_000_000_000),
+        _curve("d", 200 * MILLION, 50_000_000_000),
+    ]
+    node = FakeProgram(accounts)
+    monkeypatch.setattr(client, "getprogramaccounts", node.getprogramaccounts)
+    result = _result(await scan_graduating_bonding_curves())
+    assert [curve["bonding_curve"] for curve in result["curves"]] == ["a", "b"]
+    assert (result["matched"], result["scanned"]) == (2, 4)
+    assert node.options["dataSlice"] == {"offset": 8, "length": CURVE_LAYOUT.size}
+
+    result = _result(await scan_graduating_bonding_curves(max_real_token_reserves=300 * MILLION))
+    assert [curve["bonding_curve"] for curve in result["curves"]] == ["a", "b", "c", "d"]
+
+    # One raw token more left than b puts c just below b's progress
+    progress_b = 100 - 100 * MILLION * 100 / INITIAL_REAL_TOKEN_RESERVES
+    result = _result(
+        await scan_graduating_bonding_curves(
+            max_real_token_reserves=300 * MILLION, min_progress=progress_b
+        )
+    )
+    assert [curve["bonding_curve"] for curve in result["curves"]] == ["a", "b"]
+    assert result["curves"][1]["progress"] == progress_b
+    assert set(result["curves"][0]) == {
+        "bonding_curve",
+        "real_token_reserves",
+        "real_sol_reserves",
+        "progress",
+        "price_sol",
+        "market_cap_sol",
+    }
+
+
+async def test_top_n_ranking(monkeypatch):
+    accounts = [
+        _curve(f"k{n}", (90 - n) * MILLION, 30_000_000_000 + (n * 7 % 10) * 10**9)
+        for n in range(10)
+    ]
+    monkeypatch.setattr(client, "getprogramaccounts", FakeProgram(accounts).getprogramaccounts)
+    result = _result(await scan_graduating_bonding_curves(limit=3))
+    assert [curve["bonding_curve"] for curve in result["curves"]] == ["k9", "k8", "k7"]
+    assert result["matched"] == 10
+
+    result = _result(await scan_graduating_bonding_curves(sort_by="price_sol", limit=4))
+    prices = [curve["price_sol"] for curve in result["curves"]]
+    assert prices == sorted(prices, reverse=True) and len(prices) == 4
+    all_prices = _result(await scan_graduating_bonding_curves(sort_by="price_sol", limit=10))
+    assert prices == [curve["price_sol"] for curve in all_prices["curves"]][:4]
+
+    result = await scan_graduating_bonding_curves(sort_by="volume")
+    assert result.isError and "sort_by" in result.content[0].text
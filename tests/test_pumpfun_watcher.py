@@ -0,0 +1,136 @@
+import asyncio
+import base64
+
+import pytest
+from solders.pubkey import Pubkey
+
+import servers.pumpfun.tool_registry  # noqa: F401 - registers the shutdown hook
+from common.rpc import rpc_lifespan
+from servers.pumpfun.common import watcher as watcher_module
+from servers.pumpfun.common.curve import CURVE_LAYOUT
+from servers.pumpfun.common.watcher import CurveWatcher
+from servers.solana.common import client
+
+START = {
+    "virtual_token_reserves": 1_073_000_000_000_000,
+    "virtual_sol_reserves": 30_000_000_000,
+    "real_token_reserves": 793_100_000_000_000,
+    "real_sol_reserves": 0,
+    "token_total_supply": 1_000_000_000_000_000,
+    "complete": False,
+}
+
+
+class FakeAccounts:
+    """Curve accounts by address; ``None`` means the account does not exist."""
+
+    def __init__(self):
+        self.curves: dict[str, dict] = {}
+        self.requested = []
+
+    async def getmultipleaccounts_chunked(self, chain, pubkeys, options):
+        self.requested.append(list(pubkeys))
+        value = []
+        for key in pubkeys:
+            state = self.curves.get(key)
+            if state is None:
+                value.append(None)
+                continue
+            fields = CURVE_LAYOUT.pack(*state.values())
+            value.append({"data": [base64.b64encode(fields).decode(), "base64"]})
+        return {"context": {"slot": 1}, "value": value}
+
+
+@pytest.fixture
+def setup(monkeypatch):
+    node = FakeAccounts()
+    monkeypatch.setattr(client, "getmultipleaccounts_chunked", node.getmultipleaccounts_chunked)
+    watcher = CurveWatcher()
+    mints = [str(Pubkey.new_unique()) for _ in range(3)]
+    watcher.watch(mints)
+    curves = {mint: curve for curve, mint in watcher.mints.items()}
+    for mint in mints[:2]:
+        node.curves[curves[mint]] = dict(START)
+    return node, watcher, mints, curves
+
+
+async def test_first_poll_reports_new_and_missing_curves(setup):
+    node, watcher, mints, curves = setup
+    changes = {change["mint"]: change for change in await watcher.poll()}
+    assert [changes[mint]["event"] for mint in mints] == ["new", "new", "missing"]
+    assert changes[mints[0]]["bonding_curve"] == curves[mints[0]]
+    assert changes[mints[0]]["real_token_reserves"] == START["real_token_reserves"]
+    assert changes[mints[0]]["progress"] == 0.0
+    assert changes[mints[2]] == {
+        "mint": mints[2],
+        "bonding_curve": curves[mints[2]],
+        "event": "missing",
+    }
+
+
+async def test_unchanged_curves_are_skipped(setup):
+    node, watcher, mints, curves = setup
+    await watcher.poll()
+    assert await watcher.poll() == []
+    assert watcher.polls == 2
+    assert len(node.requested) == 2 and set(node.requested[1]) == set(curves.values())
+
+
+async def test_changed_and_completed_curves_carry_deltas(setup):
+    node, watcher, mints, curves = setup
+    await watcher.poll()
+    bought = node.curves[curves[mints[0]]]
+    bought.update(
+        virtual_sol_reserves=31_000_000_000,
+        virtual_token_reserves=1_038_000_000_000_000,
+        real_token_reserves=758_100_000_000_000,
+        real_sol_reserves=1_000_000_000,
+    )
+    node.curves[curves[mints[1]]].update(real_token_reserves=0, complete=True)
+
+    changes = {change["mint"]: change for change in await watcher.poll()}
+    assert set(changes) == {mints[0], mints[1]}
+    assert changes[mints[0]]["event"] == "changed"
+    assert changes[mints[0]]["changes"] == {
+        "virtual_token_reserves": -35_000_000_000_000,
+        "virtual_sol_reserves": 1_000_000_000,
+        "real_token_reserves": -35_000_000_000_000,
+        "real_sol_reserves": 1_000_000_000,
+    }
+    assert changes[mints[0]]["price_sol"] > 0
+    assert changes[mints[1]]["event"] == "completed"
+    assert changes[mints[1]]["progress"] == 100.0
+
+    # A curve that disappears is reported once
+    del node.curves[curves[mints[0]]]
+    assert [change["event"] for change in await watcher.poll()] == ["missing"]
+    assert await watcher.poll() == []
+
+
+async def test_unwatched_curves_are_no_longer_fetched(setup):
+    node, watcher, mints, curves = setup
+    await watcher.poll()
+    watcher.unwatch(mints[:2])
+    assert await watcher.poll() == []
+    assert node.requested[-1] == [curves[mints[2]]]
+    assert watcher.snapshot()["watched"] == 1
+
+
+async def test_lifespan_stops_the_watcher(monkeypatch):
+    # Nothing was ever watched
+    monkeypatch.setattr(watcher_module, "_curve_watcher", None)
+    async with rpc_lifespan(None):
+        pass
+
+    watcher = CurveWatcher()
+    watcher._task = asyncio.ensure_future(asyncio.sleep(60))
+    watcher._spawn(asyncio.sleep(60))
+    tasks = [watcher._task, *watcher._sends]
+    monkeypatch.setattr(watcher_module, "_curve_watcher", watcher)
+    async with rpc_lifespan(None):
+        async with rpc_lifespan(None):
+            pass
+        # Another session is still running
+        assert not watcher._task.done()
+    assert all(task.cancelled() for task in tasks)
+    assert watcher._task is None and not watcher._sends
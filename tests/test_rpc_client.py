@@ -0,0 +1,285 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from common.rpc import BatchingRpcClient, EndpointSelector, HedgePolicy, HttpxRpcClient
+
+
+class MockTransportMixin:
+    """Routes every pool to an httpx.MockTransport calling ``handler(url, body)``."""
+
+    def __init__(self, handler, **kwargs):
+        super().__init__(**kwargs)
+        self.handler = handler
+        self.requests = []
+
+    def _client_for(self, endpoint: str) -> httpx.AsyncClient:
+        self._bind_loop()
+        if endpoint not in self._clients:
+
+            async def handle(request: httpx.Request) -> httpx.Response:
+                body = json.loads(request.content)
+                self.requests.append((str(request.url), body))
+                status, payload = await self.handler(str(request.url), body)
+                return httpx.Response(status, json=payload)
+
+            self._clients[endpoint] = httpx.AsyncClient(transport=httpx.MockTransport(handle))
+        return self._clients[endpoint]
+
+
+class MockBatchingClient(MockTransportMixin, BatchingRpcClient):
+    pass
+
+
+class MockClient(MockTransportMixin, HttpxRpcClient):
+    pass
+
+
+def answer(request: dict) -> dict:
+    if request["method"] == "fail":
+        return {"jsonrpc": "2.0", "id": request["id"], "error": {"code": -32000, "message": "boom"}}
+    return {"jsonrpc": "2.0", "id": request["id"], "result": request["params"][0]}
+
+
+def test_rebinding_drops_calls_queued_on_a_closed_loop():
+    client = BatchingRpcClient(batch_window=60)
+
+    async def enqueue():
+        asyncio.ensure_future(client.post("eth_chainId", [], "http://node"))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+    asyncio.run(enqueue())
+    assert client._pending and client._flush_handles
+
+    async def rebind():
+        client._bind_loop()
+
+    asyncio.run(rebind())
+    assert client._pending == {}
+    assert client._flush_handles == {}
+
+
+async def test_batch_responses_are_routed_by_id():
+    async def handler(url, body):
+        # Providers may answer batch items in any order
+        return 200, [answer(request) for request in reversed(body)]
+
+    client = MockBatchingClient(handler, batch_window=0.01)
+    results = await asyncio.gather(
+        client.post("echo", ["a"], "http://node"),
+        client.post("fail", ["b"], "http://node"),
+        client.post("echo", ["c"], "http://node"),
+        return_exceptions=True,
+    )
+    assert results[0] == "a" and results[2] == "c"
+    assert isinstance(results[1], ValueError) and "boom" in str(results[1])
+    assert len(client.requests) == 1
+    assert [request["params"] for request in client.requests[0][1]] == [["a"], ["b"], ["c"]]
+    await client.aclose()
+
+
+async def test_missing_batch_item_fails_only_its_caller():
+    async def handler(url, body):
+        return 200, [answer(request) for request in body[1:]]
+
+    client = MockBatchingClient(handler, batch_window=0.01)
+    results = await asyncio.gather(
+        client.post("echo", ["a"], "http://node"),
+        client.post("echo", ["b"], "http://node"),
+        return_exceptions=True,
+    )
+    assert isinstance(results[0], ValueError) and "Missing response" in str(results[0])
+    assert results[1] == "b"
+    await client.aclose()
+
+
+async def test_rejected_batch_falls_back_to_single_calls():
+    async def handler(url, body):
+        if isinstance(body, list):
+            return 200, {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "no"}}
+        return 200, answer(body)
+
+    client = MockBatchingClient(handler, batch_window=0.01)
+    results = await asyncio.gather(
+        client.post("echo", ["a"], "http://node"),
+        client.post("echo", ["b"], "http://node"),
+    )
+    assert results == ["a", "b"]
+    assert [isinstance(body, list) for _, body in client.requests] == [True, False, False]
+    await client.aclose()
+
+
+async def test_full_batch_is_sent_without_waiting_for_the_window():
+    async def handler(url, body):
+        return 200, [answer(request) for request in body]
+
+    client = MockBatchingClient(handler, batch_window=60, max_batch_size=2)
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            client.post("echo", [1], "http://node"), client.post("echo", [2], "http://node")
+        ),
+        timeout=1,
+    )
+    assert results == [1, 2]
+    await client.aclose()
+
+
+async def test_identical_calls_share_one_request():
+    release = asyncio.Event()
+
+    async def handler(url, body):
+        await release.wait()
+        return 200, answer(body)
+
+    client = MockClient(handler)
+    calls = [asyncio.ensure_future(client.post("echo", ["a"], "http://node")) for _ in range(3)]
+    other = asyncio.ensure_future(client.post("echo", ["b"], "http://node"))
+    await asyncio.sleep(0.01)
+    release.set()
+    assert await asyncio.gather(*calls, other) == ["a", "a", "a", "b"]
+    assert len(client.requests) == 2
+    assert client._inflight == {}
+    await client.aclose()
+
+
+async def test_coalesced_callers_share_the_error():
+    async def handler(url, body):
+        await asyncio.sleep(0.01)
+        return 200, answer(body)
+
+    client = MockClient(handler)
+    results = await asyncio.gather(
+        *(client.post("fail", ["a"], "http://node") for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(result, ValueError) for result in results)
+    assert len({id(result) for result in results}) == 1
+    assert len(client.requests) == 1
+    await client.aclose()
+
+
+async def test_cancelled_waiter_does_not_cancel_the_others():
+    release = asyncio.Event()
+
+    async def handler(url, body):
+        await release.wait()
+        return 200, answer(body)
+
+    client = MockClient(handler)
+    first = asyncio.ensure_future(client.post("echo", ["a"], "http://node"))
+    second = asyncio.ensure_future(client.post("echo", ["a"], "http://node"))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+    assert await second == "a"
+    assert first.cancelled()
+    assert len(client.requests) == 1
+    await client.aclose()
+
+
+async def test_failover_ejects_the_failing_endpoint_until_it_recovers():
+    async def handler(url, body):
+        if "bad" in url:
+            return 503, {}
+        return 200, answer(body)
+
+    selector = EndpointSelector(["http://bad.node", "http://good.node"], cooldown=0.05)
+    client = MockClient(handler)
+    assert await client.post("echo", ["a"], selector) == "a"
+    assert [url for url, _ in client.requests] == ["http://bad.node", "http://good.node"]
+    bad, good = selector.stats()
+    assert (bad["failures"], bad["healthy"]) == (1, False)
+    assert good["ewma_latency_ms"] is not None
+
+    # While cooling down the endpoint is skipped
+    assert await client.post("echo", ["b"], selector) == "b"
+    assert client.requests[-1][0] == "http://good.node"
+
+    await asyncio.sleep(0.06)
+    assert selector.stats()[0]["healthy"]
+    assert selector.select() == "http://bad.node"  # still unmeasured, so tried first
+    await client.aclose()
+
+
+def test_selector_prefers_the_fastest_healthy_endpoint():
+    selector = EndpointSelector(["http://a", "http://b", "http://c"], alpha=0.5, cooldown=60)
+    selector.record_success("http://a", 0.3)
+    selector.record_success("http://b", 0.1)
+    selector.record_success("http://c", 0.2)
+    assert selector.select() == "http://b"
+    assert selector.select(exclude={"http://b"}) == "http://c"
+    selector.record_failure("http://b")
+    assert selector.select() == "http://c"
+    # With everything ejected the first one back is used
+    selector.record_failure("http://c")
+    selector.record_failure("http://a")
+    assert selector.select() == "http://b"
+
+
+async def test_failover_raises_when_every_endpoint_fails():
+    async def handler(url, body):
+        return 502, {}
+
+    selector = EndpointSelector(["http://a.node", "http://b.node"])
+    client = MockClient(handler)
+    with pytest.raises(httpx.HTTPStatusError, match="502"):
+        await client.post("echo", ["a"], selector)
+    assert len(client.requests) == 2
+    with pytest.raises(ValueError, match="No RPC endpoint left"):
+        await client._failover(selector, {}, tried=set(selector.urls))
+    await client.aclose()
+
+
+def test_hedge_budget_and_delay():
+    policy = HedgePolicy(methods={"eth_call"}, percentile=90, min_delay=0.05, budget=0.5)
+    assert not policy.try_acquire("eth_call")
+    for _ in range(3):
+        policy.record_latency("eth_call", 0.01)
+    assert policy.try_acquire("eth_call")
+    assert not policy.try_acquire("eth_call")  # 1.5 tokens earned, one spent
+
+    assert policy.delay("eth_call") == policy.default_delay  # too few samples
+    for i in range(100):
+        policy.record_latency("eth_call", i / 100)
+    assert policy.delay("eth_call") == pytest.approx(0.9, abs=0.02)
+    policy.min_delay = 5
+    assert policy.delay("eth_call") == 5
+    assert policy.applies("eth_call") and not policy.applies("eth_sendRawTransaction")
+
+
+async def test_slow_request_is_hedged_and_the_loser_cancelled():
+    cancelled = asyncio.Event()
+
+    async def handler(url, body):
+        if "slow" in url:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        return 200, answer(body)
+
+    policy = HedgePolicy(methods={"echo"}, default_delay=0.01, budget=1)
+    policy.record_latency("echo", 0.001)  # earn one hedge
+    selector = EndpointSelector(["http://slow.node", "http://fast.node"])
+    client = MockClient(handler, hedge_policy=policy)
+    assert await asyncio.wait_for(client.post("echo", ["a"], selector), timeout=1) == "a"
+    assert [url for url, _ in client.requests] == ["http://slow.node", "http://fast.node"]
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+    await client.aclose()
+
+
+async def test_no_hedge_without_budget():
+    async def handler(url, body):
+        await asyncio.sleep(0.05)
+        return 200, answer(body)
+
+    policy = HedgePolicy(methods={"echo"}, default_delay=0.01, budget=0)
+    selector = EndpointSelector(["http://a.node", "http://b.node"])
+    client = MockClient(handler, hedge_policy=policy)
+    assert await client.post("echo", ["a"], selector) == "a"
+    assert len(client.requests) == 1
+    await client.aclose()
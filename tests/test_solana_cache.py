@@ -0,0 +1,58 @@
+import pytest
+
+from common.cache import HEAD, IMMUTABLE, VOLATILE
+from servers.solana.common.cache import SolanaCachingRpcClient
+
+SIG = "5" * 88
+
+
+class FakeNode:
+    def __init__(self, finalized: int):
+        self.finalized = finalized
+        self.calls = []
+
+    async def post(self, method, params, endpoint):
+        self.calls.append(method)
+        if method == "getSlot":
+            return self.finalized
+        if method == "getTransaction":
+            return {"slot": 90}
+        return {"blockTime": 1}
+
+
+@pytest.mark.parametrize(
+    "method, params, kind",
+    [
+        ("getGenesisHash", [], IMMUTABLE),
+        ("getTransaction", [SIG, {"commitment": "confirmed"}], IMMUTABLE),
+        ("getBlock", [90], IMMUTABLE),
+        ("getBlock", [90, {"commitment": "processed"}], VOLATILE),
+        ("getSlot", [{"commitment": "finalized"}], HEAD),
+        ("getSlot", [{"commitment": "confirmed"}], VOLATILE),
+        ("getBalance", ["key"], VOLATILE),
+    ],
+)
+def test_classify(method, params, kind):
+    assert SolanaCachingRpcClient(FakeNode(0), max_entries=8).classify(method, params) == kind
+
+
+async def test_confirmed_results_settle_once_finalized():
+    node = FakeNode(finalized=80)
+    client = SolanaCachingRpcClient(node, max_entries=8, head_ttl=0)
+    params = [SIG, {"commitment": "confirmed"}]
+    await client.post("getTransaction", params, "url")
+    await client.post("getTransaction", params, "url")
+    assert node.calls.count("getTransaction") == 2
+
+    node.finalized = 100
+    await client.post("getTransaction", params, "url")
+    await client.post("getTransaction", params, "url")
+    assert node.calls.count("getTransaction") == 3
+
+
+async def test_finalized_commitment_needs_no_slot_check():
+    node = FakeNode(finalized=0)
+    client = SolanaCachingRpcClient(node, max_entries=8)
+    await client.post("getBlockTime", [90], "url")
+    await client.post("getBlockTime", [90], "url")
+    assert node.calls == ["getBlockTime"]
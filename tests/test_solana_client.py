@@ -0,0 +1,126 @@
+import asyncio
+
+import pytest
+
+from servers.solana.common import client
+
+
+class FakeSolana:
+    """Accounts named k<n> with lamports n; every chunk is served at a later slot."""
+
+    def __init__(self):
+        self.account_calls = []
+        self.slot = 100
+        self.running = 0
+        self.peak = 0
+        self.status_calls = []
+        # Signature -> statuses returned by successive polls
+        self.progress = {}
+
+    async def getmultipleaccounts(self, pubkeys, options):
+        self.account_calls.append((list(pubkeys), options))
+        self.slot += 1
+        value = [{"lamports": int(key[1:])} if key != "missing" else None for key in pubkeys]
+        return {"context": {"apiVersion": "2.0", "slot": self.slot}, "value": value}
+
+    async def gettransaction(self, signature, options):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.001 * (int(signature[3:]) % 3))
+        self.running -= 1
+        if signature == "sig4":
+            raise ValueError("RPC Error (-32009): Transaction not found")
+        return {"slot": int(signature[3:]), "options": options}
+
+    async def getsignaturestatuses(self, signatures, options):
+        self.status_calls.append(list(signatures))
+        self.slot += 1
+        value = [
+            self.progress[sig].pop(0) if self.progress.get(sig) else None for sig in signatures
+        ]
+        return {"context": {"slot": self.slot}, "value": value}
+
+
+def status(level: str) -> dict:
+    return {"slot": 1, "confirmations": None, "err": None, "confirmationStatus": level}
+
+
+@pytest.fixture
+def node(monkeypatch):
+    node = FakeSolana()
+    monkeypatch.setitem(client.registry, "solana", node)
+    return node
+
+
+async def test_accounts_are_chunked_and_merged_in_input_order(node):
+    keys = [f"k{n}" for n in reversed(range(250))]
+    keys[7] = "missing"
+    options = {"encoding": "base64", "minContextSlot": 50}
+    result = await client.getmultipleaccounts_chunked("solana", keys, options, concurrency=2)
+    assert [len(call[0]) for call in node.account_calls] == [100, 100, 50]
+    assert all(call[1] == options for call in node.account_calls)
+    expected = [None if key == "missing" else {"lamports": int(key[1:])} for key in keys]
+    assert result["value"] == expected
+    assert result["context"] == {"apiVersion": "2.0", "slot": 101, "maxSlot": 103}
+
+
+async def test_short_account_lists_are_a_single_call(node):
+    result = await client.getmultipleaccounts_chunked("solana", ["k1", "k2"], None)
+    assert result["context"] == {"apiVersion": "2.0", "slot": 101}
+    assert len(node.account_calls) == 1
+
+
+async def test_transactions_keep_input_order_and_report_errors_per_signature(node):
+    signatures = [f"sig{n}" for n in range(10)]
+    options = {"maxSupportedTransactionVersion": 0}
+    results = await client.gettransactions("solana", signatures, options, concurrency=3)
+    assert [result["signature"] for result in results] == signatures
+    assert results[4] == {
+        "signature": "sig4",
+        "error": "RPC Error (-32009): Transaction not found",
+    }
+    assert results[5]["transaction"] == {"slot": 5, "options": options}
+    assert node.peak == 3
+
+
+async def test_statuses_are_chunked_in_input_order(node):
+    signatures = [f"sig{n}" for n in range(600)]
+    node.progress = {sig: [status("confirmed")] for sig in signatures[::2]}
+    result = await client.getsignaturestatuses_chunked("solana", signatures, None)
+    assert [len(call) for call in node.status_calls] == [256, 256, 88]
+    assert [item is not None for item in result["value"]] == [n % 2 == 0 for n in range(600)]
+    assert (result["context"]["slot"], result["context"]["maxSlot"]) == (101, 103)
+
+
+async def test_wait_re_polls_only_pending_signatures_with_backoff(node, monkeypatch):
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(client.asyncio, "sleep", fake_sleep)
+    node.progress = {
+        "a": [status("finalized")],
+        "b": [status("processed"), status("confirmed"), status("finalized")],
+        "c": [None, status("finalized")],
+    }
+    result = await client.wait_for_signatures(
+        "solana", ["a", "b", "c"], "finalized", timeout=60, interval=1, max_interval=2
+    )
+    assert node.status_calls == [["a", "b", "c"], ["b", "c"], ["b"]]
+    assert sleeps == [1, 1.5]
+    assert (result["reached"], result["pending"], result["polls"]) == (3, [], 3)
+    assert [item["signature"] for item in result["statuses"]] == ["a", "b", "c"]
+
+
+async def test_wait_stops_at_the_deadline(node):
+    node.progress = {"a": [status("confirmed")] * 10}
+    result = await client.wait_for_signatures("solana", ["a"], timeout=0.01, interval=0.005)
+    assert result["pending"] == ["a"] and result["reached"] == 0
+    assert result["statuses"][0]["status"]["confirmationStatus"] == "confirmed"
+    # Confirmed is enough when asked for
+    node.progress = {"a": [status("confirmed")]}
+    result = await client.wait_for_signatures("solana", ["a"], "confirmed")
+    assert result["reached"] == 1 and result["polls"] == 1
+    with pytest.raises(ValueError, match="Unknown commitment"):
+        await client.wait_for_signatures("solana", ["a"], "rooted")
@@ -0,0 +1,86 @@
+from servers.solana.common import client
+from servers.solana.common.history import PAGE_SIZE, iter_signature_pages
+
+
+class FakeHistory:
+    """Address with ``count`` signatures, newest first: sig<n> at slot n, n = count-1..0."""
+
+    def __init__(self, count: int):
+        self.entries = [
+            {"signature": f"sig{n}", "slot": n, "blockTime": 1000 + n, "err": None, "memo": None}
+            for n in reversed(range(count))
+        ]
+        self.requests = []
+
+    async def getsignaturesforaddress(self, address, options):
+        self.requests.append(dict(options))
+        signatures = [entry["signature"] for entry in self.entries]
+        start = signatures.index(options["before"]) + 1 if "before" in options else 0
+        page = []
+        for entry in self.entries[start:]:
+            if entry["signature"] == options.get("until"):
+                break
+            page.append(entry)
+        return page[: options["limit"]]
+
+
+async def _collect(pages) -> list[list[dict]]:
+    return [page async for page in pages]
+
+
+async def test_pages_follow_the_before_cursor():
+    adapter = FakeHistory(2500)
+    pages = await _collect(iter_signature_pages(adapter, "addr", {"commitment": "finalized"}))
+    assert [len(page) for page in pages] == [PAGE_SIZE, PAGE_SIZE, 500]
+    assert [entry["slot"] for page in pages for entry in page] == list(reversed(range(2500)))
+    assert [request.get("before") for request in adapter.requests] == [None, "sig1500", "sig500"]
+    assert all(request["commitment"] == "finalized" for request in adapter.requests)
+
+
+async def test_max_signatures_truncates_the_last_page():
+    adapter = FakeHistory(5000)
+    pages = await _collect(iter_signature_pages(adapter, "addr", max_signatures=1200))
+    assert [len(page) for page in pages] == [PAGE_SIZE, 200]
+    assert [request["limit"] for request in adapter.requests] == [PAGE_SIZE, 200]
+
+
+async def test_until_and_slot_bounds_stop_the_walk():
+    adapter = FakeHistory(3000)
+    pages = await _collect(iter_signature_pages(adapter, "addr", {"until": "sig1499"}))
+    slots = [entry["slot"] for page in pages for entry in page]
+    assert slots == list(reversed(range(1500, 3000)))
+    assert all(request["until"] == "sig1499" for request in adapter.requests)
+
+    adapter = FakeHistory(3000)
+    pages = await _collect(iter_signature_pages(adapter, "addr", min_slot=2100, min_block_time=0))
+    assert [entry["slot"] for page in pages for entry in page] == list(reversed(range(2100, 3000)))
+    assert len(adapter.requests) == 1
+
+    adapter = FakeHistory(3000)
+    pages = await _collect(iter_signature_pages(adapter, "addr", min_block_time=1000 + 2990))
+    assert [entry["slot"] for page in pages for entry in page] == list(range(2999, 2989, -1))
+
+
+async def test_history_summary_is_compact_and_resumable(monkeypatch):
+    adapter = FakeHistory(1500)
+    adapter.entries[0]["err"] = {"InstructionError": [0, "Custom"]}
+    monkeypatch.setitem(client.registry, "solana", adapter)
+    first = await client.get_signature_history("solana", "addr", {}, max_signatures=1000)
+    assert first["count"] == 1000 and first["failed"] == 1
+    assert (first["newestSlot"], first["oldestSlot"], first["before"]) == (1499, 500, "sig500")
+    assert first["signatures"][1] == {"signature": "sig1498", "slot": 1498, "blockTime": 2498}
+    assert first["signatures"][0]["err"] == {"InstructionError": [0, "Custom"]}
+
+    rest = await client.get_signature_history(
+        "solana", "addr", {"before": first["before"]}, max_signatures=1000
+    )
+    assert rest["count"] == 500 and rest["oldestSlot"] == 0
+    empty = await client.get_signature_history("solana", "addr", {"before": "sig0"})
+    assert empty == {
+        "count": 0,
+        "failed": 0,
+        "newestSlot": None,
+        "oldestSlot": None,
+        "before": None,
+        "signatures": [],
+    }